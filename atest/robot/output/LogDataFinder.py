@@ -1,4 +1,7 @@
+import base64
 import json
+import re
+import zlib
 
 from robot.api import logger
 
@@ -52,3 +55,36 @@ def _get_expected_stat(attrs):
 def get_expand_keywords(path):
     expand = _get_output_line(path, 'window.output["expand_keywords"]')
     return json.loads(expand)
+
+
+def get_data_blocks(path):
+    with open(path, encoding='UTF-8') as file:
+        content = file.read()
+    blocks = re.findall('<script type="text/x-robot-data" id="robot-data-(\\d+)">'
+                        '(.*?)</script>', content)
+    indices = [int(index) for index, _ in blocks]
+    if indices != list(range(1, len(blocks) + 1)):
+        raise AssertionError('Invalid data block indices: %s' % indices)
+    return [json.loads(_decompress(data)) for _, data in blocks]
+
+
+def get_split_log_data(path, index):
+    with open(path, encoding='UTF-8') as file:
+        lines = [line.replace('\\x3c/', '\\u003c/') for line in file]
+    keywords = _parse_split_log_line(lines[0], 'window.keywords%d = ' % index)
+    strings = _parse_split_log_line(lines[1], 'window.strings%d = ' % index)
+    return [keywords, strings]
+
+
+def _parse_split_log_line(line, prefix):
+    if not line.startswith(prefix):
+        raise AssertionError("Line '%s' does not start with '%s'." % (line, prefix))
+    return json.loads(line[len(prefix):].rstrip().rstrip(';'))
+
+
+def decode_strings(strings):
+    return [s[1:] if s.startswith('*') else _decompress(s) for s in strings]
+
+
+def _decompress(data):
+    return zlib.decompress(base64.b64decode(data)).decode('UTF-8')
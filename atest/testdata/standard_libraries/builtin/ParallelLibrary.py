@@ -0,0 +1,48 @@
+import sys
+import threading
+import time
+
+from robot.api import logger
+
+
+class ParallelLibrary(object):
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._arrived = {}
+
+    def wait_for_others(self, group, count, timeout=5):
+        count = int(count)
+        end = time.time() + float(timeout)
+        with self._condition:
+            self._arrived[group] = self._arrived.get(group, 0) + 1
+            self._condition.notify_all()
+            while self._arrived[group] < count:
+                if time.time() > end:
+                    raise AssertionError('Only %d/%d keywords were running.'
+                                         % (self._arrived[group], count))
+                self._condition.wait(0.05)
+        logger.info('All %d keywords were running.' % count)
+
+    def sleep_seconds(self, seconds):
+        time.sleep(float(seconds))
+        logger.info('Slept %s seconds' % seconds)
+
+    def do_nothing(self):
+        pass
+
+    def sleep_and_log(self, seconds, message):
+        time.sleep(float(seconds))
+        logger.info(message)
+        return message
+
+    def log_messages(self, name):
+        logger.info('Info from %s' % name)
+        print('Stdout from %s' % name)
+        print('*WARN* Warning from %s' % name)
+        sys.stderr.write('Stderr from %s\n' % name)
+
+    def sleep_and_fail(self, seconds, message):
+        time.sleep(float(seconds))
+        raise AssertionError(message)
@@ -0,0 +1,46 @@
+import asyncio
+
+
+class AsyncLib(object):
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        self._loop = None
+        self._heartbeat = None
+        self.beats = 0
+
+    async def sleep_and_return(self, seconds, value):
+        await asyncio.sleep(float(seconds))
+        return value
+
+    async def log_messages(self, message):
+        print(message)
+        await asyncio.sleep(0)
+        print('*WARN* ' + message)
+
+    async def fail_asynchronously(self, message):
+        await asyncio.sleep(0)
+        raise AssertionError(message)
+
+    async def start_heartbeat(self):
+        self._loop = asyncio.get_event_loop()
+        self._heartbeat = self._loop.create_task(self._beat())
+        await asyncio.sleep(0)
+
+    async def _beat(self):
+        while True:
+            self.beats += 1
+            await asyncio.sleep(0.01)
+
+    async def heartbeat_should_be_alive(self):
+        if asyncio.get_event_loop() is not self._loop:
+            raise AssertionError('Event loop was not reused.')
+        if self._heartbeat.done():
+            raise AssertionError('Heartbeat task is not running.')
+        beats = self.beats
+        await asyncio.sleep(0.05)
+        if self.beats <= beats:
+            raise AssertionError('Heartbeat task did not advance.')
+
+    def sync_keyword(self):
+        return 'sync'
@@ -344,3 +344,40 @@ class Decorated(object):
 
 
 NoClassDefinition = type('NoClassDefinition', (), {})
+
+
+class LibraryInformationDynamicLibrary(ArgDocDynamicLibrary):
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(self):
+        ArgDocDynamicLibrary.__init__(self)
+        self.calls = []
+
+    def get_library_information(self):
+        self.calls.append('get_library_information')
+        info = dict((name, {'args': kw.argspec, 'doc': kw.doc,
+                            'tags': ['bulk']})
+                    for name, kw in self._keywords.items()
+                    if name != 'Multiline')
+        info['One Arg']['types'] = {'arg': 'int'}
+        info['__intro__'] = {'doc': 'Intro from information.'}
+        return info
+
+    def get_keyword_documentation(self, name):
+        self.calls.append('get_keyword_documentation %s' % name)
+        return ArgDocDynamicLibrary.get_keyword_documentation(self, name)
+
+    def get_keyword_arguments(self, name):
+        self.calls.append('get_keyword_arguments %s' % name)
+        return ArgDocDynamicLibrary.get_keyword_arguments(self, name)
+
+
+class InvalidLibraryInformationDynamicLibrary(ArgDocDynamicLibrary):
+
+    def __init__(self, information=None):
+        ArgDocDynamicLibrary.__init__(self)
+        self.information = information
+
+    def get_library_information(self):
+        return self.information or {'No Arg': {'args': 42},
+                                    'One Arg': {'doc': 'Valid'}}
@@ -62,3 +62,26 @@ class InvalidMethod(_BaseLib):
 
 class InvalidNone(_BaseLib):
     ROBOT_LIBRARY_SCOPE = None
+
+
+class Pooled(_BaseLib):
+    ROBOT_LIBRARY_SCOPE = 'TEST'
+    initializations = 0
+
+    def __init__(self):
+        Pooled.initializations += 1
+        _BaseLib.__init__(self)
+
+    def _robot_reset(self):
+        self.registered = set()
+
+    def initializations_should_be(self, expected):
+        if self.initializations != int(expected):
+            raise AssertionError('Wrong initializations: %d != %s'
+                                 % (self.initializations, expected))
+
+
+class FailingReset(Pooled):
+
+    def _robot_reset(self):
+        raise RuntimeError('Resetting failed!')
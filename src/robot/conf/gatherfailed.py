@@ -13,10 +13,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import mmap
+import os.path
+import re
+
 from robot.errors import DataError
 from robot.model import SuiteVisitor
 from robot.result import ExecutionResult
-from robot.utils import get_error_message, glob_escape
+from robot.utils import (PY3, compressed_file_reader, get_error_message,
+                         glob_escape)
+
+if PY3:
+    unichr = chr
 
 
 class GatherFailedTests(SuiteVisitor):
@@ -51,29 +59,280 @@ class GatherFailedSuites(SuiteVisitor):
 def gather_failed_tests(output):
     if output.upper() == 'NONE':
         return []
-    gatherer = GatherFailedTests()
     tests_or_tasks = 'tests or tasks'
     try:
-        suite = ExecutionResult(output, include_keywords=False).suite
-        suite.visit(gatherer)
-        tests_or_tasks = 'tests' if not suite.rpa else 'tasks'
-        if not gatherer.tests:
+        rpa, tests, _ = _gather_failed(output)
+        tests_or_tasks = 'tests' if not rpa else 'tasks'
+        if not tests:
             raise DataError('All %s passed.' % tests_or_tasks)
     except:
         raise DataError("Collecting failed %s from '%s' failed: %s"
                         % (tests_or_tasks, output, get_error_message()))
-    return gatherer.tests
+    return tests
 
 
 def gather_failed_suites(output):
     if output.upper() == 'NONE':
         return []
-    gatherer = GatherFailedSuites()
     try:
-        ExecutionResult(output, include_keywords=False).suite.visit(gatherer)
-        if not gatherer.suites:
+        _, _, suites = _gather_failed(output)
+        if not suites:
             raise DataError('All suites passed.')
     except:
         raise DataError("Collecting failed suites from '%s' failed: %s"
                         % (output, get_error_message()))
-    return gatherer.suites
+    return suites
+
+
+def _gather_failed(output):
+    try:
+        return OutputScanner(output).scan()
+    except OutputScanner.CannotScan:
+        pass
+    suite = ExecutionResult(output, include_keywords=False).suite
+    tests = GatherFailedTests()
+    suites = GatherFailedSuites()
+    suite.visit(tests)
+    suite.visit(suites)
+    return suite.rpa, tests.tests, suites.suites
+
+
+class OutputScanner(object):
+    """Collects failed tests and suites from an output file without parsing it.
+
+    Only suite and test names and statuses, as well as suite teardown
+    statuses, are read. All other elements, most importantly keywords with
+    their messages, are skipped by searching end tags directly from the
+    memory mapped file. This is considerably faster than building the whole
+    result model and needs very little memory.
+
+    :meth:`scan` raises :class:`CannotScan` if the file is not a UTF-8
+    encoded output file written like Robot Framework writes them or if it
+    is compressed.
+    The file must then be processed using
+    :func:`~robot.result.resultbuilder.ExecutionResult` that also reports
+    possible errors properly.
+    """
+    _tag = re.compile(br'<(/?)([^\s/>]*)([^>]*)>')
+    _attrs = re.compile(br'([^\s=]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+    _entity = re.compile(u'&(#[0-9]+|#x[0-9a-fA-F]+|[a-z]+);')
+    _entities = {'amp': u'&', 'lt': u'<', 'gt': u'>', 'quot': u'"',
+                 'apos': u"'"}
+    _prolog = re.compile(br'(\xef\xbb\xbf)?\s*(<\?xml[^>]*\?>)?\s*')
+    _utf8 = re.compile(br'encoding\s*=\s*["\']utf-?8["\']', re.I)
+
+    class CannotScan(Exception):
+        pass
+
+    def __init__(self, path):
+        self.path = path
+        self._end_tags = {}
+
+    def scan(self):
+        """Returns ``(rpa, failed_tests, failed_suites)``.
+
+        Failed test and suite long names are escaped so that they can be
+        used as ``--test`` and ``--suite`` patterns.
+        """
+        data = self._read(self.path)
+        try:
+            return self._scan(data)
+        finally:
+            self._close(data)
+
+    def _read(self, path):
+        compressed = compressed_file_reader(path)
+        if compressed:
+            # Compressed files cannot be memory mapped and decompressing them
+            # into memory would defeat the purpose of scanning. They are
+            # parsed incrementally by `ExecutionResult` instead.
+            compressed.close()
+            raise self.CannotScan
+        try:
+            with open(path, 'rb') as source:
+                return mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (EnvironmentError, ValueError):
+            raise self.CannotScan
+
+    def _close(self, data):
+        data.close()
+
+    def _scan(self, data):
+        rpa, pos = self._start_robot(data)
+        suites = []    # long names
+        tests = []     # [long name, status, suite index]
+        self._scan_content(data, pos, [('robot', None)], suites, tests)
+        failed_suites = set(index for _, status, index in tests
+                            if status == 'FAIL')
+        return (rpa,
+                [glob_escape(name) for name, status, _ in tests
+                 if status == 'FAIL'],
+                [glob_escape(suites[index]) for index in sorted(failed_suites)])
+
+    def _start_robot(self, data):
+        pos = self._skip_prolog(data)
+        closing, name, attrs, pos = self._next_tag(data, pos)
+        if closing or name != b'robot' or attrs.endswith(b'/'):
+            raise self.CannotScan
+        return self._get_attrs(attrs).get('rpa', 'false') == 'true', pos
+
+    def _scan_content(self, data, pos, stack, suites, tests):
+        while stack:
+            closing, name, attrs, pos = self._next_tag(data, pos)
+            parent, frame = stack[-1]
+            if closing:
+                if name.decode('ASCII', 'replace') != parent:
+                    raise self.CannotScan
+                stack.pop()
+                if parent == 'suite':
+                    self._end_suite(frame, tests)
+                continue
+            empty = attrs.endswith(b'/')
+            if name == b'suite' and parent in ('robot', 'suite'):
+                frame = self._start_suite(attrs, frame, suites, tests)
+                split = self._get_attrs(attrs).get('file') if empty else None
+                if split:
+                    self._scan_split(split, frame, suites, tests)
+                elif empty:
+                    self._end_suite(frame, tests)
+                else:
+                    stack.append(('suite', frame))
+            elif name == b'test' and parent == 'suite':
+                attrs = self._get_attrs(attrs)
+                if empty:
+                    status = 'FAIL'
+                else:
+                    status, pos = self._get_test_status(data, pos)
+                tests.append(['%s.%s' % (frame[0], attrs.get('name', '')),
+                              status, frame[1]])
+            elif name == b'kw' and parent == 'suite' and not empty:
+                attrs = self._get_attrs(attrs)
+                if (attrs.get('type') == 'teardown'
+                        and (attrs.get('name') or attrs.get('library'))):
+                    frame[3] = 'FAIL'
+                    stack.append(('kw', frame))
+                else:
+                    pos = self._skip(data, name, pos)
+            elif name == b'status' and parent == 'kw':
+                frame[3] = self._get_attrs(attrs).get('status', 'FAIL')
+                if not empty:
+                    pos = self._skip(data, name, pos)
+            elif not empty:
+                pos = self._skip(data, name, pos)
+        if data[pos:].strip():
+            raise self.CannotScan
+
+    def _scan_split(self, path, frame, suites, tests):
+        # Split outputs written with --outputsplit contain the content of
+        # the suite in the original output in their own root suite.
+        data = self._read(os.path.join(os.path.dirname(self.path), path))
+        try:
+            _, pos = self._start_robot(data)
+            closing, name, attrs, pos = self._next_tag(data, pos)
+            if closing or name != b'suite' or attrs.endswith(b'/'):
+                raise self.CannotScan
+            self._scan_content(data, pos, [('robot', None), ('suite', frame)],
+                               suites, tests)
+        finally:
+            self._close(data)
+
+    def _skip_prolog(self, data):
+        match = self._prolog.match(data)
+        declaration = match.group(2)
+        if declaration and b'encoding' in declaration \
+                and not self._utf8.search(declaration):
+            raise self.CannotScan
+        return match.end()
+
+    def _next_tag(self, data, pos):
+        match = self._tag.search(data, pos)
+        if not match or match.group(2)[:1] in (b'!', b'?', b''):
+            raise self.CannotScan
+        closing, name, attrs = match.groups()
+        return closing, name, attrs, match.end()
+
+    def _get_test_status(self, data, pos):
+        # Tests cannot contain other tests and their status is always the
+        # last child element. Searching it backwards from the end tag avoids
+        # going through keywords at all.
+        end = data.find(b'</test>', pos)
+        if end == -1:
+            raise self.CannotScan
+        start = data.rfind(b'<status', pos, end)
+        if start == -1:
+            return 'FAIL', end + 7
+        match = self._tag.match(data, start)
+        if not match or match.group(2) != b'status':
+            raise self.CannotScan
+        status_end = match.end()
+        if not match.group(3).endswith(b'/'):
+            status_end = data.find(b'</status>', status_end, end)
+            if status_end == -1:
+                raise self.CannotScan
+            status_end += 9
+        if data[status_end:end].strip():
+            raise self.CannotScan
+        attrs = self._get_attrs(match.group(3))
+        return attrs.get('status', 'FAIL'), end + 7
+
+    def _start_suite(self, attrs, parent, suites, tests):
+        name = self._get_attrs(attrs).get('name', '')
+        if parent:
+            name = '%s.%s' % (parent[0], name)
+        suites.append(name)
+        # [long name, index, index of the first test, teardown status]
+        return [name, len(suites) - 1, len(tests), None]
+
+    def _end_suite(self, frame, tests):
+        # Like SuiteTeardownFailureHandler, but statuses of tests are
+        # changed before they are known to be inside a failed parent suite.
+        status = frame[3]
+        if status in ('FAIL', 'SKIP'):
+            for test in tests[frame[2]:]:
+                test[1] = status
+
+    def _skip(self, data, name, pos):
+        end_tags = self._end_tags.get(name)
+        if not end_tags:
+            end_tags = self._end_tags[name] = re.compile(
+                br'<(?:(/?)' + re.escape(name) + br'(?=[\s/>])([^>]*)>|[!?])'
+            )
+        depth = 1
+        while depth:
+            match = end_tags.search(data, pos)
+            if not match or match.group(0)[1:2] in (b'!', b'?'):
+                raise self.CannotScan
+            if match.group(1):
+                depth -= 1
+            elif not match.group(2).endswith(b'/'):
+                depth += 1
+            pos = match.end()
+        return pos
+
+    def _get_attrs(self, attrs):
+        try:
+            return dict((name.decode('UTF-8'),
+                         self._unescape((double or single).decode('UTF-8')))
+                        for name, double, single in self._attrs.findall(attrs))
+        except UnicodeError:
+            raise self.CannotScan
+
+    def _unescape(self, value):
+        # Literal whitespace in attribute values is normalized to spaces.
+        if '\n' in value or '\r' in value or '\t' in value:
+            value = value.replace('\r\n', ' ')
+            for char in '\n\r\t':
+                value = value.replace(char, ' ')
+        if '&' in value:
+            value = self._entity.sub(self._replace_entity, value)
+        return value
+
+    def _replace_entity(self, match):
+        entity = match.group(1)
+        if entity[0] != '#':
+            if entity not in self._entities:
+                raise self.CannotScan
+            return self._entities[entity]
+        if entity[1] == 'x':
+            return unichr(int(entity[2:], 16))
+        return unichr(int(entity[1:]))
@@ -50,6 +50,8 @@ class _BaseSettings(object):
                  'Report'           : ('report', 'report.html'),
                  'XUnit'            : ('xunit', None),
                  'SplitLog'         : ('splitlog', False),
+                 'LazyLog'          : ('lazylog', False),
+                 'LogCompressionLevel': ('logcompressionlevel', 9),
                  'TimestampOutputs' : ('timestampoutputs', False),
                  'LogTitle'         : ('logtitle', None),
                  'ReportTitle'      : ('reporttitle', None),
@@ -129,6 +131,8 @@ class _BaseSettings(object):
             return self._process_randomize_value(value)
         if name == 'MaxErrorLines':
             return self._process_max_error_lines(value)
+        if name == 'LogCompressionLevel':
+            return self._process_log_compression_level(value)
         if name == 'RemoveKeywords':
             self._validate_remove_keywords(value)
         if name == 'FlattenKeywords':
@@ -173,6 +177,13 @@ class _BaseSettings(object):
                             "value greater that 10 but got '%s'." % value)
         return value
 
+    def _process_log_compression_level(self, value):
+        value = self._convert_to_integer('logcompressionlevel', value)
+        if not 0 <= value <= 9:
+            raise DataError("Option '--logcompressionlevel' expected an integer "
+                            "value between 0 and 9 but got '%s'." % value)
+        return value
+
     def _process_randomize_value(self, original):
         value = original.lower()
         if ':' in value:
@@ -342,6 +353,14 @@ class _BaseSettings(object):
     def split_log(self):
         return self['SplitLog']
 
+    @property
+    def lazy_log(self):
+        return self['LazyLog']
+
+    @property
+    def log_compression_level(self):
+        return self['LogCompressionLevel']
+
     @property
     def status_rc(self):
         return self['StatusRC']
@@ -412,7 +431,9 @@ class RobotSettings(_BaseSettings):
                        'ConsoleTypeQuiet'   : ('quiet', False),
                        'ConsoleWidth'       : ('consolewidth', 78),
                        'ConsoleMarkers'     : ('consolemarkers', 'AUTO'),
-                       'DebugFile'          : ('debugfile', None)}
+                       'DebugFile'          : ('debugfile', None),
+                       'PreciseElapsed'     : ('preciseelapsed', False),
+                       'OutputSplit'        : ('outputsplit', False)}
 
     def get_rebot_settings(self):
         settings = RebotSettings()
@@ -444,6 +465,14 @@ class RobotSettings(_BaseSettings):
     def debug_file(self):
         return self['DebugFile']
 
+    @property
+    def precise_elapsed(self):
+        return self['PreciseElapsed']
+
+    @property
+    def output_split(self):
+        return self['OutputSplit']
+
     @property
     def suite_config(self):
         return {
@@ -589,6 +618,7 @@ class RebotSettings(_BaseSettings):
             'title': html_escape(self['LogTitle'] or ''),
             'reportURL': self._url_from_path(self.log, self.report),
             'splitLogBase': os.path.basename(os.path.splitext(self.log)[0]),
+            'lazyLog': self.lazy_log,
             'defaultLevel': self['VisibleLogLevel']
         }
 
@@ -13,8 +13,20 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import re
+from gc import get_referents
+
 from robot.utils import PY2
 
+try:
+    from json.encoder import c_make_encoder
+except ImportError:
+    c_make_encoder = None
+try:
+    from json.encoder import c_encode_basestring
+except ImportError:
+    c_encode_basestring = None
+
 
 class JsonWriter(object):
 
@@ -48,8 +60,19 @@ class JsonDumper(object):
                          StringDumper(self),
                          NoneDumper(self),
                          DictDumper(self))
+        self._encoder = FastEncoder() if c_make_encoder else None
 
     def dump(self, data, mapping=None):
+        if self._encoder:
+            try:
+                self.write(self._encoder.encode(data, mapping))
+            except FastEncodingNotSupported:
+                pass
+            else:
+                return
+        self._dump(data, mapping)
+
+    def _dump(self, data, mapping):
         for dumper in self._dumpers:
             if dumper.handles(data, mapping):
                 dumper.dump(data, mapping)
@@ -64,7 +87,7 @@ class _Dumper(object):
     _handled_types = None
 
     def __init__(self, jsondumper):
-        self._dump = jsondumper.dump
+        self._dump = jsondumper._dump
         self._write = jsondumper.write
 
     def handles(self, data, mapping):
@@ -82,8 +105,9 @@ class StringDumper(_Dumper):
     def dump(self, data, mapping):
         self._write('"%s"' % (self._escape(data) if data else ''))
 
-    def _escape(self, string):
-        for search, replace in self._search_and_replace:
+    @classmethod
+    def _escape(cls, string):
+        for search, replace in cls._search_and_replace:
             if search in string:
                 string = string.replace(search, replace)
         return string
@@ -144,3 +168,140 @@ class NoneDumper(_Dumper):
 
     def dump(self, data, mapping):
         self._write('null')
+
+
+class FastEncodingNotSupported(Exception):
+    pass
+
+
+class RawString(str if not PY2 else unicode):
+    pass
+
+
+class FastEncoder(object):
+    """Encodes data using the C accelerated encoder of the `json` module.
+
+    The output is identical to the one created by the dumpers above. Items
+    in ``mapping`` are substituted with raw strings in a pre-pass. Data that
+    the dumpers would handle differently than standard JSON, such as
+    dictionaries with non-string keys or any dictionaries on Python 2,
+    causes `FastEncodingNotSupported`.
+    """
+    _scalar_types = ((str, unicode, int, long, type(None)) if PY2
+                     else (str, int, type(None)))
+    _string_types = (str, unicode) if PY2 else str
+    _sequence_types = {tuple, list}
+    _needs_escaping = re.compile('[\\\\"\t\n\r]|</')
+    _control_chars = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+    def __init__(self):
+        self._encode = self._make_encoder(self._encode_string)
+        self._encode_standard = self._make_encoder(c_encode_basestring
+                                                   or self._encode_string)
+        self._known_scalars = set(self._scalar_types) | {bool}
+        self._scalars_mapped = False
+
+    def _make_encoder(self, encode_string):
+        return c_make_encoder(None, self._default, encode_string, None,
+                              ':', ',', True, False, True)
+
+    def encode(self, data, mapping=None):
+        standard = self._is_standard_json(data) if not mapping else None
+        if standard is None:
+            self._scalars_mapped = bool(mapping) and any(
+                isinstance(key, self._scalar_types) for key in mapping
+            )
+            data = self._prepare(data, mapping)
+        encode = self._encode_standard if standard else self._encode
+        return ''.join(encode(data, 0))
+
+    def _is_standard_json(self, data):
+        """Returns ``None`` if data needs to be prepared before encoding.
+
+        Otherwise returns ``True`` if strings in data can be escaped like in
+        standard JSON and ``False`` if they need custom escaping. Data is
+        walked level by level, which is a lot faster than recursion with
+        large nested tuples.
+        """
+        level = [data]
+        standard = True
+        while level:
+            if not self._are_scalars(set(map(type, level)) -
+                                     self._sequence_types):
+                return None
+            if standard:
+                strings = [item for item in level
+                           if isinstance(item, self._string_types)]
+                standard = self._is_standard_string('\n'.join(strings))
+            level = [item for item in level if isinstance(item, (tuple, list))]
+            level = get_referents(*level) if level else []
+        return standard
+
+    def _is_standard_string(self, string):
+        return '</' not in string and not self._control_chars.search(string)
+
+    def _default(self, data):
+        raise FastEncodingNotSupported
+
+    def _encode_string(self, string):
+        if string.__class__ is RawString:
+            return string
+        if self._needs_escaping.search(string):
+            string = StringDumper._escape(string)
+        return '"%s"' % string
+
+    def _prepare(self, data, mapping):
+        if mapping and self._is_mapped(data, mapping):
+            return RawString(mapping[data])
+        if isinstance(data, self._scalar_types):
+            return data
+        if isinstance(data, (tuple, list)):
+            return self._prepare_items(data, mapping)
+        if isinstance(data, dict):
+            return self._prepare_dict(data, mapping)
+        raise FastEncodingNotSupported
+
+    def _is_mapped(self, data, mapping):
+        try:
+            return data in mapping
+        except TypeError:
+            return False
+
+    def _prepare_items(self, items, mapping):
+        # Checking item types at C level is a lot faster than preparing
+        # items one by one, and most tuples in the model contain only scalars.
+        if not self._scalars_mapped and self._only_scalars(items):
+            return items
+        prepared = None
+        for index, item in enumerate(items):
+            result = self._prepare(item, mapping)
+            if result is not item:
+                if prepared is None:
+                    prepared = list(items)
+                prepared[index] = result
+        return items if prepared is None else prepared
+
+    def _only_scalars(self, items):
+        return self._are_scalars(set(map(type, items)))
+
+    def _are_scalars(self, types):
+        if types <= self._known_scalars:
+            return True
+        for cls in types - self._known_scalars:
+            if not issubclass(cls, self._scalar_types):
+                return False
+            self._known_scalars.add(cls)
+        return True
+
+    def _prepare_dict(self, data, mapping):
+        # The C encoder ignores `sort_keys` on Python 2.
+        if PY2:
+            raise FastEncodingNotSupported
+        prepared = {}
+        for key in data:
+            if not isinstance(key, self._string_types):
+                raise FastEncodingNotSupported
+            if mapping and self._is_mapped(key, mapping):
+                raise FastEncodingNotSupported
+            prepared[key] = self._prepare(data[key], mapping)
+        return prepared
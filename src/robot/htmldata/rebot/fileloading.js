@@ -14,13 +14,30 @@ window.fileLoading = (function () {
         document.getElementsByTagName("head")[0].appendChild(script);
     }
 
+    function loadKeywordsDataBlock(index, callback) {
+        // Data blocks are ignored by the browser when the page is loaded.
+        // They are decompressed and parsed only when their content is needed.
+        var block = document.getElementById('robot-data-' + index);
+        var data = JSON.parse(util.decompress(block.textContent));
+        window['keywords' + index] = data[0];
+        window['strings' + index] = data[1];
+        callback();
+    }
+
+    function loadKeywords(parent, callback) {
+        if (window.settings['lazyLog'])
+            loadKeywordsDataBlock(parent.childDataIndex, callback);
+        else
+            loadKeywordsFile(parent.childFileName, callback);
+    }
+
     function getCallbackHandlerForKeywords(parent) {
         var callableList = [];
         return function (callable) {
             if (!parent.isChildrenLoaded) {
                 callableList.push(callable);
                 if (callableList.length == 1) {
-                    loadKeywordsFile(parent.childFileName, function () {
+                    loadKeywords(parent, function () {
                         parent.isChildrenLoaded = true;
                         for (var i = 0; i < callableList.length; i++) {
                             callableList[i]();
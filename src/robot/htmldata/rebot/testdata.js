@@ -80,6 +80,7 @@ window.testdata = function () {
         } else {
             index = modelOrIndex;
             parent.childFileName = window.settings['splitLogBase'] + '-' + index + '.js';
+            parent.childDataIndex = index;
             populator = SplitLogPopulator(index, creator);
         }
         parent.populateKeywords(populator);
@@ -265,17 +266,11 @@ window.testdata = function () {
                 return '';
             if (text[0] == '*')
                 return text.substring(1);
-            var extracted = extract(text);
+            var extracted = util.decompress(text);
             strings[id] = '*' + extracted;
             return extracted;
         }
 
-        function extract(text) {
-            var decoded = JXG.Util.Base64.decodeAsArray(text);
-            var extracted = (new JXG.Util.Unzip(decoded)).unzip()[0][0];
-            return JXG.Util.UTF8.decode(extracted);
-        }
-
         function get(id) {
             if (id === null) return null;
             return getText(id);
@@ -199,6 +199,12 @@ window.util = function () {
         return result;
     }
 
+    function decompress(text) {
+        var decoded = JXG.Util.Base64.decodeAsArray(text);
+        var extracted = (new JXG.Util.Unzip(decoded)).unzip()[0][0];
+        return JXG.Util.UTF8.decode(extracted);
+    }
+
     return {
         map: map,
         filter: filter,
@@ -219,6 +225,7 @@ window.util = function () {
         timestamp: timestamp,
         createGeneratedString: createGeneratedString,
         createGeneratedAgoString: createGeneratedAgoString,
-        parseQueryString: parseQueryString
+        parseQueryString: parseQueryString,
+        decompress: decompress
     };
 }();
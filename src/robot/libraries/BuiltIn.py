@@ -27,11 +27,14 @@ from robot.errors import (ContinueForLoop, DataError, ExecutionFailed,
                           PassExecution, ReturnFromKeyword, VariableError)
 from robot.running import Keyword, RUN_KW_REGISTER
 from robot.running.context import EXECUTION_CONTEXTS
+from robot.running.parallel import ParallelKeywordRunner
 from robot.running.usererrorhandler import UserErrorHandler
-from robot.utils import (DotDict, escape, format_assign_message,
-                         get_error_message, get_time, html_escape, is_falsy,
-                         is_integer, is_list_like, is_string, is_truthy,
-                         is_unicode, IRONPYTHON, JYTHON, Matcher, normalize,
+from robot.utils import (compile_pattern, cut_unic, DotDict, escape,
+                         format_assign_message, get_error_message,
+                         get_matcher, get_time, html_escape, is_bytes,
+                         is_falsy, is_integer, is_list_like, is_string,
+                         is_truthy, is_unicode, IRONPYTHON, JYTHON,
+                         MAX_FORMATTED_LENGTH, max_error_length, normalize,
                          normalize_whitespace, parse_time, prepr,
                          plural_or_not as s, PY3, RERAISED_EXCEPTIONS,
                          roundup, secs_to_timestr, seq2str, split_from_equals,
@@ -79,7 +82,7 @@ class _BuiltInBase(object):
 
     def _matches(self, string, pattern, caseless=False):
         # Must use this instead of fnmatch when string may contain newlines.
-        matcher = Matcher(pattern, caseless=caseless, spaceless=False)
+        matcher = get_matcher(pattern, caseless=caseless, spaceless=False)
         return matcher.match(string)
 
     def _is_true(self, condition):
@@ -635,7 +638,7 @@ class _Verify(_BuiltInBase):
 
     def _should_be_equal(self, first, second, msg, values, formatter='str'):
         include_values = self._include_values(values)
-        formatter = self._get_formatter(formatter)
+        formatter = self._get_formatter(formatter, max_error_length())
         if first == second:
             return
         if include_values and is_string(first) and is_string(second):
@@ -651,14 +654,24 @@ class _Verify(_BuiltInBase):
         second_lines = second.splitlines(True)
         if len(first_lines) < 3 or len(second_lines) < 3:
             return
-        self.log("%s\n\n!=\n\n%s" % (first.rstrip(), second.rstrip()))
-        diffs = list(difflib.unified_diff(first_lines, second_lines,
-                                          fromfile='first', tofile='second',
-                                          lineterm=''))
-        diffs[3:] = [item[0] + formatter(item[1:]).rstrip()
-                     for item in diffs[3:]]
+        self.log("%s\n\n!=\n\n%s"
+                 % (cut_unic(first.rstrip(), MAX_FORMATTED_LENGTH),
+                    cut_unic(second.rstrip(), MAX_FORMATTED_LENGTH)))
+        diffs = difflib.unified_diff(first_lines, second_lines,
+                                     fromfile='first', tofile='second',
+                                     lineterm='')
+        lines = [next(diffs) for _ in range(3)]
+        # Diff lines are formatted only until the message would be cut anyway.
+        max_length = max_error_length()
+        length = 0
+        for item in diffs:
+            if max_length is not None and length > max_length:
+                lines.append('...')
+                break
+            lines.append(item[0] + formatter(item[1:]).rstrip())
+            length += len(lines[-1])
         raise AssertionError('Multiline strings are different:\n' +
-                             '\n'.join(diffs))
+                             '\n'.join(lines))
 
     def _include_values(self, values):
         return is_truthy(values) and str(values).upper() != 'NO VALUES'
@@ -1161,7 +1174,7 @@ class _Verify(_BuiltInBase):
         | ${group1} = 'Bar'
         | ${group2} = '43'
         """
-        res = re.search(pattern, string)
+        res = compile_pattern(pattern, regexp=True).search(string)
         if res is None:
             raise AssertionError(self._get_string_msg(string, pattern, msg,
                                                       values, 'does not match'))
@@ -1176,7 +1189,7 @@ class _Verify(_BuiltInBase):
 
         See `Should Match Regexp` for more information about arguments.
         """
-        if re.search(pattern, string) is not None:
+        if compile_pattern(pattern, regexp=True).search(string) is not None:
             raise AssertionError(self._get_string_msg(string, pattern, msg,
                                                       values, 'matches'))
 
@@ -1722,6 +1735,45 @@ class _RunKeyword(_BuiltInBase):
             raise DataError('Incorrect use of AND')
         return kw_call[0], kw_call[1:]
 
+    @run_keyword_variant(resolve=0)
+    def run_keywords_in_parallel(self, *keywords):
+        """Executes all the given keywords concurrently in separate threads.
+
+        This keyword accepts keywords and their arguments the same way as
+        `Run Keywords`, including using ``AND`` as a separator between
+        keywords. Unlike `Run Keywords`, it starts all the keywords at once
+        and waits until all of them have finished. It is useful, for example,
+        in setups that need to initialize several independent systems that
+        spend most of their time waiting for I/O.
+
+        Examples:
+        | `Run Keywords In Parallel` | `Start server` | A | AND | `Seed database` | B | AND | `Warm cache` | C |
+        | `Run Keywords In Parallel` | `Download file` | ${URL 1} | AND | `Download file` | ${URL 2} |
+
+        Each keyword gets its own result in the log file in the order the
+        keywords were given. Messages the keywords log and write to the
+        standard output and error streams are added to their results after
+        all keywords have finished. If one or more keywords fail, this
+        keyword fails with all the failures after all keywords have been
+        executed.
+
+        Only library keywords can be run in parallel and trying to use, for
+        example, user keywords or run keyword variants fails. Also BuiltIn
+        keywords are not supported because many of them, such as `Set Tags`
+        and `Set Suite Variable`, change the execution state. Keywords run
+        in threads, not in separate processes, which means that keywords
+        doing CPU bound work in Python code do not get faster. Keywords
+        should not depend on each other or otherwise share state without
+        proper synchronization. Keywords that are still running when a test
+        or keyword timeout occurs cannot be stopped, but they are left
+        running in the background.
+
+        New in Robot Framework 4.0.
+        """
+        calls = self._split_run_keywords(list(keywords))
+        runner = ParallelKeywordRunner(self._context)
+        runner.run([Keyword(name, args=args) for name, args in calls])
+
     @run_keyword_variant(resolve=2)
     def run_keyword_if(self, condition, name, *args):
         """Runs the given keyword with the given arguments, if ``condition`` is true.
@@ -1965,10 +2017,11 @@ class _RunKeyword(_BuiltInBase):
 
     def _error_is_expected(self, error, expected_error):
         glob = self._matches
+        regexp = lambda s, p: compile_pattern(p, regexp=True).match(s)
         matchers = {'GLOB': glob,
                     'EQUALS': lambda s, p: s == p,
                     'STARTS': lambda s, p: s.startswith(p),
-                    'REGEXP': lambda s, p: re.match(p, s) is not None}
+                    'REGEXP': lambda s, p: regexp(s, p) is not None}
         prefixes = tuple(prefix + ':' for prefix in matchers)
         if not expected_error.startswith(prefixes):
             return glob(error, expected_error)
@@ -2680,14 +2733,26 @@ class _Misc(_BuiltInBase):
         if is_truthy(console):
             logger.console(message)
 
-    def _get_formatter(self, formatter):
+    def _get_formatter(self, formatter, max_length=None):
         try:
-            return {'str': unic,
-                    'repr': prepr,
-                    'ascii': ascii if PY3 else repr}[formatter.lower()]
+            formatter = {'str': cut_unic,
+                         'repr': self._prepr,
+                         'ascii': self._ascii}[formatter.lower()]
         except KeyError:
             raise ValueError("Invalid formatter '%s'. Available "
                              "'str', 'repr' and 'ascii'." % formatter)
+        return lambda item: formatter(item, max_length)
+
+    def _prepr(self, item, max_length=None):
+        return prepr(item, max_length=max_length)
+
+    def _ascii(self, item, max_length=None):
+        if max_length is not None and (is_unicode(item) or is_bytes(item)):
+            item = item[:max_length+1]
+        item = ascii(item) if PY3 else repr(item)
+        if max_length is None or len(item) <= max_length:
+            return item
+        return item[:max_length] + '...'
 
     @run_keyword_variant(resolve=0)
     def log_many(self, *messages):
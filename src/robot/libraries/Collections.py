@@ -14,10 +14,12 @@
 #  limitations under the License.
 
 import copy
+from collections import Counter, OrderedDict
 
 from robot.api import logger
-from robot.utils import (is_dict_like, is_list_like, is_number, is_string, is_truthy, plural_or_not,
-                         seq2str, seq2str2, type_name, unic, Matcher)
+from robot.utils import (cut_unic, get_matcher, is_dict_like, is_list_like, is_number,
+                         is_string, is_truthy, max_error_length, plural_or_not, seq2str,
+                         seq2str2, type_name, unic)
 from robot.utils.asserts import assert_equal
 from robot.version import get_version
 
@@ -161,10 +163,7 @@ class _List(object):
         duplicates. Number of the removed duplicates is logged.
         """
         self._validate_list(list_)
-        ret = []
-        for item in list_:
-            if item not in ret:
-                ret.append(item)
+        ret = _ItemCounts(list_).unique
         removed = len(list_) - len(ret)
         logger.info('%d duplicate%s removed.' % (removed, plural_or_not(removed)))
         return ret
@@ -332,15 +331,10 @@ class _List(object):
         The original iterable is never altered.
         """
         self._validate_list(list_)
-        if not isinstance(list_, list):
-            list_ = list(list_)
         dupes = []
-        for item in list_:
-            if item not in dupes:
-                count = list_.count(item)
-                if count > 1:
-                    logger.info("'%s' found %d times." % (item, count))
-                    dupes.append(item)
+        for item, count in _ItemCounts(list_).duplicates:
+            logger.info("'%s' found %d times." % (item, count))
+            dupes.append(item)
         if dupes:
             raise AssertionError(msg or
                                  '%s found multiple times.' % seq2str(dupes))
@@ -382,8 +376,8 @@ class _List(object):
         name@bar.com``.
 
         The optional ``ignore_order`` argument can be used to ignore the order
-        of the elements in the lists. Using it requires items to be sortable.
-        This is new in Robot Framework 3.2.
+        of the elements in the lists. Reporting possible differences requires
+        items to be sortable. This is new in Robot Framework 3.2.
 
         Example:
         | ${list1} = | Create List | apple | cherry | banana |
@@ -395,11 +389,13 @@ class _List(object):
         len2 = len(list2)
         default = 'Lengths are different: %d != %d' % (len1, len2)
         _verify_condition(len1 == len2, default, msg, values)
+        if ignore_order and _ItemCounts(list1) == _ItemCounts(list2):
+            return
         names = self._get_list_index_name_mapping(names, len1)
         if ignore_order:
             list1 = sorted(list1)
             list2 = sorted(list2)
-        diffs = list(self._yield_list_diffs(list1, list2, names))
+        diffs = _format_diffs(self._yield_list_diffs(list1, list2, names))
         default = 'Lists are different:\n' + '\n'.join(diffs)
         _verify_condition(diffs == [], default, msg, values)
 
@@ -412,11 +408,9 @@ class _List(object):
 
     def _yield_list_diffs(self, list1, list2, names):
         for index, (item1, item2) in enumerate(zip(list1, list2)):
-            name = ' (%s)' % names[index] if index in names else ''
-            try:
-                assert_equal(item1, item2, msg='Index %d%s' % (index, name))
-            except AssertionError as err:
-                yield unic(err)
+            if not item1 == item2:
+                name = ' (%s)' % names[index] if index in names else ''
+                yield 'Index %d%s' % (index, name), item1, item2
 
     def list_should_contain_sub_list(self, list1, list2, msg=None, values=True):
         """Fails if not all of the elements in ``list2`` are found in ``list1``.
@@ -428,6 +422,7 @@ class _List(object):
         the error message with ``msg`` and ``values`` arguments.
         """
         self._validate_lists(list1, list2)
+        list1 = _ItemCounts(list1)
         diffs = ', '.join(unic(item) for item in list2 if item not in list1)
         default = 'Following values were not found from first list: ' + diffs
         _verify_condition(not diffs, default, msg, values)
@@ -766,8 +761,9 @@ class _Dictionary(object):
         """
         self._validate_dictionary(dict1)
         self._validate_dictionary(dict2, 2)
-        keys = self.get_dictionary_keys(dict2)
-        diffs = [unic(k) for k in keys if k not in dict1]
+        keys = self.get_dictionary_keys(dict2, sort_keys=False)
+        diffs = [unic(k) for k in
+                 _sorted_if_possible([k for k in keys if k not in dict1])]
         default = "Following keys missing from first dictionary: %s" \
                   % ', '.join(diffs)
         _verify_condition(not diffs, default, msg, values)
@@ -795,10 +791,12 @@ class _Dictionary(object):
             yield '%s: %s' % (key, dictionary[key])
 
     def _keys_should_be_equal(self, dict1, dict2, msg, values):
-        keys1 = self.get_dictionary_keys(dict1)
-        keys2 = self.get_dictionary_keys(dict2)
-        miss1 = [unic(k) for k in keys2 if k not in dict1]
-        miss2 = [unic(k) for k in keys1 if k not in dict2]
+        keys1 = self.get_dictionary_keys(dict1, sort_keys=False)
+        keys2 = self.get_dictionary_keys(dict2, sort_keys=False)
+        miss1 = [unic(k) for k in
+                 _sorted_if_possible([k for k in keys2 if k not in dict1])]
+        miss2 = [unic(k) for k in
+                 _sorted_if_possible([k for k in keys1 if k not in dict2])]
         error = []
         if miss1:
             error += ['Following keys missing from first dictionary: %s'
@@ -810,16 +808,15 @@ class _Dictionary(object):
         return keys1
 
     def _key_values_should_be_equal(self, keys, dict1, dict2, msg, values):
-        diffs = list(self._yield_dict_diffs(keys, dict1, dict2))
+        diffs = _format_diffs(self._yield_dict_diffs(keys, dict1, dict2))
         default = 'Following keys have different values:\n' + '\n'.join(diffs)
         _verify_condition(not diffs, default, msg, values)
 
     def _yield_dict_diffs(self, keys, dict1, dict2):
-        for key in keys:
-            try:
-                assert_equal(dict1[key], dict2[key], msg='Key %s' % (key,))
-            except AssertionError as err:
-                yield unic(err)
+        # Sorting only differing keys avoids sorting large equal dictionaries.
+        differing = [key for key in keys if not dict1[key] == dict2[key]]
+        for key in _sorted_if_possible(differing):
+            yield 'Key %s' % (key,), dict1[key], dict2[key]
 
     def _validate_dictionary(self, dictionary, position=1):
         if is_string(dictionary) or is_number(dictionary):
@@ -1003,6 +1000,116 @@ class Collections(_List, _Dictionary):
                                     whitespace_insensitive))
 
 
+class _ItemCounts(object):
+    """Counts items preserving the order in which they were first seen.
+
+    Hashable items are counted in a dictionary and only unhashable items,
+    such as lists, require a linear search. Iterating yields
+    ``(item, count)`` pairs.
+    """
+
+    def __init__(self, items=()):
+        items = list(items)
+        self._items = items
+        self._order = None
+        self._unhashable = []
+        try:
+            self._counts = Counter(items)
+        except TypeError:
+            self._counts = {}
+            self._order = []
+            for item in items:
+                self._add(item)
+
+    @property
+    def unique(self):
+        """List of items in the order they were first seen."""
+        if self._order is None:
+            self._order = list(OrderedDict.fromkeys(self._items))
+        return self._order
+
+    @property
+    def duplicates(self):
+        """List of ``(item, count)`` pairs for items found multiple times."""
+        if len(self) == len(self._items):
+            return []
+        return [(item, count) for item, count in self if count > 1]
+
+    def _add(self, item):
+        try:
+            count = self._counts.get(item)
+        except TypeError:
+            entry = self._find_unhashable(item)
+            if entry is None:
+                entry = [item, 0]
+                self._unhashable.append(entry)
+                self._order.append(item)
+            entry[1] += 1
+        else:
+            if count is None:
+                self._order.append(item)
+            self._counts[item] = (count or 0) + 1
+
+    def _find_unhashable(self, item):
+        for entry in self._unhashable:
+            if entry[0] == item:
+                return entry
+        return None
+
+    def count(self, item):
+        try:
+            return self._counts.get(item, 0)
+        except TypeError:
+            entry = self._find_unhashable(item)
+            return entry[1] if entry else 0
+
+    def __contains__(self, item):
+        return self.count(item) > 0
+
+    def __iter__(self):
+        for item in self.unique:
+            yield item, self.count(item)
+
+    def __len__(self):
+        return len(self._counts) + len(self._unhashable)
+
+    def __eq__(self, other):
+        if not (self._unhashable or other._unhashable):
+            return self._counts == other._counts
+        return (len(self) == len(other) and
+                all(other.count(item) == count for item, count in self))
+
+    def __ne__(self, other):
+        return not self == other
+
+
+def _format_diffs(diffs):
+    # Diffs are formatted only until the message would be cut anyway.
+    max_length = max_error_length()
+    formatted = []
+    length = 0
+    for name, item1, item2 in diffs:
+        if max_length is not None and length > max_length:
+            remaining = 1 + sum(1 for _ in diffs)
+            formatted.append('And %d more difference%s.'
+                             % (remaining, plural_or_not(remaining)))
+            break
+        try:
+            assert_equal(item1, item2, msg=name,
+                         formatter=lambda item: cut_unic(item, max_length))
+        except AssertionError as err:
+            formatted.append(unic(err))
+            length += len(formatted[-1])
+    return formatted
+
+
+def _sorted_if_possible(items):
+    try:
+        return sorted(items)
+    except TypeError:
+        return list(items)
+
+
 def _verify_condition(condition, default_msg, msg, values=False):
     if condition:
         return
@@ -1023,9 +1130,8 @@ def _get_matches_in_iterable(iterable, pattern, case_insensitive=False,
         regexp = True
     elif pattern.startswith('glob='):
         pattern = pattern[5:]
-    matcher = Matcher(pattern,
-                      caseless=is_truthy(case_insensitive),
-                      spaceless=is_truthy(whitespace_insensitive),
-                      regexp=regexp)
-    return [string for string in iterable
-            if is_string(string) and matcher.match(string)]
+    matcher = get_matcher(pattern,
+                          caseless=is_truthy(case_insensitive),
+                          spaceless=is_truthy(whitespace_insensitive),
+                          regexp=regexp)
+    return matcher.filter(string for string in iterable if is_string(string))
@@ -75,6 +75,12 @@ class Remote(object):
         raise RuntimeError('Connecting remote server at %s failed: %s'
                            % (self._uri, error))
 
+    def get_library_information(self):
+        try:
+            return self._client.get_library_information()
+        except TypeError:
+            return None
+
     def get_keyword_arguments(self, name):
         try:
             return self._client.get_keyword_arguments(name)
@@ -231,6 +237,10 @@ class XmlRpcRemoteClient(object):
         with self._server as server:
             return server.get_keyword_names()
             
+    def get_library_information(self):
+        with self._server as server:
+            return server.get_library_information()
+
     def get_keyword_arguments(self, name):
         with self._server as server:
             return server.get_keyword_arguments(name)
@@ -17,15 +17,16 @@ from __future__ import absolute_import
 
 import os
 import re
-from fnmatch import fnmatchcase
+from functools import partial
+from itertools import compress
 from random import randint
 from string import ascii_lowercase, ascii_uppercase, digits
 
 
 from robot.api import logger
 from robot.api.deco import keyword
-from robot.utils import (is_bytes, is_string, is_truthy, is_unicode, lower,
-                         unic, FileReader, PY3)
+from robot.utils import (compile_pattern, is_bytes, is_string, is_truthy,
+                         is_unicode, lower, unic, FileReader, PY3)
 from robot.version import get_version
 
 
@@ -295,12 +296,11 @@ class String(object):
         See `Get Lines Matching Pattern` and `Get Lines Matching Regexp`
         if you need more complex pattern matching.
         """
-        if is_truthy(case_insensitive):
+        case_insensitive = is_truthy(case_insensitive)
+        if case_insensitive:
             pattern = pattern.lower()
-            contains = lambda line: pattern in line.lower()
-        else:
-            contains = lambda line: pattern in line
-        return self._get_matching_lines(string, contains)
+        select = lambda lines: [pattern in line for line in lines]
+        return self._get_matching_lines(string, select, case_insensitive)
 
     def get_lines_matching_pattern(self, string, pattern, case_insensitive=False):
         """Returns lines of the given ``string`` that match the ``pattern``.
@@ -331,12 +331,11 @@ class String(object):
         patterns and `Get Lines Containing String` if searching
         literal strings is enough.
         """
-        if is_truthy(case_insensitive):
+        case_insensitive = is_truthy(case_insensitive)
+        if case_insensitive:
             pattern = pattern.lower()
-            matches = lambda line: fnmatchcase(line.lower(), pattern)
-        else:
-            matches = lambda line: fnmatchcase(line, pattern)
-        return self._get_matching_lines(string, matches)
+        select = partial(map, compile_pattern(pattern).match)
+        return self._get_matching_lines(string, select, case_insensitive)
 
     def get_lines_matching_regexp(self, string, pattern, partial_match=False):
         """Returns lines of the given ``string`` that match the regexp ``pattern``.
@@ -376,11 +375,18 @@ class String(object):
         """
         if not is_truthy(partial_match):
             pattern = '^%s$' % pattern
-        return self._get_matching_lines(string, re.compile(pattern).search)
+        select = partial(map, compile_pattern(pattern, regexp=True).search)
+        return self._get_matching_lines(string, select)
 
-    def _get_matching_lines(self, string, matches):
+    def _get_matching_lines(self, string, select, case_insensitive=False):
         lines = string.splitlines()
-        matching = [line for line in lines if matches(line)]
+        candidates = lines
+        if case_insensitive:
+            # Lower case the whole string at once instead of each line.
+            candidates = string.lower().splitlines()
+            if len(candidates) != len(lines):
+                candidates = [line.lower() for line in lines]
+        matching = list(compress(lines, select(candidates)))
         logger.info('%d out of %d lines matched' % (len(matching), len(lines)))
         return '\n'.join(matching)
 
@@ -413,7 +419,7 @@ class String(object):
 
         New in Robot Framework 2.9.
         """
-        regexp = re.compile(pattern)
+        regexp = compile_pattern(pattern, regexp=True)
         groups = [self._parse_group(g) for g in groups]
         return [m.group(*groups) for m in regexp.finditer(string)]
 
@@ -14,8 +14,10 @@
 #  limitations under the License.
 
 from contextlib import contextmanager
+from itertools import islice
 import inspect
 import re
+import select
 import socket
 import struct
 import telnetlib
@@ -26,6 +28,14 @@ try:
 except ImportError:
     pyte = None
 
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    try:
+        import sre_parse
+    except ImportError:
+        sre_parse = None
+
 from robot.api import logger
 from robot.api.deco import keyword
 from robot.utils import (ConnectionCache, is_bytes, is_string, is_truthy,
@@ -488,6 +498,8 @@ class TelnetConnection(telnetlib.Telnet):
     NEW_ENVIRON_VAR = b'\x00'
     NEW_ENVIRON_VALUE = b'\x01'
     INTERNAL_UPDATE_FREQUENCY = 0.03
+    RECEIVE_BUFFER_SIZE = 4096
+    MAX_RECEIVES_BEFORE_SEARCH = 16
 
     def __init__(self, host=None, port=23, timeout=3.0, newline='CRLF',
                  prompt=None, prompt_is_regexp=False,
@@ -912,24 +924,47 @@ class TelnetConnection(telnetlib.Telnet):
         output = telnetlib.Telnet.read_until(self, expected, self._timeout)
         return output.endswith(expected), self._decode(output)
 
-    @property
-    def _terminal_frequency(self):
-        return min(self.INTERNAL_UPDATE_FREQUENCY, self._timeout)
-
     def _terminal_read_until(self, expected):
         max_time = time.time() + self._timeout
         output = self._terminal_emulator.read_until(expected)
         if output:
             return True, output
-        while time.time() < max_time:
-            output = telnetlib.Telnet.read_until(self, self._encode(expected),
-                                                 self._terminal_frequency)
-            self._terminal_emulator.feed(self._decode(output))
+        expected_bytes = self._encode(expected)
+        while self._feed_terminal_emulator(max_time,
+                                           lambda out: expected_bytes in out):
             output = self._terminal_emulator.read_until(expected)
             if output:
                 return True, output
         return False, self._terminal_emulator.read()
 
+    def _feed_terminal_emulator(self, max_time, matches):
+        # Waits until new output is available and feeds it to the emulator.
+        # Output arriving soon after is fed at the same time, unless it already
+        # matches, so that the emulator screen is not scanned too often.
+        output = self._read_available_output(max_time)
+        while not output:
+            if not self._wait_for_input(max_time - time.time()):
+                return False
+            output = self._read_available_output(max_time)
+        flush_time = min(time.time() + self.INTERNAL_UPDATE_FREQUENCY, max_time)
+        while (not matches(output) and
+               self._wait_for_input(flush_time - time.time())):
+            output += self._read_available_output(flush_time)
+        self._terminal_emulator.feed(self._decode(output))
+        return True
+
+    def _read_available_output(self, max_time):
+        # Like `telnetlib.Telnet.read_very_eager` but does not read forever
+        # if output keeps coming.
+        self._fill_rawq_with_available_output(max_time)
+        self.process_rawq()
+        return self.read_very_lazy()
+
+    def _wait_for_input(self, timeout):
+        if timeout <= 0:
+            return False
+        return bool(select.select([self], [], [], timeout)[0])
+
     def _read_until_regexp(self, *expected):
         self._verify_connection()
         if self._terminal_emulator:
@@ -946,9 +981,8 @@ class TelnetConnection(telnetlib.Telnet):
         out = self._terminal_emulator.read_until_regexp(regexps_unicode)
         if out:
             return True, out
-        while time.time() < max_time:
-            output = self.expect(regexps_bytes, self._terminal_frequency)[-1]
-            self._terminal_emulator.feed(self._decode(output))
+        matches = lambda out: any(rgx.search(out) for rgx in regexps_bytes)
+        while self._feed_terminal_emulator(max_time, matches):
             out = self._terminal_emulator.read_until_regexp(regexps_unicode)
             if out:
                 return True, out
@@ -962,6 +996,81 @@ class TelnetConnection(telnetlib.Telnet):
             index, output = -1, b''
         return index != -1, self._decode(output)
 
+    def expect(self, regexps, timeout=None):
+        """Same as `telnetlib.Telnet.expect` but searches output incrementally.
+
+        The original re-searches all output received so far every time new
+        output arrives. Here each regular expression continues from the
+        position where a match could still start based on its maximum
+        width, and only when it is bounded. Patterns containing lookaheads or
+        word boundaries are always searched from the beginning.
+        """
+        searches = [IncrementalSearch(self._to_byte_regexp(rgx))
+                    for rgx in regexps]
+        max_time = time.time() + timeout if timeout is not None else None
+        while True:
+            self.process_rawq()
+            for index, search in enumerate(searches):
+                match = search.search(self.cookedq)
+                if match:
+                    output = self.cookedq[:match.end()]
+                    self.cookedq = self.cookedq[match.end():]
+                    return index, match, output
+            if self.eof:
+                break
+            if max_time is not None:
+                if not self._wait_for_input(max_time - time.time()):
+                    break
+            self.fill_rawq()
+            self._fill_rawq_with_available_output(max_time)
+        output = self.read_very_lazy()
+        if not output and self.eof:
+            raise EOFError
+        return -1, None, output
+
+    def _fill_rawq_with_available_output(self, max_time):
+        # Reads output that is already available so that it can be searched
+        # in one go. The amount of output is limited so that searching
+        # happens and the timeout is noticed also if output keeps coming.
+        for _ in range(self.MAX_RECEIVES_BEFORE_SEARCH):
+            if self.eof or not self.sock_avail():
+                break
+            if max_time is not None and time.time() >= max_time:
+                break
+            self.process_rawq()
+            self.fill_rawq()
+
+    def fill_rawq(self):
+        # Same as `telnetlib.Telnet.fill_rawq` but with a bigger buffer.
+        # The original reads 50 bytes per system call to keep its byte by
+        # byte `process_rawq` fast. See `process_rawq` below.
+        if self.irawq >= len(self.rawq):
+            self.rawq = b''
+            self.irawq = 0
+        data = self.sock.recv(self.RECEIVE_BUFFER_SIZE)
+        self.msg('recv %r', data)
+        self.eof = not data
+        self.rawq = self.rawq + data
+
+    def process_rawq(self):
+        # Output without telnet commands is moved to the cooked queue as a
+        # whole. Only output starting from the first command is processed
+        # byte by byte by `telnetlib.Telnet.process_rawq`.
+        if not (self.iacseq or self.sb):
+            end = self.rawq.find(telnetlib.IAC, self.irawq)
+            if end == -1:
+                end = len(self.rawq)
+            data = self.rawq[self.irawq:end]
+            if data:
+                self.cookedq += data.replace(telnetlib.theNULL, b'') \
+                                    .replace(b'\021', b'')
+                self.irawq = end
+        if self.irawq < len(self.rawq):
+            telnetlib.Telnet.process_rawq(self)
+        else:
+            self.rawq = b''
+            self.irawq = 0
+
     def _to_byte_regexp(self, exp):
         if is_bytes(exp):
             return re.compile(exp)
@@ -1169,6 +1278,8 @@ class TerminalEmulator(object):
         self._stream.attach(self._screen)
         self._buffer = ''
         self._whitespace_after_last_feed = ''
+        self._history_rows = []
+        self._first_history_row = None
 
     @property
     def current_output(self):
@@ -1180,10 +1291,17 @@ class TerminalEmulator(object):
                self._whitespace_after_last_feed
 
     def _get_history(self, screen):
-        if not screen.history.top:
+        history = screen.history.top
+        if not history:
             return ''
-        rows = []
-        for row in screen.history.top:
+        # Rows do not change after they have been moved to history, so only
+        # new rows need to be converted. Full conversion is needed if rows
+        # have been removed from the beginning or the screen has been reset.
+        rows = self._history_rows
+        if history[0] is not self._first_history_row or len(history) < len(rows):
+            rows[:] = []
+            self._first_history_row = history[0]
+        for row in islice(history, len(rows), None):
             # Newer pyte versions store row data in mappings
             data = (char.data for _, char in sorted(row.items()))
             rows.append(''.join(data).rstrip())
@@ -1225,6 +1343,70 @@ class TerminalEmulator(object):
         self._screen.reset()
 
 
+class IncrementalSearch(object):
+    """Searches a regular expression from a growing buffer.
+
+    After an unsuccessful search, a match can only end in data added to the
+    buffer after it. If the maximum width of the pattern is known, the next
+    search can thus start that many characters before the end of the
+    previously searched data.
+    """
+    _max_overlap = 0xFFFF
+
+    def __init__(self, regexp):
+        self._regexp = regexp
+        self._overlap = self._get_overlap(regexp)
+        self._searched = 0
+
+    def _get_overlap(self, regexp):
+        if sre_parse is None:
+            return None
+        try:
+            pattern = sre_parse.parse(regexp.pattern, regexp.flags)
+            width = pattern.getwidth()[1]
+        except Exception:
+            return None
+        if width > self._max_overlap or self._needs_full_search(pattern):
+            return None
+        return width
+
+    def _needs_full_search(self, pattern):
+        # Lookaheads and word boundaries may match differently at the end
+        # of the buffer than when more data has been added. Widths of
+        # backreferences are not known on all Python versions.
+        constants = sre_parse
+        for op, av in pattern:
+            if op in (constants.GROUPREF, constants.GROUPREF_EXISTS):
+                return True
+            if op in (constants.ASSERT, constants.ASSERT_NOT):
+                if av[0] >= 0:
+                    return True
+                children = [av[1]]
+            elif op == constants.AT:
+                if av in (constants.AT_BOUNDARY, constants.AT_NON_BOUNDARY):
+                    return True
+                children = []
+            elif op == constants.BRANCH:
+                children = av[1]
+            elif op == constants.SUBPATTERN:
+                children = [av[-1]]
+            elif op in (constants.MAX_REPEAT, constants.MIN_REPEAT):
+                children = [av[2]]
+            else:
+                children = []
+            for child in children:
+                if self._needs_full_search(child):
+                    return True
+        return False
+
+    def search(self, buffer):
+        start = 0
+        if self._overlap is not None:
+            start = max(self._searched - self._overlap, 0)
+        self._searched = len(buffer)
+        return self._regexp.search(buffer, start)
+
+
 class NoMatchError(AssertionError):
     ROBOT_SUPPRESS_NAME = True
 
@@ -13,8 +13,21 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import (Matcher, normalize, NormalizedDict, is_string, py2to3,
-                         setter, unic)
+import fnmatch
+import re
+
+from robot.utils import (Matcher, normalize, is_string, py2to3, setter, unic,
+                         IRONPYTHON)
+
+
+def _normalize(tag):
+    return normalize(tag, ignore='_')
+
+
+def _normalized_tags(tags):
+    if isinstance(tags, Tags):
+        return tags._normalized
+    return tuple(_normalize(tag) for tag in tags)
 
 
 @py2to3
@@ -25,18 +38,25 @@ class Tags(object):
 
     @setter
     def _tags(self, tags):
+        if isinstance(tags, Tags):
+            self._normalized = tags._normalized
+            return tags._tags
         if not tags:
+            self._normalized = ()
             return ()
         if is_string(tags):
             tags = (tags,)
         return self._deduplicate_normalized(tags)
 
     def _deduplicate_normalized(self, tags):
-        normalized = NormalizedDict(((unic(t), 1) for t in tags), ignore='_')
-        for removed in '', 'NONE':
-            if removed in normalized:
-                normalized.pop(removed)
-        return tuple(normalized)
+        normalized = {}
+        for tag in tags:
+            tag = unic(tag)
+            normalized.setdefault(_normalize(tag), tag)
+        for removed in '', 'none':
+            normalized.pop(removed, None)
+        self._normalized = tuple(sorted(normalized))
+        return tuple(normalized[norm] for norm in self._normalized)
 
     def add(self, tags):
         self._tags = tuple(self) + tuple(Tags(tags))
@@ -66,9 +86,7 @@ class Tags(object):
     def __eq__(self, other):
         if not isinstance(other, Tags):
             return False
-        self_normalized = [normalize(tag, ignore='_') for tag in self]
-        other_normalized = [normalize(tag, ignore='_') for tag in other]
-        return sorted(self_normalized) == sorted(other_normalized)
+        return self._normalized == other._normalized
 
     def __ne__(self, other):
         # Not necessary for Python3 (https://stackoverflow.com/a/30676267/2309247)
@@ -82,15 +100,59 @@ class Tags(object):
         return Tags(tuple(self) + tuple(Tags(other)))
 
 
+class TagIndex(object):
+    """Inverted index mapping normalized tags to tests having them.
+
+    Makes selecting tests by tags from large suites fast because tag
+    patterns need to be matched only against unique tags, not against
+    tags of every test. Use :meth:`select` to get tests matching patterns.
+    """
+
+    def __init__(self, suite=None):
+        self._tests = {}
+        self.all_tests = set()
+        if suite is not None:
+            self.add_suite(suite)
+
+    def add_suite(self, suite):
+        for test in suite.tests:
+            self.add_test(test)
+        for child in suite.suites:
+            self.add_suite(child)
+
+    def add_test(self, test):
+        self.all_tests.add(test)
+        for tag in test.tags._normalized:
+            self._tests.setdefault(tag, []).append(test)
+
+    @property
+    def tags(self):
+        """Normalized tags of all indexed tests."""
+        return self._tests.keys()
+
+    def tests_with(self, normalized_tag):
+        return self._tests.get(normalized_tag, ())
+
+    def select(self, patterns):
+        """Returns a set of tests matching any of the given tag patterns."""
+        if not isinstance(patterns, TagPatterns):
+            patterns = TagPatterns(patterns)
+        return patterns.select(self)
+
+
 @py2to3
 class TagPatterns(object):
 
     def __init__(self, patterns):
         self._patterns = tuple(TagPattern(p) for p in Tags(patterns))
+        self._matcher = AnyTagPattern(self._patterns)
 
     def match(self, tags):
         tags = tags if isinstance(tags, Tags) else Tags(tags)
-        return any(p.match(tags) for p in self._patterns)
+        return self._matcher.match(tags)
+
+    def select(self, index):
+        return self._matcher.select(index)
 
     def __contains__(self, tag):
         return self.match(tag)
@@ -124,9 +186,20 @@ class SingleTagPattern(object):
 
     def __init__(self, pattern):
         self._matcher = Matcher(pattern, ignore='_')
+        self.normalized = _normalize(pattern)
+        self.is_glob = any(char in self.normalized for char in '*?[')
+        self._regexp = _compile_globs([self.normalized]) if self.is_glob else None
 
     def match(self, tags):
-        return self._matcher.match_any(tags)
+        tags = _normalized_tags(tags)
+        if not self.is_glob:
+            return self.normalized in tags
+        return any(self._regexp.match(tag) for tag in tags)
+
+    def select(self, index):
+        if not self.is_glob:
+            return set(index.tests_with(self.normalized))
+        return _select_by_regexp(index, self._regexp)
 
     def __iter__(self):
         yield self
@@ -147,6 +220,14 @@ class AndTagPattern(object):
     def match(self, tags):
         return all(p.match(tags) for p in self._patterns)
 
+    def select(self, index):
+        selected = self._patterns[0].select(index)
+        for pattern in self._patterns[1:]:
+            if not selected:
+                break
+            selected &= pattern.select(index)
+        return selected
+
     def __iter__(self):
         return iter(self._patterns)
 
@@ -159,9 +240,13 @@ class OrTagPattern(object):
 
     def __init__(self, patterns):
         self._patterns = tuple(TagPattern(p) for p in patterns)
+        self._matcher = AnyTagPattern(self._patterns)
 
     def match(self, tags):
-        return any(p.match(tags) for p in self._patterns)
+        return self._matcher.match(tags)
+
+    def select(self, index):
+        return self._matcher.select(index)
 
     def __iter__(self):
         return iter(self._patterns)
@@ -182,6 +267,11 @@ class NotTagPattern(object):
             return not self._rest.match(tags)
         return self._first.match(tags) and not self._rest.match(tags)
 
+    def select(self, index):
+        if not self._first:
+            return index.all_tests - self._rest.select(index)
+        return self._first.select(index) - self._rest.select(index)
+
     def __iter__(self):
         yield self._first
         for pattern in self._rest:
@@ -189,3 +279,55 @@ class NotTagPattern(object):
 
     def __unicode__(self):
         return ' NOT '.join(pattern.__unicode__() for pattern in self).lstrip()
+
+
+class AnyTagPattern(object):
+    """Matches if any of the given patterns match.
+
+    Plain tag names are combined into one set and glob patterns into one
+    regular expression so that matching does not depend much on the number
+    of patterns.
+    """
+
+    def __init__(self, patterns):
+        singles = [p for p in patterns if isinstance(p, SingleTagPattern)]
+        self._names = frozenset(p.normalized for p in singles if not p.is_glob)
+        globs = [p.normalized for p in singles if p.is_glob]
+        self._regexp = _compile_globs(globs) if globs else None
+        self._others = tuple(p for p in patterns
+                             if not isinstance(p, SingleTagPattern))
+
+    def match(self, tags):
+        normalized = _normalized_tags(tags)
+        if self._names and not self._names.isdisjoint(normalized):
+            return True
+        if self._regexp and any(self._regexp.match(t) for t in normalized):
+            return True
+        return any(p.match(tags) for p in self._others)
+
+    def select(self, index):
+        selected = set()
+        for name in self._names:
+            selected.update(index.tests_with(name))
+        if self._regexp:
+            selected |= _select_by_regexp(index, self._regexp)
+        for pattern in self._others:
+            selected |= pattern.select(index)
+        return selected
+
+
+def _compile_globs(patterns):
+    """Compiles normalized glob patterns into one regular expression."""
+    translated = [fnmatch.translate(p) for p in patterns]
+    if IRONPYTHON:
+        # https://github.com/IronLanguages/ironpython2/issues/515
+        translated = [p.replace("\\'", "'") for p in translated]
+    return re.compile('|'.join('(?:%s)' % p for p in translated), re.DOTALL)
+
+
+def _select_by_regexp(index, regexp):
+    selected = set()
+    for tag in index.tags:
+        if regexp.match(tag):
+            selected.update(index.tests_with(tag))
+    return selected
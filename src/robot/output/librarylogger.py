@@ -30,6 +30,9 @@ from .loggerhelper import Message
 
 
 LOGGING_THREADS = ('MainThread', 'RobotFrameworkTimeoutThread')
+# Threads running keywords in parallel collect messages into their
+# `messages` attribute and they are logged later by the main thread.
+PARALLEL_KEYWORD_THREAD = 'RobotFrameworkParallelKeywordThread'
 
 
 def write(msg, level, html=False):
@@ -40,8 +43,11 @@ def write(msg, level, html=False):
         msg = unic(msg)
     if level.upper() not in ('TRACE', 'DEBUG', 'INFO', 'HTML', 'WARN', 'ERROR'):
         raise DataError("Invalid log level '%s'." % level)
-    if threading.currentThread().getName() in LOGGING_THREADS:
+    thread = threading.currentThread()
+    if thread.getName() in LOGGING_THREADS:
         LOGGER.log_message(Message(msg, level, html))
+    elif thread.getName() == PARALLEL_KEYWORD_THREAD:
+        thread.messages.append(Message(msg, level, html))
 
 
 def trace(msg, html=False):
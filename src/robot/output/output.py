@@ -26,7 +26,9 @@ class Output(AbstractLogger):
     def __init__(self, settings):
         AbstractLogger.__init__(self)
         self._xmllogger = XmlLogger(settings.output, settings.log_level,
-                                    settings.rpa)
+                                    settings.rpa,
+                                    precise_elapsed=settings.precise_elapsed,
+                                    split=settings.output_split)
         self.listeners = Listeners(settings.listeners, settings.log_level)
         self.library_listeners = LibraryListeners(settings.log_level)
         self._register_loggers(DebugFile(settings.debug_file))
@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os.path
+
 from robot.utils import XmlWriter, NullMarkupWriter, get_timestamp, unic
 from robot.version import get_full_version
 from robot.result.visitor import ResultVisitor
@@ -22,20 +24,21 @@ from .loggerhelper import IsLogged
 
 class XmlLogger(ResultVisitor):
 
-    def __init__(self, path, log_level='TRACE', rpa=False, generator='Robot'):
+    def __init__(self, path, log_level='TRACE', rpa=False, generator='Robot',
+                 precise_elapsed=False, split=False):
         self._log_message_is_logged = IsLogged(log_level)
         self._error_message_is_logged = IsLogged('WARN')
+        self._split = SplitOutput(path, rpa, generator) \
+            if split and path else None
         self._writer = self._get_writer(path, rpa, generator)
         self._errors = []
+        self._precise_elapsed = precise_elapsed
+        self._suite_level = 0
 
     def _get_writer(self, path, rpa, generator):
         if not path:
             return NullMarkupWriter()
-        writer = XmlWriter(path, write_empty=False, usage='output')
-        writer.start('robot', {'generator': get_full_version(generator),
-                               'generated': get_timestamp(),
-                               'rpa': 'true' if rpa else 'false'})
-        return writer
+        return _start_output(path, rpa, generator, split=bool(self._split))
 
     def close(self):
         self.start_errors()
@@ -91,6 +94,9 @@ class XmlLogger(ResultVisitor):
 
     def start_suite(self, suite):
         attrs = {'id': suite.id, 'name': suite.name, 'source': suite.source}
+        self._suite_level += 1
+        if self._split and self._suite_level == 2:
+            self._writer = self._split.start_part(self._writer, attrs)
         self._writer.start('suite', attrs)
 
     def end_suite(self, suite):
@@ -99,6 +105,9 @@ class XmlLogger(ResultVisitor):
             self._write_metadata(suite.metadata)
         self._write_status(suite)
         self._writer.end('suite')
+        if self._split and self._suite_level == 2:
+            self._writer = self._split.end_part()
+        self._suite_level -= 1
 
     def _write_metadata(self, metadata):
         self._writer.start('metadata')
@@ -152,6 +161,59 @@ class XmlLogger(ResultVisitor):
                  'endtime': item.endtime or 'N/A'}
         if not (item.starttime and item.endtime):
             attrs['elapsedtime'] = str(item.elapsedtime)
+        elif self._precise_elapsed and item.elapsed_ns is not None:
+            attrs['elapsedtime'] = '%.3f' % (item.elapsed_ns / 1e6)
         if extra_attrs:
             attrs.update(extra_attrs)
         self._writer.element('status', item.message, attrs)
+
+
+def _start_output(path, rpa, generator, split=False):
+    writer = XmlWriter(path, write_empty=False, usage='output')
+    attrs = {'generator': get_full_version(generator),
+             'generated': get_timestamp(),
+             'rpa': 'true' if rpa else 'false'}
+    if split:
+        attrs['split'] = 'true'
+    writer.start('robot', attrs)
+    return writer
+
+
+class SplitOutput(object):
+    """Writes child suites of the top level suite into separate files.
+
+    The main output file gets a self-closing ``suite`` element with the
+    name of the part file in its ``file`` attribute in place of each child
+    suite. Part files are normal output files containing only that suite.
+    """
+    _compressions = ('.gz', '.bz2', '.xz')
+
+    def __init__(self, path, rpa=False, generator='Robot'):
+        self._base, self._extension = self._split_extension(path)
+        self._rpa = rpa
+        self._generator = generator
+        self._main_writer = None
+        self._part_writer = None
+        self._index = 0
+
+    def _split_extension(self, path):
+        base, ext = os.path.splitext(path)
+        if ext.lower() in self._compressions:
+            base, xml_ext = os.path.splitext(base)
+            ext = xml_ext + ext
+        return base, ext
+
+    def start_part(self, main_writer, attrs):
+        self._index += 1
+        path = '%s-%d%s' % (self._base, self._index, self._extension)
+        main_writer.element('suite', attrs=dict(attrs,
+                                                file=os.path.basename(path)))
+        self._main_writer = main_writer
+        self._part_writer = _start_output(path, self._rpa, self._generator)
+        return self._part_writer
+
+    def end_part(self):
+        self._part_writer.end('robot')
+        self._part_writer.close()
+        self._part_writer = None
+        return self._main_writer
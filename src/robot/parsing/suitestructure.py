@@ -13,12 +13,21 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import io
 import os.path
+import time
+from fnmatch import fnmatchcase
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:    # Python 2
+    ThreadPoolExecutor = None
 
 from robot.errors import DataError
 from robot.model import SuiteNamePatterns
 from robot.output import LOGGER
-from robot.utils import abspath, get_error_message, unic
+from robot.utils import (abspath, get_error_message, plural_or_not,
+                         secs_to_timestr, unic)
 
 
 class SuiteStructure(object):
@@ -49,17 +58,29 @@ class SuiteStructure(object):
 class SuiteStructureBuilder(object):
     ignored_prefixes = ('_', '.')
     ignored_dirs = ('CVS',)
+    ignore_file = '.robotignore'
 
     def __init__(self, included_extensions=('robot',), included_suites=None):
         self.included_extensions = included_extensions
         self.included_suites = included_suites
 
     def build(self, paths):
+        start = time.time()
         paths = list(self._normalize_paths(paths))
-        if len(paths) == 1:
-            return self._build(paths[0], self.included_suites)
-        children = [self._build(p, self.included_suites) for p in paths]
-        return SuiteStructure(children=children)
+        with _DirectoryScanner(self._list_dir) as scanner:
+            if len(paths) == 1:
+                structure = self._build(paths[0], self.included_suites,
+                                        scanner)
+            else:
+                children = [self._build(p, self.included_suites, scanner)
+                            for p in paths]
+                structure = SuiteStructure(children=children)
+        LOGGER.info('Discovered %d file%s in %d director%s in %s.'
+                    % (scanner.files, plural_or_not(scanner.files),
+                       scanner.directories,
+                       'y' if scanner.directories == 1 else 'ies',
+                       secs_to_timestr(time.time() - start)))
+        return structure
 
     def _normalize_paths(self, paths):
         if not paths:
@@ -71,12 +92,29 @@ class SuiteStructureBuilder(object):
                                 "execute does not exist." % path)
             yield abspath(path)
 
-    def _build(self, path, include_suites):
+    def _build(self, path, include_suites, scanner):
         if os.path.isfile(path):
+            scanner.files += 1
             return SuiteStructure(path)
-        include_suites = self._get_include_suites(path, include_suites)
-        init_file, paths = self._get_child_paths(path, include_suites)
-        children = [self._build(p, include_suites) for p in paths]
+        scanner.submit(path, include_suites)
+        return self._build_directory(path, scanner)
+
+    def _build_directory(self, path, scanner):
+        listing = scanner.get(path)
+        init_file = None
+        paths = []
+        for child, kind in listing.entries:
+            if kind == 'init' and not init_file:
+                init_file = child
+            elif kind == 'init':
+                LOGGER.error("Ignoring second test suite init file '%s'."
+                             % child)
+            elif kind in ('file', 'dir'):
+                paths.append((child, kind))
+            else:
+                LOGGER.info("Ignoring file or directory '%s'." % child)
+        children = [self._build_directory(child, scanner) if kind == 'dir'
+                    else SuiteStructure(child) for child, kind in paths]
         return SuiteStructure(path, init_file, children)
 
     def _get_include_suites(self, path, incl_suites):
@@ -97,49 +135,43 @@ class SuiteStructureBuilder(object):
                 suite = suite.split('.', 1)[1]
                 yield suite
 
-    def _get_child_paths(self, dirpath, incl_suites=None):
-        init_file = None
-        paths = []
-        for path, is_init_file in self._list_dir(dirpath, incl_suites):
-            if is_init_file:
-                if not init_file:
-                    init_file = path
-                else:
-                    LOGGER.error("Ignoring second test suite init file '%s'."
-                                 % path)
-            else:
-                paths.append(path)
-        return init_file, paths
-
-    def _list_dir(self, dir_path, incl_suites):
+    def _list_dir(self, dir_path, incl_suites, ignores=None):
         # os.listdir returns Unicode entries when path is Unicode
         dir_path = unic(dir_path)
+        incl_suites = self._get_include_suites(dir_path, incl_suites)
         try:
-            names = os.listdir(dir_path)
+            entries = _scan_dir(dir_path)
         except:
             raise DataError("Reading directory '%s' failed: %s"
                             % (dir_path, get_error_message()))
-        for name in sorted(names, key=lambda item: item.lower()):
-            name = unic(name)  # needed to handle nfc/nfd normalization on OSX
+        ignores = _IgnorePatterns.from_directory(dir_path, ignores,
+                                                 self.ignore_file)
+        listing = _DirectoryListing(dir_path, incl_suites, ignores)
+        for entry in sorted(entries, key=lambda item: item.name.lower()):
+            name = unic(entry.name)  # needed to handle nfc/nfd normalization on OSX
             path = os.path.join(dir_path, name)
             base, ext = os.path.splitext(name)
             ext = ext[1:].lower()
-            if self._is_init_file(path, base, ext):
-                yield path, True
-            elif self._is_included(path, base, ext, incl_suites):
-                yield path, False
+            if ignores.match(path, entry.is_dir()):
+                listing.add(path, 'ignored')
+            elif self._is_init_file(entry, base, ext):
+                listing.add(path, 'init')
+            elif self._is_included(entry, base, ext, incl_suites):
+                listing.add(path, 'dir' if entry.is_dir() else 'file',
+                            entry.is_symlink())
             else:
-                LOGGER.info("Ignoring file or directory '%s'." % path)
+                listing.add(path, 'ignored')
+        return listing
 
-    def _is_init_file(self, path, base, ext):
+    def _is_init_file(self, entry, base, ext):
         return (base.lower() == '__init__'
                 and ext in self.included_extensions
-                and os.path.isfile(path))
+                and entry.is_file())
 
-    def _is_included(self, path, base, ext, incl_suites):
+    def _is_included(self, entry, base, ext, incl_suites):
         if base.startswith(self.ignored_prefixes):
             return False
-        if os.path.isdir(path):
+        if entry.is_dir():
             return base not in self.ignored_dirs or ext
         if ext not in self.included_extensions:
             return False
@@ -154,6 +186,159 @@ class SuiteStructureBuilder(object):
         return name.split('__', 1)[-1]
 
 
+if hasattr(os, 'scandir'):
+    def _scan_dir(path):
+        return list(os.scandir(path))
+else:
+    def _scan_dir(path):
+        return [_DirEntry(path, name) for name in os.listdir(path)]
+
+
+class _DirEntry(object):
+    """Minimal ``os.DirEntry`` replacement for Python versions without it."""
+
+    def __init__(self, dir_path, name):
+        self.name = name
+        self.path = os.path.join(dir_path, name)
+
+    def is_dir(self):
+        return os.path.isdir(self.path)
+
+    def is_file(self):
+        return os.path.isfile(self.path)
+
+    def is_symlink(self):
+        return os.path.islink(self.path)
+
+
+class _DirectoryListing(object):
+
+    def __init__(self, path, include_suites, ignores):
+        self.path = path
+        self.include_suites = include_suites
+        self.ignores = ignores
+        self.entries = []
+        self.subdirectories = []
+
+    def add(self, path, kind, is_symlink=False):
+        self.entries.append((path, kind))
+        if kind == 'dir':
+            self.subdirectories.append((path, is_symlink))
+
+
+class _IgnorePatterns(object):
+    """Glob patterns read from ignore files like ``.robotignore``.
+
+    Patterns containing a slash, also a leading one, are matched against
+    paths relative to the directory containing the ignore file. Other
+    patterns match names on any level. Patterns ending with a slash match
+    only directories. Patterns in ignore
+    files apply also to all subdirectories.
+    """
+
+    def __init__(self, patterns=()):
+        self._patterns = tuple(patterns)
+
+    @classmethod
+    def from_directory(cls, path, parent=None, ignore_file='.robotignore'):
+        patterns = parent._patterns if parent else ()
+        ignore_file = os.path.join(path, ignore_file)
+        if os.path.isfile(ignore_file):
+            patterns += tuple(cls._read(path, ignore_file))
+        return cls(patterns)
+
+    @classmethod
+    def _read(cls, root, ignore_file):
+        try:
+            with io.open(ignore_file, encoding='UTF-8') as f:
+                lines = f.read().splitlines()
+        except (IOError, OSError, UnicodeError):
+            raise DataError("Reading ignore file '%s' failed: %s"
+                            % (ignore_file, get_error_message()))
+        for line in lines:
+            pattern = line.strip()
+            if not pattern or pattern.startswith('#'):
+                continue
+            dirs_only = pattern.endswith('/')
+            pattern = pattern.rstrip('/')
+            relative = '/' in pattern
+            pattern = pattern.lstrip('/')
+            if pattern:
+                yield root, pattern, relative, dirs_only
+
+    def match(self, path, is_dir):
+        for root, pattern, relative, dirs_only in self._patterns:
+            if dirs_only and not is_dir:
+                continue
+            if relative:
+                name = os.path.relpath(path, root).replace(os.sep, '/')
+            else:
+                name = os.path.basename(path)
+            if fnmatchcase(name, pattern):
+                return True
+        return False
+
+
+class _DirectoryScanner(object):
+    """Lists directories concurrently ahead of the directory traversal.
+
+    Listing a directory schedules listing its subdirectories so that the
+    whole tree is read in parallel. Results are consumed in the normal
+    depth-first order, so the created structure and logged messages do not
+    depend on the order in which listings finish.
+    """
+
+    def __init__(self, list_dir, max_workers=None):
+        self._list_dir = list_dir
+        self._pending = {}
+        self._executor = self._get_executor(max_workers)
+        self._stopped = False
+        self.files = 0
+        self.directories = 0
+
+    def _get_executor(self, max_workers):
+        if not ThreadPoolExecutor:
+            return None
+        if not max_workers:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(self, path, include_suites, ignores=None, background=True):
+        if self._executor and background and not self._stopped:
+            self._pending[path] = self._executor.submit(
+                self._list, path, include_suites, ignores)
+        else:
+            self._pending[path] = (include_suites, ignores)
+
+    def _list(self, path, include_suites, ignores):
+        listing = self._list_dir(path, include_suites, ignores)
+        for child, is_symlink in listing.subdirectories:
+            # Directories behind symlinks are listed only when they are
+            # needed to avoid following recursive links in the background.
+            self.submit(child, listing.include_suites, listing.ignores,
+                        background=not is_symlink)
+        return listing
+
+    def get(self, path):
+        pending = self._pending.pop(path)
+        if isinstance(pending, tuple):
+            listing = self._list(path, *pending)
+        else:
+            listing = pending.result()
+        self.directories += 1
+        self.files += sum(1 for _, kind in listing.entries
+                          if kind in ('file', 'init'))
+        return listing
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped = True
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+
 class SuiteStructureVisitor(object):
 
     def visit_file(self, structure):
@@ -134,6 +134,8 @@ Options
                           specified. Given path, similarly as paths given to
                           --log, --report and --xunit, is relative to
                           --outputdir unless given as an absolute path.
+                          If the name has extension `.gz`, `.bz2` or `.xz`,
+                          the file is compressed accordingly.
  -l --log file            HTML log file. Can be disabled by giving a special
                           name `NONE`. Default: log.html
                           Examples: `--log mylog.html`, `-l none`
@@ -150,6 +152,14 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split the log file into smaller pieces that open in
                           browsers transparently.
+    --lazylog             Store keywords of each test and suite setup and
+                          teardown in compressed data blocks inside the log
+                          file. Blocks are decompressed only when opened in
+                          the browser, which keeps opening huge logs fast.
+    --logcompressionlevel level  Compression level between 0 and 9 to use with
+                          long strings in the log and report files. Lower
+                          levels are faster but create bigger files.
+                          Default is 9.
     --logtitle title      Title for the generated log file. The default title
                           is `<SuiteName> Test Log`.
     --reporttitle title   Title for the generated report file. The default
@@ -28,12 +28,13 @@ from .stringcache import StringCache
 class JsBuildingContext(object):
 
     def __init__(self, log_path=None, split_log=False, expand_keywords=None,
-                 prune_input=False):
+                 prune_input=False, compress_level=9):
         # log_path can be a custom object in unit tests
         self._log_dir = dirname(log_path) if is_string(log_path) else None
         self._split_log = split_log
         self._prune_input = prune_input
-        self._strings = self._top_level_strings = StringCache()
+        self._compress_level = compress_level
+        self._strings = self._top_level_strings = StringCache(compress_level)
         self.basemillis = None
         self.split_results = []
         self.min_level = 'NONE'
@@ -92,7 +93,7 @@ class JsBuildingContext(object):
 
     def start_splitting_if_needed(self, split=False):
         if self._split_log and split:
-            self._strings = StringCache()
+            self._strings = StringCache(self._compress_level)
             return True
         return False
 
@@ -22,9 +22,10 @@ from .jsexecutionresult import JsExecutionResult
 class JsModelBuilder(object):
 
     def __init__(self, log_path=None, split_log=False, expand_keywords=None,
-                 prune_input_to_save_memory=False):
+                 prune_input_to_save_memory=False, compress_level=9):
         self._context = JsBuildingContext(log_path, split_log, expand_keywords,
-                                          prune_input_to_save_memory)
+                                          prune_input_to_save_memory,
+                                          compress_level)
 
     def build_from(self, result_from_xml):
         # Statistics must be build first because building suite may prune input.
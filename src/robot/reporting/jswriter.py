@@ -13,7 +13,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
+
 from robot.htmldata import JsonWriter
+from robot.utils import compress_text
 
 
 class JsResultWriter(object):
@@ -84,8 +87,10 @@ class SuiteWriter(object):
     def _write_parts_over_threshold(self, data, mapping):
         if not isinstance(data, tuple):
             return 1
-        not_written = 1 + sum(self._write_parts_over_threshold(item, mapping)
-                              for item in data)
+        not_written = 1 + len(data)
+        for item in data:
+            if isinstance(item, tuple):
+                not_written += self._write_parts_over_threshold(item, mapping) - 1
         if not_written > self._split_threshold:
             self._write_part(data, mapping)
             return 1
@@ -106,3 +111,20 @@ class SplitLogWriter(object):
         self._writer.write_json('window.keywords%d = ' % index, keywords)
         self._writer.write_json('window.strings%d = ' % index, strings)
         self._writer.write('window.fileLoading.notify("%s")' % notify)
+
+
+class DataBlockWriter(object):
+    """Writes split keywords and strings as compressed blocks into log.html.
+
+    Blocks use a non-JavaScript type so that browsers do not parse them when
+    the page is loaded. They are decompressed when their content is needed.
+    """
+    _block = '<script type="text/x-robot-data" id="robot-data-%d">%s</script>\n'
+
+    def __init__(self, output):
+        self._output = output
+
+    def write(self, split_results):
+        for index, (keywords, strings) in enumerate(split_results, start=1):
+            data = json.dumps([keywords, strings], separators=(',', ':'))
+            self._output.write(self._block % (index, compress_text(data)))
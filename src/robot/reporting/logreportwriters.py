@@ -18,7 +18,7 @@ from os.path import basename, splitext
 from robot.htmldata import HtmlFileWriter, ModelWriter, LOG, REPORT
 from robot.utils import file_writer, is_string
 
-from .jswriter import JsResultWriter, SplitLogWriter
+from .jswriter import DataBlockWriter, JsResultWriter, SplitLogWriter
 
 
 class _LogReportWriter(object):
@@ -41,7 +41,8 @@ class LogWriter(_LogReportWriter):
 
     def write(self, path, config):
         self._write_file(path, config, LOG)
-        if self._js_model.split_results:
+        lazy = config and config.get('lazyLog')
+        if self._js_model.split_results and not lazy:
             self._write_split_logs(splitext(path)[0])
 
     def _write_split_logs(self, base):
@@ -71,3 +72,5 @@ class RobotModelWriter(ModelWriter):
 
     def write(self, line):
         JsResultWriter(self._output).write(self._model, self._config)
+        if self._config and self._config.get('lazyLog'):
+            DataBlockWriter(self._output).write(self._model.split_results)
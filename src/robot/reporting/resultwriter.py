@@ -130,8 +130,10 @@ class Results(object):
     def js_result(self):
         if self._js_result is None:
             builder = JsModelBuilder(log_path=self._settings.log,
-                                     split_log=self._settings.split_log,
+                                     split_log=(self._settings.split_log or
+                                                self._settings.lazy_log),
                                      expand_keywords=self._settings.expand_keywords,
+                                     compress_level=self._settings.log_compression_level,
                                      prune_input_to_save_memory=self._prune)
             self._js_result = builder.build_from(self.result)
             if self._prune:
@@ -13,9 +13,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from collections import OrderedDict
+from hashlib import sha1
 
-from robot.utils import compress_text
+from robot.utils import PY3, compress_text, is_unicode
+
+try:
+    from multiprocessing import cpu_count
+    from multiprocessing.pool import ThreadPool
+except ImportError:    # Not available, for example, on Jython.
+    ThreadPool = None
 
 
 class StringIndex(int):
@@ -23,32 +29,96 @@ class StringIndex(int):
 
 
 class StringCache(object):
+    """Cache of strings in the log and report model.
+
+    Long strings are compressed in batches instead of one by one when they
+    are added. That allows compressing a batch in a pool of threads, and
+    compression itself releases the GIL. Only one batch of raw strings is
+    kept in memory at a time. Duplicates of long strings are detected using
+    their digests, so they are not compressed again. The same pool is used
+    with all batches and it is closed when the cache is dumped.
+    """
     _compress_threshold = 80
     _use_compressed_threshold = 1.1
+    _parallel_threshold = 1000
     _zero_index = StringIndex(0)
 
-    def __init__(self):
-        self._cache = OrderedDict({'*': self._zero_index})
+    def __init__(self, compress_level=9, workers=None):
+        self._cache = {'*': self._zero_index}
+        self._strings = ['*']
+        self._pending = []
+        self._pool = None
+        self._compress_level = compress_level
+        self._workers = workers if workers is not None else self._cpu_count()
+
+    def _cpu_count(self):
+        if ThreadPool is None:
+            return 1
+        try:
+            return cpu_count()
+        except NotImplementedError:
+            return 1
 
     def add(self, text):
         if not text:
             return self._zero_index
-        text = self._encode(text)
-        if text not in self._cache:
-            self._cache[text] = StringIndex(len(self._cache))
-        return self._cache[text]
+        raw = self._raw(text)
+        compress = len(raw) >= self._compress_threshold
+        key = self._digest(raw) if compress else raw
+        if key not in self._cache:
+            self._cache[key] = StringIndex(len(self._strings))
+            self._strings.append(raw)
+            if compress:
+                self._add_pending(self._cache[key])
+        return self._cache[key]
+
+    def _digest(self, raw):
+        if is_unicode(raw):
+            raw = raw.encode('UTF-8', 'surrogatepass' if PY3 else 'strict')
+        return sha1(raw).digest()
+
+    def _add_pending(self, index):
+        self._pending.append(index)
+        if len(self._pending) >= self._parallel_threshold:
+            self._encode_pending()
+
+    def _encode_pending(self):
+        raws = [self._strings[index] for index in self._pending]
+        for index, encoded in zip(self._pending, self._encode_all(raws)):
+            self._strings[index] = encoded
+        self._pending = []
 
     def _encode(self, text):
         raw = self._raw(text)
-        if raw in self._cache or len(raw) < self._compress_threshold:
+        if len(raw) < self._compress_threshold:
             return raw
-        compressed = compress_text(text)
+        compressed = compress_text(text, self._compress_level)
         if len(compressed) * self._use_compressed_threshold < len(raw):
             return compressed
         return raw
 
+    def _encode_raw(self, raw):
+        return self._encode(raw[1:])
+
     def _raw(self, text):
         return '*'+text
 
     def dump(self):
-        return tuple(self._cache)
+        try:
+            self._encode_pending()
+        finally:
+            self._close_pool()
+        return tuple(self._strings)
+
+    def _encode_all(self, raws):
+        if self._workers < 2 or len(raws) < self._parallel_threshold:
+            return [self._encode_raw(raw) for raw in raws]
+        if not self._pool:
+            self._pool = ThreadPool(self._workers)
+        return self._pool.map(self._encode_raw, raws, chunksize=256)
+
+    def _close_pool(self):
+        if self._pool:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
@@ -16,6 +16,9 @@
 from robot import model
 from robot.utils import is_string, secs_to_timestamp, timestamp_to_secs
 
+from .keywordremover import AllKeywordsRemover, KeywordRemover
+from .messagefilter import MessageFilter
+
 
 class SuiteConfigurer(model.SuiteConfigurer):
     """Result suite configured.
@@ -57,16 +60,81 @@ class SuiteConfigurer(model.SuiteConfigurer):
 
     def visit_suite(self, suite):
         model.SuiteConfigurer.visit_suite(self, suite)
-        self._remove_keywords(suite)
         self._set_times(suite)
-        suite.filter_messages(self.log_level)
+        self._process_keywords(suite)
 
-    def _remove_keywords(self, suite):
-        for how in self.remove_keywords:
-            suite.remove_keywords(how)
+    def _process_keywords(self, suite):
+        # Keywords are removed and messages filtered during one traversal.
+        visitors = [KeywordRemover(how) for how in self.remove_keywords]
+        if len(visitors) > 1 and any(isinstance(v, AllKeywordsRemover)
+                                     for v in visitors):
+            # Removing all keywords removes also warnings affecting what
+            # other removers remove. They need to see the end result.
+            for remover in visitors:
+                suite.visit(remover)
+            visitors = []
+        if (self.log_level or 'TRACE').upper() != 'TRACE':
+            visitors.append(MessageFilter(self.log_level))
+        if len(visitors) == 1:
+            suite.visit(visitors[0])
+        elif visitors:
+            suite.visit(VisitorChain(visitors))
 
     def _set_times(self, suite):
         if self.start_time:
             suite.starttime = self.start_time
         if self.end_time:
             suite.endtime = self.end_time
+
+
+class VisitorChain(model.SuiteVisitor):
+    """Runs multiple visitors during one traversal.
+
+    For each visited item, visitors' ``start_*`` methods are called in the
+    given order before visiting child items, and their ``end_*`` methods
+    after that. A visitor is not called with children of an item if its
+    ``start_*`` method returns ``False``. As a result, each visitor sees
+    each item in the same state as it would if visitors were run one after
+    another, as long as visitors do not depend on changes other visitors
+    make to child items.
+
+    Visitors overriding ``visit_*`` methods are not supported.
+    """
+
+    def __init__(self, visitors):
+        self._active = [list(visitors)]
+
+    def _start(self, name, item):
+        active = [visitor for visitor in self._active[-1]
+                  if getattr(visitor, name)(item) is not False]
+        if not active:
+            return False
+        self._active.append(active)
+
+    def _end(self, name, item):
+        for visitor in self._active.pop():
+            getattr(visitor, name)(item)
+
+    def start_suite(self, suite):
+        return self._start('start_suite', suite)
+
+    def end_suite(self, suite):
+        self._end('end_suite', suite)
+
+    def start_test(self, test):
+        return self._start('start_test', test)
+
+    def end_test(self, test):
+        self._end('end_test', test)
+
+    def start_keyword(self, keyword):
+        return self._start('start_keyword', keyword)
+
+    def end_keyword(self, keyword):
+        self._end('end_keyword', keyword)
+
+    def start_message(self, msg):
+        return self._start('start_message', msg)
+
+    def end_message(self, msg):
+        self._end('end_message', msg)
@@ -56,25 +56,44 @@ class _KeywordRemover(SuiteVisitor):
 
 class AllKeywordsRemover(_KeywordRemover):
 
-    def visit_keyword(self, keyword):
+    def start_keyword(self, keyword):
         self._clear_content(keyword)
+        return False
 
 
 class PassedKeywordRemover(_KeywordRemover):
 
+    def __init__(self):
+        _KeywordRemover.__init__(self)
+        self._suite_passed = []
+        self._test_passed = None
+
     def start_suite(self, suite):
-        if not suite.statistics.failed:
-            for keyword in suite.setup, suite.teardown:
-                if not self._warning_or_error(keyword):
-                    self._clear_content(keyword)
-
-    def visit_test(self, test):
-        if not self._failed_or_warning_or_error(test):
-            for keyword in test.keywords:
-                self._clear_content(keyword)
-
-    def visit_keyword(self, keyword):
-        pass
+        self._suite_passed.append(not suite.statistics.failed)
+
+    def end_suite(self, suite):
+        self._suite_passed.pop()
+
+    def start_test(self, test):
+        self._test_passed = not self._failed_or_warning_or_error(test)
+
+    def end_test(self, test):
+        self._test_passed = None
+
+    def start_keyword(self, keyword):
+        # Only suite and test level keywords are visited. Their content is
+        # cleared when they are visited, not already when their parent is,
+        # so that this remover can be combined with others.
+        if self._test_passed is not None:
+            remove = self._test_passed
+        elif self._suite_passed:
+            remove = (self._suite_passed[-1]
+                      and not self._warning_or_error(keyword))
+        else:
+            remove = False
+        if remove:
+            self._clear_content(keyword)
+        return False
 
 
 class ByNameKeywordRemover(_KeywordRemover):
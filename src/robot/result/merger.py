@@ -24,18 +24,30 @@ class Merger(SuiteVisitor):
         self.result = result
         self.current = None
         self.rpa = rpa
+        self._indexes = {}
 
-    def merge(self, merged):
-        self.result.set_execution_mode(merged)
-        merged.suite.visit(self)
-        self.result.errors.add(merged.errors)
+    def merge(self, *merged):
+        """Merges one or more results to the original result.
+
+        Items are looked up by name using indexes built once per suite, so
+        merging is linear to the number of suites and tests. Indexes are
+        valid only during one call, which allows modifying the original
+        result between calls.
+        """
+        try:
+            for result in merged:
+                self.result.set_execution_mode(result)
+                result.suite.visit(self)
+                self.result.errors.add(result.errors)
+        finally:
+            self._indexes.clear()
 
     def start_suite(self, suite):
         try:
             self.current = self._find_suite(self.current, suite.name)
         except IndexError:
             suite.message = self._create_add_message(suite, suite=True)
-            self.current.suites.append(suite)
+            self._add(self.current.suites, suite)
             return False
 
     def _find_suite(self, parent, name):
@@ -55,24 +67,42 @@ class Merger(SuiteVisitor):
         return root
 
     def _find(self, items, name):
-        for item in items:
-            if item.name == name:
-                return item
-        raise IndexError
+        return items[self._find_position(items, name)]
+
+    def _find_position(self, items, name):
+        try:
+            return self._get_index(items)[name]
+        except KeyError:
+            raise IndexError
+
+    def _get_index(self, items):
+        # Indexes are stored with the indexed list to keep its id reserved.
+        key = id(items)
+        if key not in self._indexes:
+            index = {}
+            for position, item in enumerate(items):
+                # Only the first item with a certain name can ever be found.
+                index.setdefault(item.name, position)
+            self._indexes[key] = (items, index)
+        return self._indexes[key][1]
+
+    def _add(self, items, item):
+        self._get_index(items).setdefault(item.name, len(items))
+        items.append(item)
 
     def end_suite(self, suite):
         self.current = self.current.parent
 
     def visit_test(self, test):
+        tests = self.current.tests
         try:
-            old = self._find(self.current.tests, test.name)
+            position = self._find_position(tests, test.name)
         except IndexError:
             test.message = self._create_add_message(test)
-            self.current.tests.append(test)
+            self._add(tests, test)
         else:
-            test.message = self._create_merge_message(test, old)
-            index = self.current.tests.index(old)
-            self.current.tests[index] = test
+            test.message = self._create_merge_message(test, tests[position])
+            tests[position] = test
 
     def _create_add_message(self, item, suite=False):
         if suite:
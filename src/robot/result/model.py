@@ -38,7 +38,7 @@ import warnings
 
 from robot import model
 from robot.model import TotalStatisticsBuilder, Messages, Keywords
-from robot.utils import get_elapsed_time, setter
+from robot.utils import get_elapsed_time, setter, MONOTONIC_CLOCK
 
 from .configurer import SuiteConfigurer
 from .messagefilter import MessageFilter
@@ -59,13 +59,74 @@ class Message(model.Message):
     __slots__ = []
 
 
-class Keyword(model.Keyword):
+class Timing(object):
+    """Mixin handling start and end times of keywords, tests and suites.
+
+    Times are either set as timestamps or recorded during execution using
+    :meth:`start_timer` and :meth:`end_timer`. In the latter case values are
+    stored as monotonic nanoseconds and timestamps are formatted only when
+    they are needed.
+    """
+    __slots__ = []
+
+    @property
+    def starttime(self):
+        """Execution start time in format ``%Y%m%d %H:%M:%S.%f``."""
+        if self._starttime is None and self._start_ns is not None:
+            self._starttime = MONOTONIC_CLOCK.timestamp(self._start_ns)
+        return self._starttime
+
+    @starttime.setter
+    def starttime(self, starttime):
+        self._starttime = starttime
+        self._start_ns = None
+
+    @property
+    def endtime(self):
+        """Execution end time in format ``%Y%m%d %H:%M:%S.%f``."""
+        if self._endtime is None and self._end_ns is not None:
+            self._endtime = MONOTONIC_CLOCK.timestamp(self._end_ns)
+        return self._endtime
+
+    @endtime.setter
+    def endtime(self, endtime):
+        self._endtime = endtime
+        self._end_ns = None
+
+    @property
+    def elapsed_ns(self):
+        """Execution time in nanoseconds or ``None`` if it is not known.
+
+        Available only when the time has been measured using the monotonic
+        clock with :meth:`start_timer` and :meth:`end_timer`.
+        """
+        if self._start_ns is None or self._end_ns is None:
+            return None
+        return self._end_ns - self._start_ns
+
+    def start_timer(self):
+        """Sets start time to the current time. Internal usage only."""
+        self._starttime = None
+        self._start_ns = MONOTONIC_CLOCK.now()
+
+    def end_timer(self):
+        """Sets end time to the current time. Internal usage only."""
+        self._endtime = None
+        self._end_ns = MONOTONIC_CLOCK.now()
+
+    def _get_elapsed_time(self):
+        if self._start_ns is not None and self._end_ns is not None:
+            return MONOTONIC_CLOCK.elapsed_millis(self._start_ns, self._end_ns)
+        return get_elapsed_time(self.starttime, self.endtime)
+
+
+class Keyword(Timing, model.Keyword):
     """Represents results of a single keyword.
 
     See the base class for documentation of attributes not documented here.
     """
-    __slots__ = ['kwname', 'libname', 'status', 'starttime', 'endtime', 'message',
-                 'lineno', 'source']
+    __slots__ = ['kwname', 'libname', 'status', '_starttime', '_start_ns',
+                 '_endtime', '_end_ns', 'message', 'lineno', 'source']
     keyword_class = None        #: Internal usage only.
     message_class = Message     #: Internal usage only.
 
@@ -82,9 +143,7 @@ class Keyword(model.Keyword):
         #: Execution status as a string. Typically ``PASS``, ``FAIL`` or ``SKIP``,
         #: but library keywords have status ``NOT_RUN`` in the dry-ryn mode.
         self.status = status
-        #: Keyword execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Keyword execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
         #: Keyword status message. Used only if suite teardowns fails.
         self.message = ''
@@ -113,7 +172,7 @@ class Keyword(model.Keyword):
     @property
     def elapsedtime(self):
         """Total execution time in milliseconds."""
-        return get_elapsed_time(self.starttime, self.endtime)
+        return self._get_elapsed_time()
 
     @property
     def name(self):
@@ -164,12 +223,13 @@ class Keyword(model.Keyword):
         self.status = 'SKIP'
 
 
-class TestCase(model.TestCase):
+class TestCase(Timing, model.TestCase):
     """Represents results of a single test case.
 
     See the base class for documentation of attributes not documented here.
     """
-    __slots__ = ['status', 'message', 'starttime', 'endtime']
+    __slots__ = ['status', 'message', '_starttime', '_start_ns', '_endtime',
+                 '_end_ns']
     keyword_class = Keyword
 
     def __init__(self, name='', doc='', tags=None, timeout=None, status='FAIL',
@@ -180,15 +240,13 @@ class TestCase(model.TestCase):
         #: Test message. Typically a failure message but can be set also when
         #: test passes.
         self.message = message
-        #: Test case execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Test case execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
 
     @property
     def elapsedtime(self):
         """Total execution time in milliseconds."""
-        return get_elapsed_time(self.starttime, self.endtime)
+        return self._get_elapsed_time()
 
     @property
     def passed(self):
@@ -231,12 +289,12 @@ class TestCase(model.TestCase):
         return True
 
 
-class TestSuite(model.TestSuite):
+class TestSuite(Timing, model.TestSuite):
     """Represents results of a single test suite.
 
     See the base class for documentation of attributes not documented here.
     """
-    __slots__ = ['message', 'starttime', 'endtime']
+    __slots__ = ['message', '_starttime', '_start_ns', '_endtime', '_end_ns']
     test_class = TestCase
     keyword_class = Keyword
 
@@ -245,9 +303,7 @@ class TestSuite(model.TestSuite):
         model.TestSuite.__init__(self, name, doc, metadata, source, rpa)
         #: Possible suite setup or teardown error message.
         self.message = message
-        #: Suite execution start time in format ``%Y%m%d %H:%M:%S.%f``.
         self.starttime = starttime
-        #: Suite execution end time in format ``%Y%m%d %H:%M:%S.%f``.
         self.endtime = endtime
 
     @property
@@ -311,7 +367,7 @@ class TestSuite(model.TestSuite):
     def elapsedtime(self):
         """Total execution time in milliseconds."""
         if self.starttime and self.endtime:
-            return get_elapsed_time(self.starttime, self.endtime)
+            return self._get_elapsed_time()
         return sum(child.elapsedtime for child in
                    chain(self.suites, self.tests, (self.setup, self.teardown)))
 
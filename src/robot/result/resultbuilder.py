@@ -13,6 +13,9 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os.path
+from itertools import chain
+
 from robot.errors import DataError
 from robot.model import SuiteVisitor
 from robot.utils import ET, ETSource, get_error_message, unic
@@ -112,6 +115,7 @@ class ExecutionResultBuilder(object):
 
     def _parse(self, source, start, end):
         context = ET.iterparse(source, events=('start', 'end'))
+        context = self._include_split_outputs(context)
         if not self._include_keywords:
             context = self._omit_keywords(context)
         elif self._flattened_keywords:
@@ -123,6 +127,38 @@ class ExecutionResultBuilder(object):
                 end(elem)
                 elem.clear()
 
+    def _include_split_outputs(self, context):
+        event, root = next(context)
+        if root.get('split') == 'true':
+            context = self._read_split_outputs(context, self._get_directory())
+        return chain([(event, root)], context)
+
+    def _get_directory(self):
+        source = unic(self._source)
+        if os.path.isfile(source):
+            return os.path.dirname(os.path.abspath(source))
+        return os.getcwd()
+
+    def _read_split_outputs(self, context, directory):
+        # Placeholder suites are replaced with root suites of referenced
+        # outputs. Rest of these outputs, statistics and errors, is ignored.
+        for event, elem in context:
+            if elem.tag != 'suite' or not elem.get('file'):
+                yield event, elem
+            elif event == 'start':
+                path = os.path.join(directory, elem.get('file'))
+                with ETSource(path) as source:
+                    split = ET.iterparse(source, events=('start', 'end'))
+                    next(split)
+                    event, suite = next(split)
+                    yield event, suite
+                    for event, elem in split:
+                        yield event, elem
+                        if elem is suite:
+                            break
+            else:
+                elem.clear()
+
     def _omit_keywords(self, context):
         omitted_kws = 0
         for event, elem in context:
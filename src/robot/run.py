@@ -169,8 +169,10 @@ Options
                           relative to --outputdir unless given as an absolute
                           path. Other output files are created based on XML
                           output files after the test execution and XML outputs
-                          can also be further processed with Rebot tool. Can be
-                          disabled by giving a special value `NONE`.
+                          can also be further processed with Rebot tool. If
+                          the name has extension `.gz`, `.bz2` or `.xz`, the
+                          file is compressed accordingly. Can be disabled by
+                          giving a special value `NONE`.
                           Default: output.xml
  -l --log file            HTML log file. Can be disabled by giving a special
                           value `NONE`. Default: log.html
@@ -182,6 +184,17 @@ Options
     --xunitskipnoncritical  Deprecated since RF 4.0 and has no effect anymore.
  -b --debugfile file      Debug file written during execution. Not created
                           unless this option is specified.
+    --preciseelapsed      Write elapsed times of keywords, tests and suites to
+                          the output file with microsecond precision. They
+                          are written in milliseconds to the `elapsedtime`
+                          attribute of `status` elements.
+    --outputsplit         Write each child suite of the top level suite into
+                          its own output file. Files are named like
+                          `output-1.xml` based on the main output file that
+                          references them and also contains statistics and
+                          errors. Rebot and other tools reading outputs
+                          process them transparently, and each part is a
+                          valid output file also alone.
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -190,6 +203,14 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split the log file into smaller pieces that open in
                           browsers transparently.
+    --lazylog             Store keywords of each test and suite setup and
+                          teardown in compressed data blocks inside the log
+                          file. Blocks are decompressed only when opened in
+                          the browser, which keeps opening huge logs fast.
+    --logcompressionlevel level  Compression level between 0 and 9 to use with
+                          long strings in the log and report files. Lower
+                          levels are faster but create bigger files.
+                          Default is 9.
     --logtitle title      Title for the generated log file. The default title
                           is `<SuiteName> Test Log`.
     --reporttitle title   Title for the generated report file. The default
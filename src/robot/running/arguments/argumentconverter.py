@@ -19,51 +19,95 @@ from .typeconverters import TypeConverter
 
 
 class ArgumentConverter(object):
+    """Converts arguments based on a conversion plan compiled from a spec.
+
+    The plan contains resolved converters for each argument that has type
+    information or a default value, so converting arguments does not need
+    to look at the spec at all. Arguments without converters are returned
+    as-is and if no argument has a converter, :meth:`convert` does nothing.
+    Converters are cached by :class:`ArgumentSpec` and thus the plan is
+    compiled only once per spec.
+    """
 
     def __init__(self, argspec, dry_run=False):
         """:type argspec: :py:class:`robot.running.arguments.ArgumentSpec`"""
-        self._argspec = argspec
         self._dry_run = dry_run
+        get = self._get_conversion
+        self._positional = [get(argspec, name) for name in argspec.positional]
+        self._var_positional = get(argspec, argspec.var_positional)
+        self._has_var_positional = bool(argspec.var_positional)
+        self._named = dict((name, get(argspec, name))
+                           for name in argspec.positional + argspec.named_only)
+        self._var_named = get(argspec, argspec.var_named)
+        self.noop = not (any(self._positional) or self._var_positional
+                         or any(self._named.values()) or self._var_named)
+
+    def _get_conversion(self, spec, name):
+        if spec.types is None or name is None:
+            return None
+        converter = default_converter = None
+        if name in spec.types:
+            converter = TypeConverter.converter_for(spec.types[name])
+        if name in spec.defaults:
+            default_converter \
+                = TypeConverter.converter_for(type(spec.defaults[name]))
+        if not (converter or default_converter):
+            return None
+        return _Conversion(name, converter, default_converter, self._dry_run)
 
     def convert(self, positional, named):
+        if self.noop:
+            return positional, named
         return self._convert_positional(positional), self._convert_named(named)
 
     def _convert_positional(self, positional):
-        names = self._argspec.positional
-        converted = [self._convert(name, value)
-                     for name, value in zip(names, positional)]
-        if self._argspec.var_positional:
-            converted.extend(self._convert(self._argspec.var_positional, value)
-                             for value in positional[len(names):])
+        converted = [conversion.convert(value) if conversion else value
+                     for conversion, value in zip(self._positional, positional)]
+        if self._has_var_positional:
+            conversion = self._var_positional
+            extra = positional[len(converted):]
+            if conversion:
+                extra = [conversion.convert(value) for value in extra]
+            converted.extend(extra)
         return converted
 
     def _convert_named(self, named):
-        names = set(self._argspec.positional) | set(self._argspec.named_only)
-        var_named = self._argspec.var_named
-        return [(name, self._convert(name if name in names else var_named, value))
-                for name, value in named]
+        get = self._named.get
+        var_named = self._var_named
+        converted = []
+        for name, value in named:
+            conversion = get(name, var_named)
+            converted.append((name, conversion.convert(value)
+                              if conversion else value))
+        return converted
+
 
-    def _convert(self, name, value):
-        spec = self._argspec
-        if (spec.types is None
-                or self._dry_run and contains_variable(value, identifiers='$@&%')):
+class _Conversion(object):
+    __slots__ = ['_name', '_converter', '_default_converter', '_dry_run']
+
+    def __init__(self, name, converter, default_converter, dry_run=False):
+        self._name = name
+        self._converter = converter
+        self._default_converter = default_converter
+        self._dry_run = dry_run
+
+    def convert(self, value):
+        if self._dry_run and contains_variable(value, identifiers='$@&%'):
             return value
         conversion_error = None
-        if name in spec.types:
-            converter = TypeConverter.converter_for(spec.types[name])
-            if converter:
-                try:
-                    return converter.convert(name, value)
-                except ValueError as err:
-                    conversion_error = err
-        if name in spec.defaults:
-            converter = TypeConverter.converter_for(type(spec.defaults[name]))
-            if converter:
-                try:
-                    return converter.convert(name, value, explicit_type=False,
-                                             strict=bool(conversion_error))
-                except ValueError as err:
-                    conversion_error = conversion_error or err
+        if self._converter:
+            try:
+                return self._converter.convert(self._name, value)
+            except ValueError as err:
+                conversion_error = err
+        if self._default_converter:
+            try:
+                return self._default_converter.convert(
+                    self._name, value, explicit_type=False,
+                    strict=bool(conversion_error)
+                )
+            except ValueError as err:
+                conversion_error = conversion_error or err
         if conversion_error:
             raise conversion_error
         return value
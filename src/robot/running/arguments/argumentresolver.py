@@ -15,7 +15,7 @@
 
 from robot.errors import DataError
 from robot.utils import is_string, is_dict_like, split_from_equals
-from robot.variables import is_dict_variable
+from robot.variables import is_dict_variable, is_list_variable
 
 from .argumentvalidator import ArgumentValidator
 
@@ -40,6 +40,49 @@ class ArgumentResolver(object):
         return positional, named
 
 
+class PositionalCallCache(object):
+    """Remembers which argument tuples can be resolved as plain positional calls.
+
+    Arguments without named argument syntax and without list or dictionary
+    variables always produce the same number of positional arguments and no
+    named arguments. Validating such calls depends only on the argument
+    count, so the result can be cached and the full resolution skipped.
+    """
+    _max_size = 1000
+
+    def __init__(self, argspec):
+        """:type argspec: :py:class:`robot.running.arguments.ArgumentSpec`"""
+        self._argspec = argspec
+        self._cache = {}
+
+    def __contains__(self, arguments):
+        try:
+            return self._cache[arguments]
+        except KeyError:
+            pass
+        except TypeError:    # Unhashable arguments, e.g. a list.
+            return False
+        positional = self._is_positional_call(arguments)
+        if len(self._cache) < self._max_size:
+            self._cache[arguments] = positional
+        return positional
+
+    def _is_positional_call(self, arguments):
+        if any(self._is_special(arg) for arg in arguments):
+            return False
+        spec = self._argspec
+        count = len(arguments)
+        defaults = spec.defaults
+        return (spec.minargs <= count <= spec.maxargs and
+                all(name in defaults for name in spec.positional[count:]) and
+                all(name in defaults for name in spec.named_only))
+
+    def _is_special(self, arg):
+        return (split_from_equals(arg)[1] is not None or
+                is_list_variable(arg) or
+                is_dict_variable(arg))
+
+
 class NamedArgumentResolver(object):
 
     def __init__(self, argspec):
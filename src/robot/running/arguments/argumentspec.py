@@ -33,7 +33,7 @@ from robot.utils import setter, py2to3, unicode, unic
 
 from .argumentconverter import ArgumentConverter
 from .argumentmapper import ArgumentMapper
-from .argumentresolver import ArgumentResolver
+from .argumentresolver import ArgumentResolver, PositionalCallCache
 from .typevalidator import TypeValidator
 
 
@@ -52,9 +52,11 @@ class ArgumentSpec(object):
         self.var_named = var_named
         self.defaults = defaults or {}
         self.types = types
+        self._positional_calls = PositionalCallCache(self)
 
     @setter
     def types(self, types):
+        self._converters = {}
         return TypeValidator(self).validate(types)
 
     @property
@@ -79,14 +81,25 @@ class ArgumentSpec(object):
 
     def resolve(self, arguments, variables=None, resolve_named=True,
                 resolve_variables_until=None, dict_to_kwargs=False):
-        resolver = ArgumentResolver(self, resolve_named,
-                                    resolve_variables_until, dict_to_kwargs)
-        positional, named = resolver.resolve(arguments, variables)
+        if (variables and resolve_named and resolve_variables_until is None
+                and not dict_to_kwargs and arguments in self._positional_calls):
+            positional, named = variables.replace_list(arguments), []
+        else:
+            resolver = ArgumentResolver(self, resolve_named,
+                                        resolve_variables_until, dict_to_kwargs)
+            positional, named = resolver.resolve(arguments, variables)
         if self.types or self.defaults:
-            converter = ArgumentConverter(self, dry_run=not variables)
+            converter = self._get_converter(dry_run=not variables)
             positional, named = converter.convert(positional, named)
         return positional, named
 
+    def _get_converter(self, dry_run):
+        # Converters are created when first needed, after argument parsers
+        # have finished populating the spec, and recreated if types change.
+        if dry_run not in self._converters:
+            self._converters[dry_run] = ArgumentConverter(self, dry_run)
+        return self._converters[dry_run]
+
     def map(self, positional, named, replace_defaults=True):
         mapper = ArgumentMapper(self)
         return mapper.map(positional, named, replace_defaults)
@@ -13,16 +13,82 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import inspect
 from contextlib import contextmanager
 
+try:
+    import asyncio
+except ImportError:    # Python 2
+    asyncio = None
+
 from robot.errors import DataError
 from robot.utils import unic
 
 
+class Asynchronous(object):
+    """Runs coroutines returned by keywords in a shared event loop.
+
+    The loop is created when it is needed the first time and it is kept
+    open until the execution ends. That allows async libraries to, for
+    example, reuse connection pools bound to the loop between keywords.
+    """
+
+    def __init__(self):
+        self._loop = None
+
+    @property
+    def event_loop(self):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    def is_loop_required(self, obj):
+        if asyncio is None or not inspect.iscoroutine(obj):
+            return False
+        # If a loop is already running, e.g. when a keyword is run by an
+        # async listener, the caller is responsible for awaiting.
+        return asyncio._get_running_loop() is None
+
+    def run_until_complete(self, coroutine):
+        task = self.event_loop.create_task(coroutine)
+        try:
+            return self.event_loop.run_until_complete(task)
+        except BaseException:
+            # Timeouts and stopping execution interrupt the loop. Cancel
+            # the task so that it does not continue when the loop is used
+            # again by subsequent keywords.
+            task.cancel()
+            raise
+
+    def close_loop(self):
+        if self._loop is None:
+            return
+        loop, self._loop = self._loop, None
+        try:
+            tasks = [task for task in self._get_all_tasks(loop)
+                     if not task.done()]
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(
+                    asyncio.gather(*tasks, return_exceptions=True)
+                )
+            if hasattr(loop, 'shutdown_asyncgens'):    # Python 3.6+
+                loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+    def _get_all_tasks(self, loop):
+        if hasattr(asyncio, 'all_tasks'):    # Python 3.7+
+            return asyncio.all_tasks(loop)
+        return asyncio.Task.all_tasks(loop)
+
+
 class ExecutionContexts(object):
 
     def __init__(self):
         self._contexts = []
+        self.asynchronous = Asynchronous()
 
     @property
     def current(self):
@@ -46,6 +112,8 @@ class ExecutionContexts(object):
 
     def end_suite(self):
         self._contexts.pop()
+        if not self._contexts:
+            self.asynchronous.close_loop()
 
 
 # This is ugly but currently needed e.g. by BuiltIn
@@ -68,6 +136,10 @@ class _ExecutionContext(object):
         self._started_keywords = 0
         self.timeout_occurred = False
 
+    @property
+    def asynchronous(self):
+        return EXECUTION_CONTEXTS.asynchronous
+
     @contextmanager
     def suite_teardown(self):
         self.in_suite_teardown = True
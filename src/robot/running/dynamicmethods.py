@@ -15,7 +15,8 @@
 
 from robot.errors import DataError
 from robot.utils import (get_error_message, is_java_method, is_bytes,
-                         is_list_like, is_unicode, type_name, py2to3)
+                         is_dict_like, is_list_like, is_unicode, type_name,
+                         py2to3)
 
 from .arguments import JavaArgumentParser, PythonArgumentParser
 
@@ -27,9 +28,11 @@ def no_dynamic_method(*args):
 @py2to3
 class _DynamicMethod(object):
     _underscore_name = NotImplemented
+    _information_key = None
 
-    def __init__(self, lib):
+    def __init__(self, lib, information=None):
         self.method = self._get_method(lib)
+        self._information = information or {}
 
     def _get_method(self, lib):
         for name in self._underscore_name, self._camelCaseName:
@@ -48,12 +51,28 @@ class _DynamicMethod(object):
         return self.method.__name__
 
     def __call__(self, *args):
+        if args and self._has_information(args[0]):
+            return self._get_from_information(args[0])
         try:
             return self._handle_return_value(self.method(*args))
         except:
             raise DataError("Calling dynamic method '%s' failed: %s"
                             % (self.name, get_error_message()))
 
+    def _has_information(self, name):
+        return self._information_key in self._information.get(name, ())
+
+    def _get_from_information(self, name):
+        try:
+            value = self._information[name][self._information_key]
+            return self._handle_return_value(value)
+        except:
+            raise DataError("Invalid '%s' information for keyword '%s' "
+                            "returned by dynamic method "
+                            "'get_library_information': %s"
+                            % (self._information_key, name,
+                               get_error_message()))
+
     def _handle_return_value(self, value):
         raise NotImplementedError
 
@@ -89,6 +108,25 @@ class _DynamicMethod(object):
         return self.method is not no_dynamic_method
 
 
+class GetLibraryInformation(_DynamicMethod):
+    _underscore_name = 'get_library_information'
+
+    def _handle_return_value(self, value):
+        if value is None:
+            return {}
+        if not is_dict_like(value):
+            raise DataError('Return value must be a dictionary, got %s.'
+                            % type_name(value))
+        information = {}
+        for name in value:
+            if not is_dict_like(value[name]):
+                raise DataError("Information for keyword '%s' must be "
+                                "a dictionary, got %s."
+                                % (name, type_name(value[name])))
+            information[self._to_string(name)] = value[name]
+        return information
+
+
 class GetKeywordNames(_DynamicMethod):
     _underscore_name = 'get_keyword_names'
 
@@ -133,6 +171,7 @@ class RunKeyword(_DynamicMethod):
 
 class GetKeywordDocumentation(_DynamicMethod):
     _underscore_name = 'get_keyword_documentation'
+    _information_key = 'doc'
 
     def _handle_return_value(self, value):
         return self._to_string(value or '')
@@ -140,9 +179,10 @@ class GetKeywordDocumentation(_DynamicMethod):
 
 class GetKeywordArguments(_DynamicMethod):
     _underscore_name = 'get_keyword_arguments'
+    _information_key = 'args'
 
-    def __init__(self, lib):
-        _DynamicMethod.__init__(self, lib)
+    def __init__(self, lib, information=None):
+        _DynamicMethod.__init__(self, lib, information)
         self._supports_kwargs = RunKeyword(lib).supports_kwargs
 
     def _handle_return_value(self, value):
@@ -155,13 +195,15 @@ class GetKeywordArguments(_DynamicMethod):
 
 class GetKeywordTypes(_DynamicMethod):
     _underscore_name = 'get_keyword_types'
+    _information_key = 'types'
 
     def _handle_return_value(self, value):
-        return value if self else {}
+        return value if self or value is not None else {}
 
 
 class GetKeywordTags(_DynamicMethod):
     _underscore_name = 'get_keyword_tags'
+    _information_key = 'tags'
 
     def _handle_return_value(self, value):
         return self._to_list_of_strings(value)
@@ -169,6 +211,7 @@ class GetKeywordTags(_DynamicMethod):
 
 class GetKeywordSource(_DynamicMethod):
     _underscore_name = 'get_keyword_source'
+    _information_key = 'source'
 
     def _handle_return_value(self, value):
         return self._to_string(value, allow_none=True)
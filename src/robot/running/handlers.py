@@ -46,11 +46,43 @@ def DynamicHandler(library, name, method, doc, argspec, tags=None):
     return _DynamicHandler(library, name, method, doc, argspec, tags)
 
 
+def get_keyword_name(handler_name, handler_method):
+    robot_name = getattr(handler_method, 'robot_name', None)
+    name = robot_name or printable_name(handler_name, code_style=True)
+    if not name:
+        raise DataError('Keyword name cannot be empty.')
+    return name
+
+
 def InitHandler(library, method=None, docgetter=None):
     Init = _PythonInitHandler if not is_java_init(method) else _JavaInitHandler
     return Init(library, '__init__', method, docgetter)
 
 
+class LazyHandler(object):
+    """Placeholder for a library keyword that is created when first needed.
+
+    Only the keyword name is resolved when the library is imported. Parsing
+    arguments, documentation and tags is postponed until the keyword is used.
+    """
+
+    def __init__(self, library, name, handler_name, handler_method):
+        self.library = library
+        self.name = name
+        self._handler_name = handler_name
+        self._handler_method = handler_method
+
+    def create(self):
+        """Creates the actual handler or returns ``None`` if creation fails.
+
+        Possible errors are reported by the library the same way as when
+        handlers are created eagerly.
+        """
+        handler, _ = self.library._try_to_create_handler(self._handler_name,
+                                                         self._handler_method)
+        return handler
+
+
 class _RunnableHandler(object):
 
     def __init__(self, library, handler_name, handler_method, doc='', tags=None):
@@ -68,11 +100,7 @@ class _RunnableHandler(object):
                          tuple(tags or ()))
 
     def _get_name(self, handler_name, handler_method):
-        robot_name = getattr(handler_method, 'robot_name', None)
-        name = robot_name or printable_name(handler_name, code_style=True)
-        if not name:
-            raise DataError('Keyword name cannot be empty.')
-        return name
+        return get_keyword_name(handler_name, handler_method)
 
     def _parse_arguments(self, handler_method):
         raise NotImplementedError
@@ -213,7 +241,8 @@ class _DynamicHandler(_RunnableHandler):
                 raise DataError("Too few '%s' method parameters for "
                                 "keyword-only arguments support."
                                 % self._run_keyword_method_name)
-        get_keyword_types = GetKeywordTypes(self.library.get_instance())
+        get_keyword_types = GetKeywordTypes(self.library.get_instance(),
+                                            self.library.information)
         spec.types = get_keyword_types(self._handler_name)
         return spec
 
@@ -224,7 +253,8 @@ class _DynamicHandler(_RunnableHandler):
         return self._source_info[0]
 
     def _get_source_info(self):
-        get_keyword_source = GetKeywordSource(self.library.get_instance())
+        get_keyword_source = GetKeywordSource(self.library.get_instance(),
+                                              self.library.information)
         try:
             source = get_keyword_source(self._handler_name)
         except DataError as err:
@@ -18,6 +18,7 @@ from operator import attrgetter
 from robot.errors import DataError, KeywordError
 from robot.utils import NormalizedDict
 
+from .handlers import LazyHandler
 from .usererrorhandler import UserErrorHandler
 
 
@@ -31,8 +32,11 @@ class HandlerStore(object):
         self.source_type = source_type
         self._normal = NormalizedDict(ignore='_')
         self._embedded = []
+        self._lazy = []
 
     def add(self, handler, embedded=False):
+        if isinstance(handler, LazyHandler):
+            self._lazy.append(handler)
         if embedded:
             self._embedded.append(handler)
         elif handler.name not in self._normal:
@@ -44,6 +48,7 @@ class HandlerStore(object):
             raise error
 
     def __iter__(self):
+        self._create_all_lazy()
         handlers = list(self._normal.values()) + self._embedded
         return iter(sorted(handlers, key=attrgetter('name')))
 
@@ -51,7 +56,7 @@ class HandlerStore(object):
         return len(self._normal) + len(self._embedded)
 
     def __contains__(self, name):
-        if name in self._normal:
+        if self._get_normal(name):
             return True
         return any(template.matches(name) for template in self._embedded)
 
@@ -59,10 +64,32 @@ class HandlerStore(object):
         return self[name].create_runner(name)
 
     def __getitem__(self, name):
-        try:
-            return self._normal[name]
-        except KeyError:
-            return self._find_embedded(name)
+        return self._get_normal(name) or self._find_embedded(name)
+
+    def _get_normal(self, name):
+        handler = self._normal.get(name)
+        if isinstance(handler, LazyHandler):
+            handler = self._create_lazy(handler)
+        return handler
+
+    def _create_all_lazy(self):
+        # Lazy handlers are created in the order they were added so that
+        # possible errors are reported in the same order as when creating
+        # all handlers eagerly.
+        for lazy in self._lazy:
+            if self._normal.get(lazy.name) is lazy:
+                self._create_lazy(lazy)
+        self._lazy = []
+
+    def _create_lazy(self, lazy):
+        handler = lazy.create()
+        if handler:
+            self._normal[lazy.name] = handler
+        else:
+            self._normal.pop(lazy.name)
+            if not self:
+                lazy.library.report_no_keywords()
+        return handler
 
     def _find_embedded(self, name):
         embedded = [template for template in self._embedded
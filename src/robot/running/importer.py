@@ -20,10 +20,13 @@ import os
 from robot.output import LOGGER
 from robot.errors import FrameworkError, DataError
 from robot.utils import normpath, seq2str, seq2str2, is_string
+from robot.variables import contains_variable
 
 from .builder import ResourceFileBuilder
+from .context import EXECUTION_CONTEXTS
 from .handlerstore import HandlerStore
 from .testlibraries import TestLibrary
+from .userkeyword import UserLibrary
 
 
 RESOURCE_EXTENSIONS = ('.resource', '.robot', '.txt', '.tsv', '.rst', '.rest')
@@ -33,7 +36,9 @@ class Importer(object):
 
     def __init__(self):
         self._library_cache = ImportCache()
+        self._library_import_cache = {}
         self._resource_cache = ImportCache()
+        self._user_library_cache = ImportCache()
 
     def reset(self):
         self.__init__()
@@ -43,9 +48,17 @@ class Importer(object):
             lib.close_global_listeners()
 
     def import_library(self, name, args, alias, variables):
-        lib = TestLibrary(name, args, variables, create_handlers=False)
-        positional, named = lib.positional_args, lib.named_args
-        lib = self._import_library(name, positional, named, lib)
+        key = self._get_library_import_key(name, args)
+        if key in self._library_import_cache:
+            lib = self._library_import_cache[key]
+            self._log_library_found_from_cache(name, lib.positional_args,
+                                               lib.named_args)
+        else:
+            lib = TestLibrary(name, args, variables, create_handlers=False)
+            positional, named = lib.positional_args, lib.named_args
+            lib = self._import_library(name, positional, named, lib)
+            if key:
+                self._library_import_cache[key] = lib
         if alias:
             alias = variables.replace_scalar(alias)
             lib = self._copy_library(lib, alias)
@@ -61,6 +74,18 @@ class Importer(object):
             self._resource_cache[path] = resource
         return self._resource_cache[path]
 
+    def import_user_library(self, resource):
+        # Keywords in a resource file do not depend on the importing suite,
+        # so all suites importing the same file can share them.
+        path = resource.source
+        if path in self._user_library_cache:
+            library = self._user_library_cache[path]
+            library.log_errors()
+        else:
+            library = UserLibrary(resource)
+            self._user_library_cache[path] = library
+        return library
+
     def _validate_resource_extension(self, path):
         extension = os.path.splitext(path)[1]
         if extension.lower() not in RESOURCE_EXTENSIONS:
@@ -68,18 +93,35 @@ class Importer(object):
                             "Supported extensions are %s."
                             % (extension, seq2str(RESOURCE_EXTENSIONS)))
 
+    def _get_library_import_key(self, name, args):
+        # Libraries imported by name using arguments without variables can be
+        # got from the cache without creating and resolving them again.
+        # Libraries imported by path are excluded because their modules are
+        # always imported again.
+        args = tuple(args or ())
+        if os.path.exists(name):
+            return None
+        if not all(is_string(a) and not contains_variable(a) for a in args):
+            return None
+        return (name, args)
+
     def _import_library(self, name, positional, named, lib):
-        args = positional + ['%s=%s' % arg for arg in named]
         key = (name, positional, named)
         if key in self._library_cache:
-            LOGGER.info("Found test library '%s' with arguments %s from cache"
-                        % (name, seq2str2(args)))
+            self._log_library_found_from_cache(name, positional, named)
             return self._library_cache[key]
-        lib.create_handlers()
+        context = EXECUTION_CONTEXTS.current
+        lib.create_handlers(lazy=bool(context and not context.dry_run))
         self._library_cache[key] = lib
+        args = positional + ['%s=%s' % arg for arg in named]
         self._log_imported_library(name, args, lib)
         return lib
 
+    def _log_library_found_from_cache(self, name, positional, named):
+        args = positional + ['%s=%s' % arg for arg in named]
+        LOGGER.info("Found test library '%s' with arguments %s from cache"
+                    % (name, seq2str2(args)))
+
     def _log_imported_library(self, name, args, lib):
         type = lib.__class__.__name__.replace('Library', '').lower()[1:]
         listener = ', with listener' if lib.has_listener else ''
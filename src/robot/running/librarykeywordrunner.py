@@ -17,7 +17,7 @@ from robot.errors import DataError
 from robot.model import Keywords
 from robot.output import LOGGER
 from robot.result import Keyword as KeywordResult
-from robot.utils import prepr, unic
+from robot.utils import MAX_FORMATTED_LENGTH, prepr, unic
 from robot.variables import (contains_variable, is_list_variable,
                              VariableAssignment)
 
@@ -55,6 +55,34 @@ class LibraryKeywordRunner(object):
                 assigner.assign(return_value)
                 return return_value
 
+    def resolve(self, context, args):
+        """Returns the handler to call and the arguments to call it with.
+
+        Together with :meth:`report` this allows calling the handler
+        elsewhere, for example, in another thread. Returns a tuple
+        ``(handler, positional, named)`` where ``named`` is a list of
+        name-value pairs. Invalid arguments cause a ``DataError``.
+        """
+        positional, named = self._resolve_arguments(context, args)
+        return self._handler.current_handler(), positional, named
+
+    def report(self, kw, context, outcome, positional=None, named=None):
+        """Reports running ``kw`` after its handler has been called elsewhere.
+
+        ``outcome`` is called inside the keyword result after pre-run
+        messages and, if resolved arguments are given, trace logging of
+        the arguments. It can log messages and fail the keyword by raising
+        an exception.
+        """
+        result = self._get_result(kw, VariableAssignment(()))
+        with StatusReporter(context, result):
+            self._log_pre_run_messages(context)
+            if positional is not None:
+                context.output.trace(
+                    lambda: self._trace_log_args(positional, named)
+                )
+            outcome()
+
     def _get_result(self, kw, assignment):
         handler = self._handler
         return KeywordResult(kwname=self.name,
@@ -68,30 +96,45 @@ class LibraryKeywordRunner(object):
                              source=kw.source)
 
     def _run(self, context, args):
-        if self.pre_run_messages:
-            for message in self.pre_run_messages:
-                context.output.message(message)
-        positional, named = \
-            self._handler.resolve_arguments(args, context.variables)
+        self._log_pre_run_messages(context)
+        positional, named = self._resolve_arguments(context, args)
         context.output.trace(lambda: self._trace_log_args(positional, named))
         runner = self._runner_for(context, self._handler.current_handler(),
                                   positional, dict(named))
         return self._run_with_output_captured_and_signal_monitor(runner, context)
 
+    def _log_pre_run_messages(self, context):
+        if self.pre_run_messages:
+            for message in self.pre_run_messages:
+                context.output.message(message)
+
+    def _resolve_arguments(self, context, args):
+        return self._handler.resolve_arguments(args, context.variables)
+
     def _trace_log_args(self, positional, named):
-        args = [prepr(arg) for arg in positional]
-        args += ['%s=%s' % (unic(n), prepr(v)) for n, v in named]
+        args = [self._format_arg(arg) for arg in positional]
+        args += ['%s=%s' % (unic(n), self._format_arg(v)) for n, v in named]
         return 'Arguments: [ %s ]' % ' | '.join(args)
 
+    def _format_arg(self, arg):
+        return prepr(arg, max_length=MAX_FORMATTED_LENGTH)
+
     def _runner_for(self, context, handler, positional, named):
         timeout = self._get_timeout(context)
         if timeout and timeout.active:
             def runner():
                 with LOGGER.delayed_logging:
                     context.output.debug(timeout.get_message)
-                    return timeout.run(handler, args=positional, kwargs=named)
+                    args = (context, handler, positional, named)
+                    return timeout.run(self._execute, args=args)
             return runner
-        return lambda: handler(*positional, **named)
+        return lambda: self._execute(context, handler, positional, named)
+
+    def _execute(self, context, handler, positional, named):
+        result = handler(*positional, **named)
+        if context.asynchronous.is_loop_required(result):
+            return context.asynchronous.run_until_complete(result)
+        return result
 
     def _get_timeout(self, context):
         return min(context.timeouts) if context.timeouts else None
@@ -132,11 +175,12 @@ class EmbeddedArgumentsRunner(LibraryKeywordRunner):
         LibraryKeywordRunner.__init__(self, handler, name)
         self._embedded_args = handler.name_regexp.match(name).groups()
 
-    def _run(self, context, args):
+    def _resolve_arguments(self, context, args):
         if args:
             raise DataError("Positional arguments are not allowed when using "
                             "embedded arguments.")
-        return LibraryKeywordRunner._run(self, context, self._embedded_args)
+        return LibraryKeywordRunner._resolve_arguments(self, context,
+                                                       self._embedded_args)
 
     def _dry_run(self, context, args):
         return LibraryKeywordRunner._dry_run(self, context, self._embedded_args)
@@ -174,7 +218,7 @@ class RunKeywordRunner(LibraryKeywordRunner):
         name = self._handler.name
         if name == 'Run Keyword If':
             return list(self._get_run_kw_if_keywords(args))
-        if name == 'Run Keywords':
+        if name in ('Run Keywords', 'Run Keywords In Parallel'):
             return list(self._get_run_kws_keywords(args))
         if self._default_dry_run_keywords:
             return self._get_default_run_kw_keywords(args)
@@ -15,7 +15,9 @@
 
 import inspect
 
-from robot.utils import normalize, unic
+from robot.utils import get_error_details, normalize, unic
+
+from .outputcapture import OutputCapturer
 
 
 def LibraryScope(libcode, library):
@@ -81,17 +83,57 @@ class TestSuiteScope(GlobalScope):
 
 class TestCaseScope(TestSuiteScope):
 
+    def __init__(self, library):
+        TestSuiteScope.__init__(self, library)
+        self._pool = InstancePool(library)
+
     def start_test(self):
         self._unregister_listeners()
-        prev = self._reset_instance()
+        prev = self._reset_instance(self._pool.get())
         self._instance_cache.append(prev)
         self._register_listeners()
 
     def end_test(self):
         self._unregister_listeners(close=True)
         prev = self._instance_cache.pop()
-        self._reset_instance(prev)
+        self._pool.put(self._reset_instance(prev))
         self._register_listeners()
 
     def __str__(self):
         return 'TEST'
+
+
+class InstancePool(object):
+    """Recycles instances of libraries having the ``_robot_reset`` method.
+
+    Instances are reset when they are returned to the pool and the pool
+    holds at most ``max_size`` instances. Instances of libraries not having
+    the reset method are never pooled.
+    """
+    reset_method = '_robot_reset'
+
+    def __init__(self, library, max_size=2):
+        self._library = library
+        self._instances = []
+        self._max_size = max_size
+
+    def get(self):
+        return self._instances.pop() if self._instances else None
+
+    def put(self, instance):
+        if instance is None or len(self._instances) >= self._max_size:
+            return
+        reset = getattr(instance, self.reset_method, None)
+        if callable(reset) and self._reset(reset):
+            self._instances.append(instance)
+
+    def _reset(self, reset):
+        with OutputCapturer(library_import=True):
+            try:
+                reset()
+            except:
+                message, details = get_error_details()
+                self._library.report_error("Resetting library instance "
+                                           "failed: %s" % message, details)
+                return False
+        return True
@@ -82,7 +82,7 @@ class Namespace(object):
         if overwrite or path not in self._kw_store.resources:
             resource = IMPORTER.import_resource(path)
             self.variables.set_from_variable_table(resource.variables, overwrite)
-            user_library = UserLibrary(resource)
+            user_library = IMPORTER.import_user_library(resource)
             self._kw_store.resources[path] = user_library
             self._handle_imports(resource.imports)
             LOGGER.imported("Resource", user_library.name,
@@ -0,0 +1,254 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import sys
+import threading
+
+from robot.errors import (DataError, ExecutionFailed, ExecutionFailures,
+                          ExecutionPassed)
+from robot.output import LOGGER
+from robot.output.librarylogger import PARALLEL_KEYWORD_THREAD
+from robot.result import Keyword as KeywordResult
+from robot.utils import console_decode, console_encode, StringIO
+
+from .context import Asynchronous
+from .librarykeywordrunner import (EmbeddedArgumentsRunner,
+                                   LibraryKeywordRunner)
+from .statusreporter import StatusReporter
+from .usererrorhandler import UserErrorHandler
+
+
+class ParallelKeywordRunner(object):
+    """Runs library keywords concurrently in separate threads.
+
+    Only calling the actual keyword implementation happens in threads.
+    Messages logged using the logging APIs and written to the standard
+    output and error streams are collected by the threads and logged by
+    the main thread after all keywords have finished. Each keyword gets
+    its own result in the order the keywords were given.
+    """
+
+    def __init__(self, context):
+        self._context = context
+
+    def run(self, keywords):
+        runs = [self._get_run(kw) for kw in keywords]
+        timeout = self._get_timeout()
+        with _CapturedStreams():
+            for run in runs:
+                run.start()
+            if timeout and timeout.active:
+                timeout.run(self._wait, args=(runs,))
+            else:
+                self._wait(runs)
+        self._report(runs)
+
+    def _get_timeout(self):
+        timeouts = self._context.timeouts
+        return min(timeouts) if timeouts else None
+
+    def _wait(self, runs):
+        for run in runs:
+            run.wait()
+
+    def _get_run(self, kw):
+        runner = self._context.get_runner(kw.name)
+        if isinstance(runner, UserErrorHandler):
+            return _SequentialRun(runner, kw, self._context)
+        if type(runner) not in (LibraryKeywordRunner, EmbeddedArgumentsRunner):
+            return _InvalidRun(kw, self._context,
+                               'Only library keywords are supported.')
+        # BuiltIn keywords modify the execution context that is not
+        # thread-safe.
+        if runner.library.orig_name == 'BuiltIn':
+            return _InvalidRun(kw, self._context,
+                               'BuiltIn keywords are not supported.')
+        return _ThreadedRun(runner, kw, self._context)
+
+    def _report(self, runs):
+        errors = []
+        passed = None
+        for run in runs:
+            try:
+                run.report()
+            except ExecutionPassed as exception:
+                passed = passed or exception
+            except ExecutionFailed as err:
+                errors.extend(err.get_errors())
+        if passed:
+            passed.set_earlier_failures(errors)
+            raise passed
+        if errors:
+            raise ExecutionFailures(errors)
+
+
+class _Run(object):
+
+    def __init__(self, kw, context):
+        self._kw = kw
+        self._context = context
+
+    def start(self):
+        pass
+
+    def wait(self):
+        pass
+
+    def report(self):
+        raise NotImplementedError
+
+
+class _SequentialRun(_Run):
+
+    def __init__(self, runner, kw, context):
+        _Run.__init__(self, kw, context)
+        self._runner = runner
+
+    def report(self):
+        self._runner.run(self._kw, self._context)
+
+
+class _InvalidRun(_Run):
+
+    def __init__(self, kw, context, reason):
+        _Run.__init__(self, kw, context)
+        self._reason = reason
+
+    def report(self):
+        result = KeywordResult(kwname=self._kw.name, args=self._kw.args)
+        with StatusReporter(self._context, result):
+            raise DataError("Keyword '%s' cannot be run in parallel. %s"
+                            % (self._kw.name, self._reason))
+
+
+class _ThreadedRun(_Run):
+
+    def __init__(self, runner, kw, context):
+        _Run.__init__(self, kw, context)
+        self._runner = runner
+        self._thread = None
+        self._error = None
+        self._positional = self._named = None
+        try:
+            self._handler, self._positional, self._named \
+                = runner.resolve(context, kw.args)
+        except DataError as err:
+            self._error = err
+
+    def start(self):
+        if not self._error:
+            self._thread = _KeywordThread(self._handler, self._positional,
+                                          dict(self._named))
+            self._thread.start()
+
+    def wait(self):
+        # Joining in short intervals keeps the main thread responsive to
+        # timeouts and signals.
+        while self._thread and self._thread.is_alive():
+            self._thread.join(0.1)
+
+    def report(self):
+        self._runner.report(self._kw, self._context, self._report_outcome,
+                            self._positional, self._named)
+
+    def _report_outcome(self):
+        if self._error:
+            raise self._error
+        self._thread.log_output()
+        if self._thread.error:
+            raise self._thread.error
+
+
+class _KeywordThread(threading.Thread):
+
+    def __init__(self, handler, positional, named):
+        threading.Thread.__init__(self, name=PARALLEL_KEYWORD_THREAD)
+        self.daemon = True
+        self.messages = []
+        self.stdout = StringIO()
+        self.stderr = StringIO()
+        self.error = None
+        self._handler = handler
+        self._positional = positional
+        self._named = named
+
+    def run(self):
+        try:
+            self._execute()
+        except BaseException as err:
+            self.error = err
+
+    def _execute(self):
+        result = self._handler(*self._positional, **self._named)
+        # The shared event loop can only be used by the main thread.
+        asynchronous = Asynchronous()
+        if asynchronous.is_loop_required(result):
+            try:
+                asynchronous.run_until_complete(result)
+            finally:
+                asynchronous.close_loop()
+
+    def log_output(self):
+        for message in self.messages:
+            LOGGER.log_message(message)
+        stdout = console_decode(self.stdout.getvalue())
+        stderr = console_decode(self.stderr.getvalue())
+        if stdout:
+            LOGGER.log_output(stdout)
+        if stderr:
+            LOGGER.log_output(stderr)
+            sys.__stderr__.write(console_encode(stderr, stream=sys.__stderr__))
+
+
+class _CapturedStreams(object):
+    """Routes writes to `sys.stdout` and `sys.stderr` from keyword threads.
+
+    Writes from other threads go to the original streams.
+    """
+
+    def __enter__(self):
+        self._stdout = sys.stdout
+        self._stderr = sys.stderr
+        sys.stdout = _ThreadStream(self._stdout, 'stdout')
+        sys.stderr = _ThreadStream(self._stderr, 'stderr')
+
+    def __exit__(self, *exc_info):
+        sys.stdout = self._stdout
+        sys.stderr = self._stderr
+
+
+class _ThreadStream(object):
+
+    def __init__(self, original, name):
+        self._original = original
+        self._name = name
+
+    def write(self, data):
+        self._get_stream().write(data)
+
+    def writelines(self, lines):
+        self._get_stream().writelines(lines)
+
+    def flush(self):
+        self._get_stream().flush()
+
+    def _get_stream(self):
+        thread = threading.current_thread()
+        if isinstance(thread, _KeywordThread):
+            return getattr(thread, self._name)
+        return self._original
+
+    def __getattr__(self, name):
+        return getattr(self._original, name)
@@ -16,8 +16,7 @@
 from robot.errors import ExecutionStatus, DataError, PassExecution
 from robot.model import SuiteVisitor, TagPatterns
 from robot.result import TestSuite, Result
-from robot.utils import (get_timestamp, is_list_like, NormalizedDict, unic,
-                         test_or_task)
+from robot.utils import is_list_like, NormalizedDict, unic, test_or_task
 from robot.variables import VariableScopes
 
 from .context import EXECUTION_CONTEXTS
@@ -51,8 +50,8 @@ class Runner(SuiteVisitor):
                            name=suite.name,
                            doc=suite.doc,
                            metadata=suite.metadata,
-                           starttime=get_timestamp(),
                            rpa=self._settings.rpa)
+        result.start_timer()
         if not self.result:
             self.result = Result(root_suite=result, rpa=self._settings.rpa)
             self.result.configure(status_rc=self._settings.status_rc,
@@ -102,7 +101,7 @@ class Runner(SuiteVisitor):
                 else:
                     self._suite.suite_teardown_failed(unic(failure))
                 self._suite_status.failure_occurred()
-        self._suite.endtime = get_timestamp()
+        self._suite.end_timer()
         self._suite.message = self._suite_status.message
         self._context.end_suite(ModelCombiner(suite, self._suite))
         self._suite = self._suite.parent
@@ -117,8 +116,8 @@ class Runner(SuiteVisitor):
         result = self._suite.tests.create(name=self._resolve_setting(test.name),
                                           doc=self._resolve_setting(test.doc),
                                           tags=self._resolve_setting(test.tags),
-                                          starttime=get_timestamp(),
                                           timeout=self._get_timeout(test))
+        result.start_timer()
         self._context.start_test(result)
         self._output.start_test(ModelCombiner(test, result))
         status = TestStatus(self._suite_status, result,
@@ -171,7 +170,7 @@ class Runner(SuiteVisitor):
             status.test_failed(result.timeout.get_message())
             result.message = status.message
         result.status = status.status
-        result.endtime = get_timestamp()
+        result.end_timer()
         self._output.end_test(ModelCombiner(test, result))
         self._context.end_test(result)
 
@@ -15,7 +15,7 @@
 
 from robot.errors import (ExecutionFailed, ExecutionStatus, DataError,
                           HandlerExecutionFailed, KeywordError, VariableError)
-from robot.utils import ErrorDetails, get_timestamp
+from robot.utils import ErrorDetails
 
 
 class StatusReporter(object):
@@ -29,7 +29,7 @@ class StatusReporter(object):
     def __enter__(self):
         if self._context.test:
             self._test_passed = self._context.test.passed
-        self._result.starttime = get_timestamp()
+        self._result.start_timer()
         self._context.start_keyword(self._result)
         self._warn_if_deprecated(self._result.doc, self._result.name)
         return self
@@ -52,7 +52,7 @@ class StatusReporter(object):
         if context.test:
             status = self._get_status(result)
             context.test.status = status
-        result.endtime = get_timestamp()
+        result.end_timer()
         context.end_keyword(result)
         if failure is not exc_val:
             raise failure
@@ -15,19 +15,22 @@
 
 import inspect
 import os
+import time
 
 from robot.errors import DataError
 from robot.libraries import STDLIBS
 from robot.output import LOGGER
 from robot.utils import (getdoc, get_error_details, Importer, is_java_init,
-                         is_java_method, JYTHON, normalize, seq2str2, unic,
-                         is_list_like, PY2, PYPY, type_name)
+                         is_java_method, JYTHON, normalize, secs_to_timestr,
+                         seq2str2, unic, is_list_like, PY2, PYPY, type_name)
 
 from .arguments import EmbeddedArguments
 from .context import EXECUTION_CONTEXTS
 from .dynamicmethods import (GetKeywordArguments, GetKeywordDocumentation,
-                             GetKeywordNames, GetKeywordTags, RunKeyword)
-from .handlers import Handler, InitHandler, DynamicHandler, EmbeddedArgumentsHandler
+                             GetKeywordNames, GetKeywordTags,
+                             GetLibraryInformation, RunKeyword)
+from .handlers import (Handler, InitHandler, DynamicHandler,
+                       EmbeddedArgumentsHandler, LazyHandler, get_keyword_name)
 from .handlerstore import HandlerStore
 from .libraryscopes import LibraryScope
 from .outputcapture import OutputCapturer
@@ -92,6 +95,13 @@ class _BaseTestLibrary(object):
     def __len__(self):
         return len(self.handlers)
 
+    def report_no_keywords(self):
+        # Used when creating lazily created handlers has failed so that
+        # the library has no keywords left. See also `Importer`.
+        if not self.has_listener:
+            self.logger.warn("Imported library '%s' contains no keywords."
+                             % self.orig_name)
+
     @property
     def doc(self):
         if self._doc is None:
@@ -111,8 +121,14 @@ class _BaseTestLibrary(object):
                 return start_lineno + increment
         return start_lineno
 
-    def create_handlers(self):
-        self._create_handlers(self.get_instance())
+    def create_handlers(self, lazy=False):
+        """Creates handlers for all keywords in the library.
+
+        With ``lazy=True`` only keyword names are resolved at this point and
+        actual handlers are created when keywords are used for the first
+        time. Errors in keywords are then reported only when they are used.
+        """
+        self._create_handlers(self.get_instance(), lazy)
         self.reset_instance()
 
     def reload(self):
@@ -187,11 +203,17 @@ class _BaseTestLibrary(object):
         return self._libinst
 
     def _get_instance(self, libcode):
+        start = time.time()
         with OutputCapturer(library_import=True):
             try:
-                return libcode(*self.positional_args, **dict(self.named_args))
+                instance = libcode(*self.positional_args,
+                                   **dict(self.named_args))
             except:
                 self._raise_creating_instance_failed()
+        self.logger.debug("Created instance of library '%s' in %s."
+                          % (self.name, secs_to_timestr(time.time() - start,
+                                                        compact=True)))
+        return instance
 
     def get_listeners(self, libinst=None):
         if libinst is None:
@@ -236,17 +258,19 @@ class _BaseTestLibrary(object):
             self.report_error("Calling method '%s' of listener '%s' failed: %s"
                               % (method.__name__, name, message), details)
 
-    def _create_handlers(self, libcode):
+    def _create_handlers(self, libcode, lazy=False):
         try:
             names = self._get_handler_names(libcode)
         except:
             message, details = get_error_details()
             raise DataError("Getting keyword names from library '%s' failed: %s"
                             % (self.name, message), details)
+        create_handler = self._try_to_create_handler \
+            if not lazy else self._try_to_create_lazy_handler
         for name in names:
             method = self._try_to_get_handler_method(libcode, name)
             if method:
-                handler, embedded = self._try_to_create_handler(name, method)
+                handler, embedded = create_handler(name, method)
                 if handler:
                     try:
                         self.handlers.add(handler, embedded)
@@ -314,6 +338,21 @@ class _BaseTestLibrary(object):
             self._adding_keyword_failed(handler.name, err)
             return None, False
 
+    def _try_to_create_lazy_handler(self, name, method):
+        # Keywords with embedded arguments, invalid names or same names as
+        # earlier keywords are created immediately to report errors.
+        try:
+            kw_name = self._get_keyword_name(name, method)
+            create_now = EmbeddedArguments(kw_name) or kw_name in self.handlers
+        except DataError:
+            create_now = True
+        if create_now:
+            return self._try_to_create_handler(name, method)
+        return LazyHandler(self, kw_name, name, method), False
+
+    def _get_keyword_name(self, handler_name, handler_method):
+        return get_keyword_name(handler_name, handler_method)
+
     def _create_handler(self, handler_name, handler_method):
         return Handler(self, handler_name, handler_method)
 
@@ -401,6 +440,7 @@ class _DynamicLibrary(_BaseTestLibrary):
     def __init__(self, libcode, name, args, source, logger, variables=None):
         _BaseTestLibrary.__init__(self, libcode, name, args, source, logger,
                                   variables)
+        self.information = {}
 
     @property
     def doc(self):
@@ -410,23 +450,37 @@ class _DynamicLibrary(_BaseTestLibrary):
         return self._doc
 
     def _get_kw_doc(self, name):
-        getter = GetKeywordDocumentation(self.get_instance())
+        getter = GetKeywordDocumentation(self.get_instance(), self.information)
         return getter(name)
 
     def _get_kw_args(self, name):
-        getter = GetKeywordArguments(self.get_instance())
+        getter = GetKeywordArguments(self.get_instance(), self.information)
         return getter(name)
 
     def _get_kw_tags(self, name):
-        getter = GetKeywordTags(self.get_instance())
+        getter = GetKeywordTags(self.get_instance(), self.information)
         return getter(name)
 
     def _get_handler_names(self, instance):
-        return GetKeywordNames(instance)()
+        names = GetKeywordNames(instance)()
+        # Library information is got here, when handlers are created, so that
+        # libraries returned from the import cache and their copies share it.
+        self.information = self._get_library_information(instance)
+        return names
+
+    def _get_library_information(self, instance):
+        try:
+            return GetLibraryInformation(instance)()
+        except DataError as err:
+            self.report_error(err.message)
+            return {}
 
     def _get_handler_method(self, instance, name):
         return RunKeyword(instance)
 
+    def _get_keyword_name(self, handler_name, handler_method):
+        return get_keyword_name(handler_name, handler_method.method)
+
     def _create_handler(self, name, method):
         argspec = self._get_kw_args(name)
         tags = self._get_kw_tags(name)
@@ -16,7 +16,7 @@
 import time
 
 from robot.utils import (Sortable, py2to3, secs_to_timestr, timestr_to_secs,
-                         IRONPYTHON, JYTHON, WINDOWS)
+                         IRONPYTHON, JYTHON, PYPY, WINDOWS)
 from robot.errors import TimeoutError, DataError, FrameworkError
 
 if JYTHON:
@@ -24,9 +24,15 @@ if JYTHON:
 elif IRONPYTHON:
     from .ironpython import Timeout
 elif WINDOWS:
-    from .windows import Timeout
+    from .scheduler import Timeout
 else:
-    from .posix import Timeout
+    import signal
+    # The scheduler needs asynchronous exceptions, which PyPy does not
+    # support, and `pthread_kill` to interrupt blocking calls.
+    if PYPY or not hasattr(signal, 'pthread_kill'):
+        from .posix import Timeout
+    else:
+        from .scheduler import Timeout
 
 
 @py2to3
@@ -0,0 +1,198 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import ctypes
+import heapq
+import signal
+import threading
+import time
+from itertools import count
+from threading import Condition, Thread, current_thread
+
+from robot.errors import TimeoutError
+from robot.utils import MONOTONIC_CLOCK
+
+
+class Timeout(object):
+
+    def __init__(self, timeout, error):
+        self._timeout = timeout
+        self._error = error
+
+    def execute(self, runnable):
+        entry = _scheduler.schedule(self._timeout)
+        try:
+            try:
+                result = runnable()
+            finally:
+                _scheduler.cancel(entry)
+            self._wait_for_raised_timeout(entry)
+            return result
+        finally:
+            _scheduler.release(entry)
+            if entry.timed_out:
+                raise self._error
+
+    def _wait_for_raised_timeout(self, entry):
+        if entry.timed_out:
+            while True:
+                time.sleep(0)
+
+
+def _get_main_thread():
+    if hasattr(threading, 'main_thread'):
+        return threading.main_thread()
+    return current_thread()
+
+
+class _Entry(object):
+    __slots__ = ['deadline', 'order', 'thread_id', 'cancelled', 'timed_out']
+
+    def __init__(self, deadline, order, thread_id):
+        self.deadline = deadline
+        self.order = order
+        self.thread_id = thread_id
+        self.cancelled = False
+        self.timed_out = False
+
+    def __lt__(self, other):
+        return (self.deadline, self.order) < (other.deadline, other.order)
+
+
+class TimeoutScheduler(object):
+    """Single timer thread serving all active test and keyword timeouts.
+
+    Timeouts can be nested and started from any thread. When a timeout
+    expires, the scheduler raises an asynchronous :class:`TimeoutError` in
+    the thread that started it. Cancelled entries are removed lazily so
+    that starting and stopping a timeout is just a heap operation.
+
+    While timeouts started from the main thread are active, a no-op SIGALRM
+    handler is installed so that blocking calls can be interrupted. The
+    original handler is restored when the last of them ends. Deadlines use
+    a monotonic clock so that changing the system time does not affect them.
+    """
+
+    def __init__(self):
+        self._condition = Condition()
+        self._heap = []
+        self._cancelled = 0
+        self._order = count()
+        self._thread = None
+        self._main_thread_id = _get_main_thread().ident
+        self._main_thread_entries = 0
+        self._signal_installed = False
+        self._original_handler = None
+
+    def schedule(self, timeout):
+        thread_id = current_thread().ident
+        deadline = MONOTONIC_CLOCK.now() + int(timeout * 1e9)
+        with self._condition:
+            if thread_id == self._main_thread_id:
+                if not self._main_thread_entries:
+                    self._install_signal_handler()
+                self._main_thread_entries += 1
+            entry = _Entry(deadline, next(self._order), thread_id)
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._start_thread()
+            elif self._heap[0] is entry:
+                self._condition.notify()
+        return entry
+
+    def cancel(self, entry):
+        with self._condition:
+            if entry.timed_out or entry.cancelled:
+                return
+            entry.cancelled = True
+            self._cancelled += 1
+            if self._cancelled > len(self._heap) // 2:
+                self._remove_cancelled()
+
+    def release(self, entry):
+        # Holding the lock guarantees that the scheduler is not signalling
+        # the main thread while the original handler is restored.
+        if entry.thread_id != self._main_thread_id:
+            return
+        with self._condition:
+            self._main_thread_entries -= 1
+            if not self._main_thread_entries:
+                self._restore_signal_handler()
+
+    def _remove_cancelled(self):
+        self._heap = [e for e in self._heap if not e.cancelled]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
+
+    def _start_thread(self):
+        self._thread = Thread(target=self._run,
+                              name='RobotFrameworkTimeoutScheduler')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        with self._condition:
+            while True:
+                while self._heap and self._heap[0].cancelled:
+                    heapq.heappop(self._heap)
+                    self._cancelled -= 1
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                wait = self._heap[0].deadline - MONOTONIC_CLOCK.now()
+                if wait > 0:
+                    self._condition.wait(wait / 1e9)
+                    continue
+                entry = heapq.heappop(self._heap)
+                entry.timed_out = True
+                self._raise_timeout(entry.thread_id)
+
+    def _raise_timeout(self, thread_id):
+        # See, for example, http://tomerfiliba.com/recipes/Thread2/
+        # for more information about using PyThreadState_SetAsyncExc
+        tid = ctypes.c_long(thread_id)
+        error = ctypes.py_object(TimeoutError)
+        while ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, error) > 1:
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(tid, None)
+            time.sleep(0)  # give time for other threads
+        if thread_id == self._main_thread_id and self._signal_installed:
+            # Interrupts blocking system calls such as `time.sleep` so that
+            # the pending asynchronous exception is raised immediately.
+            signal.pthread_kill(thread_id, signal.SIGALRM)
+
+    def _install_signal_handler(self):
+        if not hasattr(signal, 'pthread_kill'):
+            return
+        try:
+            original = signal.signal(signal.SIGALRM, self._interrupt)
+        except ValueError:    # Not in the main thread of the interpreter.
+            return
+        # Handlers not installed from Python are reported as None.
+        self._original_handler = (original if original is not None
+                                  else signal.SIG_DFL)
+        self._signal_installed = True
+
+    def _restore_signal_handler(self):
+        if self._signal_installed:
+            signal.signal(signal.SIGALRM, self._original_handler)
+            self._original_handler = None
+            self._signal_installed = False
+
+    def _interrupt(self, signum, frame):
+        # The asynchronous exception is raised when Python code runs next.
+        pass
+
+
+_scheduler = TimeoutScheduler()
@@ -38,6 +38,7 @@ class UserLibrary(object):
         self.handlers = HandlerStore(basename, source_type)
         self.source = source
         self.source_type = source_type
+        self._errors = []
         for kw in resource.keywords:
             try:
                 handler = self._create_handler(kw)
@@ -60,9 +61,16 @@ class UserLibrary(object):
         return EmbeddedArgumentsHandler(kw, self.name, embedded)
 
     def _log_creating_failed(self, handler, error):
-        LOGGER.error("Error in %s '%s': Creating keyword '%s' failed: %s"
-                     % (self.source_type.lower(), self.source,
-                        handler.name, error.message))
+        message = ("Error in %s '%s': Creating keyword '%s' failed: %s"
+                   % (self.source_type.lower(), self.source,
+                      handler.name, error.message))
+        self._errors.append(message)
+        LOGGER.error(message)
+
+    def log_errors(self):
+        """Logs again errors that occurred when creating keywords."""
+        for message in self._errors:
+            LOGGER.error(message)
 
 
 # TODO: Should be merged with running.model.UserKeyword
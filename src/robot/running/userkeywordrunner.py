@@ -20,7 +20,8 @@ from robot.errors import (ExecutionFailed, ExecutionPassed, ExecutionStatus,
                           PassExecution, ReturnFromKeyword,
                           UserKeywordExecutionFailed, VariableError)
 from robot.result import Keyword as KeywordResult
-from robot.utils import getshortdoc, DotDict, prepr, split_tags_from_doc
+from robot.utils import (getshortdoc, DotDict, MAX_FORMATTED_LENGTH, prepr,
+                         split_tags_from_doc)
 from robot.variables import is_list_variable, VariableAssignment
 
 from .arguments import DefaultValue
@@ -142,7 +143,9 @@ class UserKeywordRunner(object):
         return self._format_trace_log_args_message(args, variables)
 
     def _format_trace_log_args_message(self, args, variables):
-        args = ['%s=%s' % (name, prepr(variables[name])) for name in args]
+        args = ['%s=%s' % (name, prepr(variables[name],
+                                       max_length=MAX_FORMATTED_LENGTH))
+                for name in args]
         return 'Arguments: [ %s ]' % ' | '.join(args)
 
     def _execute(self, context):
@@ -18,8 +18,8 @@ import base64
 from .platform import JYTHON, PY2
 
 
-def compress_text(text):
-    result = base64.b64encode(_compress(text.encode('UTF-8')))
+def compress_text(text, level=9):
+    result = base64.b64encode(_compress(text.encode('UTF-8'), level))
     return result if PY2 else result.decode('ASCII')
 
 
@@ -27,8 +27,8 @@ if not JYTHON:
 
     import zlib
 
-    def _compress(text):
-        return zlib.compress(text, 9)
+    def _compress(text, level=9):
+        return zlib.compress(text, level)
 
 else:
 
@@ -41,7 +41,8 @@ else:
 
     _DEFLATOR = Deflater(9, False)
 
-    def _compress(text):
+    def _compress(text, level=9):
+        _DEFLATOR.setLevel(level)
         _DEFLATOR.setInput(text)
         _DEFLATOR.finish()
         buf = jarray.zeros(1024, 'b')
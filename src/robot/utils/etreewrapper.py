@@ -18,6 +18,7 @@ import re
 
 from .compat import py2to3
 from .platform import IRONPYTHON, PY_VERSION, PY3
+from .robotio import compressed_file_reader
 from .robottypes import is_bytes, is_pathlike, is_string
 
 if PY3:
@@ -68,7 +69,9 @@ class ETSource(object):
         return self._opened or self._source
 
     def _open_if_necessary(self, source):
-        if self._is_path(source) or self._is_already_open(source):
+        if self._is_path(source):
+            return compressed_file_reader(source)
+        if self._is_already_open(source):
             return None
         if IRONPYTHON_WITH_BROKEN_ETREE:
             return StringIO(source)
@@ -15,10 +15,13 @@
 
 import re
 import fnmatch
+from collections import OrderedDict
 from functools import partial
+from itertools import compress
+from threading import Lock
 
 from .compat import py2to3
-from .normalizing import normalize
+from .normalizing import lower, normalize
 from .platform import IRONPYTHON, PY3
 from .robottypes import is_string
 
@@ -29,6 +32,77 @@ def eq(str1, str2, ignore=(), caseless=True, spaceless=True):
     return str1 == str2
 
 
+class _LRUCache(object):
+    """Small thread-safe cache discarding least recently used items."""
+
+    def __init__(self, size):
+        self._size = size
+        self._items = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, create):
+        with self._lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                value = None
+            if value is not None:
+                self._items[key] = value
+                return value
+        value = create()
+        with self._lock:
+            self._items[key] = value
+            if len(self._items) > self._size:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+_patterns = _LRUCache(size=1000)
+_matchers = _LRUCache(size=1000)
+
+
+def compile_pattern(pattern, regexp=False, flags=0):
+    """Returns a compiled regular expression matching ``pattern``.
+
+    If ``regexp`` is false, ``pattern`` is considered a glob pattern and
+    the returned regexp matches it fully. Compiled patterns are cached so
+    using the same pattern repeatedly is cheap.
+    """
+    key = (type(pattern), pattern, bool(regexp), flags)
+    return _patterns.get(key, partial(_compile, pattern, regexp, flags))
+
+
+def _compile(pattern, regexp=False, flags=0):
+    if not regexp:
+        pattern = fnmatch.translate(pattern)
+        # https://github.com/IronLanguages/ironpython2/issues/515
+        if IRONPYTHON and "\\'" in pattern:
+            pattern = pattern.replace("\\'", "'")
+    return re.compile(pattern, flags)
+
+
+def get_matcher(pattern, ignore=(), caseless=True, spaceless=True,
+                regexp=False):
+    """Returns a possibly cached :class:`Matcher` with the given config.
+
+    Matchers do not have any mutable state so the same instance can be
+    shared by all users of the same pattern.
+    """
+    if is_string(ignore):
+        ignore = (ignore,)
+    key = (type(pattern), pattern, tuple(ignore), bool(caseless),
+           bool(spaceless), bool(regexp))
+    return _matchers.get(key, partial(Matcher, pattern, ignore, caseless,
+                                      spaceless, regexp))
+
+
 @py2to3
 class Matcher(object):
 
@@ -37,28 +111,46 @@ class Matcher(object):
         if PY3 and isinstance(pattern, bytes):
             raise TypeError('Matching bytes is not supported on Python 3.')
         self.pattern = pattern
-        self._normalize = partial(normalize, ignore=ignore, caseless=caseless,
-                                  spaceless=spaceless)
-        self._regexp = self._compile(self._normalize(pattern), regexp=regexp)
-
-    def _compile(self, pattern, regexp=False):
-        if not regexp:
-            pattern = fnmatch.translate(pattern)
-            # https://github.com/IronLanguages/ironpython2/issues/515
-            if IRONPYTHON and "\\'" in pattern:
-                pattern = pattern.replace("\\'", "'")
-        return re.compile(pattern, re.DOTALL)
+        self._normalize = self._get_normalizer(ignore, caseless, spaceless)
+        self._regexp = compile_pattern(self._normalize(pattern), regexp,
+                                       re.DOTALL)
+        self._match = self._regexp.match
+
+    def _get_normalizer(self, ignore, caseless, spaceless):
+        if ignore or spaceless:
+            return partial(normalize, ignore=ignore, caseless=caseless,
+                           spaceless=spaceless)
+        if caseless:
+            return lower
+        return _no_normalization
 
     def match(self, string):
-        return self._regexp.match(self._normalize(string)) is not None
+        return self._match(self._normalize(string)) is not None
 
     def match_any(self, strings):
         return any(self.match(s) for s in strings)
 
+    def filter(self, strings):
+        """Returns a list of given strings matching the pattern.
+
+        Strings are first normalized in bulk and then matched without any
+        per-item Python function calls.
+        """
+        strings = list(strings)
+        if self._normalize is _no_normalization:
+            normalized = strings
+        else:
+            normalized = map(self._normalize, strings)
+        return list(compress(strings, map(self._match, normalized)))
+
     def __nonzero__(self):
         return bool(self._normalize(self.pattern))
 
 
+def _no_normalization(string):
+    return string
+
+
 class MultiMatcher(object):
 
     def __init__(self, patterns=None, ignore=(), caseless=True, spaceless=True,
@@ -24,13 +24,26 @@ from .platform import PY3
 from .robottypes import is_pathlike
 
 
+# Compressed files are written based on the extension and read based on the
+# magic bytes in the beginning of the file. Python 2 supports only gzip.
+_COMPRESSIONS = [('.gz', b'\x1f\x8b', 'gzip')]
+if PY3:
+    _COMPRESSIONS += [('.bz2', b'BZh', 'bz2'),
+                      ('.xz', b'\xfd7zXZ\x00', 'lzma')]
+
+
 def file_writer(path=None, encoding='UTF-8', newline=None, usage=None):
+    """Opens a text file for writing or creates an in-memory stream.
+
+    If the path has extension ``.gz``, ``.bz2`` or ``.xz``, the written
+    text is compressed using gzip, bzip2 or xz, respectively.
+    """
     if path:
         if is_pathlike(path):
             path = str(path)
         create_destination_directory(path, usage)
         try:
-            f = io.open(path, 'w', encoding=encoding, newline=newline)
+            f = _open_writer(path, encoding, newline)
         except EnvironmentError:
             usage = '%s file' % usage if usage else 'file'
             raise DataError("Opening %s '%s' failed: %s"
@@ -48,6 +61,41 @@ def file_writer(path=None, encoding='UTF-8', newline=None, usage=None):
     return f
 
 
+def _open_writer(path, encoding, newline):
+    compression = _get_compression_by_extension(path)
+    if not compression:
+        return io.open(path, 'w', encoding=encoding, newline=newline)
+    return io.TextIOWrapper(compression.open(path, 'wb'), encoding=encoding,
+                            newline=newline)
+
+
+def _get_compression_by_extension(path):
+    ext = os.path.splitext(path)[1].lower()
+    for extension, _, module in _COMPRESSIONS:
+        if ext == extension:
+            return __import__(module)
+    return None
+
+
+def compressed_file_reader(path):
+    """Opens a compressed file for reading with streaming decompression.
+
+    Returns a binary file object or ``None`` if the file is not compressed
+    using a supported format or it cannot be opened.
+    """
+    if is_pathlike(path):
+        path = str(path)
+    try:
+        with io.open(path, 'rb') as f:
+            start = f.read(6)
+    except (EnvironmentError, TypeError, ValueError):
+        return None
+    for _, magic, module in _COMPRESSIONS:
+        if start.startswith(magic):
+            return __import__(module).open(path, 'rb')
+    return None
+
+
 def binary_file_writer(path=None):
     if path:
         if is_pathlike(path):
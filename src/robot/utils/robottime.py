@@ -24,6 +24,14 @@ from .robottypes import is_number, is_string
 
 _timer_re = re.compile(r'^([+-])?(\d+:)?(\d+):(\d+)(\.\d+)?$')
 
+try:
+    _monotonic_ns = time.perf_counter_ns
+except AttributeError:    # Python < 3.7
+    _perf_counter = getattr(time, 'perf_counter', time.time)
+
+    def _monotonic_ns():
+        return int(_perf_counter() * 1e9)
+
 
 def _get_timetuple(epoch_secs=None):
     if epoch_secs is None:  # can also be 0 (at least in unit tests)
@@ -377,6 +385,51 @@ def _split_timestamp(timestamp):
     return years, mons, days, hours, mins, secs, millis
 
 
+class MonotonicClock(object):
+    """High-resolution monotonic clock anchored to the wall-clock time once.
+
+    Times are returned by :meth:`now` as integer nanoseconds from an arbitrary
+    starting point. They are not affected by wall-clock changes and can be
+    converted to seconds after epoch or to timestamps when needed.
+    """
+
+    def __init__(self):
+        self._anchor_millis = time.time() * 1000
+        self._start = _monotonic_ns()
+
+    def now(self):
+        """Returns current time in nanoseconds."""
+        return _monotonic_ns()
+
+    def epoch(self, ns=None):
+        """Returns given or current time as seconds after epoch."""
+        if ns is None:
+            ns = _monotonic_ns()
+        return (self._anchor_millis + (ns - self._start) / 1e6) / 1000
+
+    def epoch_millis(self, ns):
+        """Returns given time as whole milliseconds after epoch."""
+        return int(self._anchor_millis + (ns - self._start) / 1e6 + 0.5)
+
+    def elapsed_millis(self, start_ns, end_ns):
+        """Returns the time between given times in whole milliseconds.
+
+        The result is the same as calculating the difference between
+        timestamps of the given times.
+        """
+        return self.epoch_millis(end_ns) - self.epoch_millis(start_ns)
+
+    def timestamp(self, ns, daysep='', daytimesep=' ', timesep=':',
+                  millissep='.'):
+        """Returns given time as a timestamp like :func:`get_timestamp`."""
+        secs, millis = divmod(self.epoch_millis(ns), 1000)
+        return TIMESTAMP_CACHE.format_timestamp(secs, millis, daysep,
+                                                daytimesep, timesep, millissep)
+
+
+MONOTONIC_CLOCK = MonotonicClock()
+
+
 class TimestampCache(object):
 
     def __init__(self):
@@ -385,17 +438,22 @@ class TimestampCache(object):
         self._previous_timestamp = None
 
     def get_timestamp(self, daysep='', daytimesep=' ', timesep=':', millissep='.'):
-        epoch = self._get_epoch()
-        secs, millis = _float_secs_to_secs_and_millis(epoch)
+        secs, millis = _float_secs_to_secs_and_millis(self._get_epoch())
+        return self.format_timestamp(secs, millis, daysep, daytimesep, timesep,
+                                     millissep)
+
+    def format_timestamp(self, secs, millis, daysep='', daytimesep=' ',
+                         timesep=':', millissep='.'):
         if self._use_cache(secs, daysep, daytimesep, timesep):
             return self._cached_timestamp(millis, millissep)
-        timestamp = format_time(epoch, daysep, daytimesep, timesep, millissep)
+        timetuple = time.localtime(secs)[:6] + (millis,)
+        timestamp = format_time(timetuple, daysep, daytimesep, timesep, millissep)
         self._cache_timestamp(secs, timestamp, daysep, daytimesep, timesep, millissep)
         return timestamp
 
     # Seam for mocking
     def _get_epoch(self):
-        return time.time()
+        return MONOTONIC_CLOCK.epoch()
 
     def _use_cache(self, secs, *separators):
         return self._previous_timestamp \
@@ -22,16 +22,28 @@ from .charwidth import get_char_width
 from .misc import seq2str2
 from .platform import JYTHON, PY_VERSION
 from .robottypes import is_string, is_unicode
-from .unic import unic
+from .unic import cut_unic, unic
 
 
 MAX_ERROR_LINES = 40
+MAX_FORMATTED_LENGTH = 10000
 _MAX_ASSIGN_LENGTH = 200
 _MAX_ERROR_LINE_LENGTH = 78
 _ERROR_CUT_EXPLN = '    [ Message content over the limit has been removed. ]'
 _TAGS_RE = re.compile(r'\s*tags:(.*)', re.IGNORECASE)
 
 
+def max_error_length():
+    """Returns maximum length of error messages or ``None`` if not limited.
+
+    Longer messages would be cut by :func:`cut_long_message` anyway, so values
+    formatted into error messages do not need to be longer than this.
+    """
+    if MAX_ERROR_LINES is None:
+        return None
+    return MAX_ERROR_LINES * _MAX_ERROR_LINE_LENGTH
+
+
 def cut_long_message(msg):
     if MAX_ERROR_LINES is None:
         return msg
@@ -82,9 +94,15 @@ def _count_virtual_line_length(line):
 
 def format_assign_message(variable, value, cut_long=True):
     formatter = {'$': unic, '@': seq2str2, '&': _dict_to_str}[variable[0]]
-    value = formatter(value)
-    if cut_long and len(value) > _MAX_ASSIGN_LENGTH:
-        value = value[:_MAX_ASSIGN_LENGTH] + '...'
+    if cut_long:
+        # Values are formatted only until the length limit is exceeded.
+        formatter = {'$': cut_unic, '@': _seq2str2_cut,
+                     '&': _dict_to_str_cut}[variable[0]]
+        value = formatter(value, _MAX_ASSIGN_LENGTH)
+        if len(value) > _MAX_ASSIGN_LENGTH:
+            value = value[:_MAX_ASSIGN_LENGTH] + '...'
+    else:
+        value = formatter(value)
     return '%s = %s' % (variable, value)
 
 def _dict_to_str(d):
@@ -94,6 +112,36 @@ def _dict_to_str(d):
                                  for k, v in d.items())
 
 
+def _seq2str2_cut(sequence, max_length):
+    if not sequence:
+        return '[ ]'
+    items = _take_until_length(sequence, max_length,
+                               lambda item: cut_unic(item, max_length))
+    return '[ %s ]' % ' | '.join(items)
+
+
+def _dict_to_str_cut(d, max_length):
+    if not d:
+        return '{ }'
+    def format_item(item):
+        return '%s=%s' % (cut_unic(item[0], max_length),
+                          cut_unic(item[1], max_length))
+    items = _take_until_length(d.items(), max_length, format_item)
+    return '{ %s }' % ' | '.join(items)
+
+
+def _take_until_length(items, max_length, formatter):
+    result = []
+    length = 0
+    for item in items:
+        item = formatter(item)
+        result.append(item)
+        length += len(item) + 3
+        if length > max_length:
+            break
+    return result
+
+
 def get_console_length(text):
     return sum(get_char_width(char) for char in text)
 
@@ -20,6 +20,9 @@ from unicodedata import normalize
 from .platform import PY2, PY3
 from .robottypes import is_bytes, is_unicode, unicode
 
+if PY3:
+    from pprint import _safe_key, _safe_tuple
+
 
 def unic(item):
     item = _unic(item)
@@ -66,10 +69,142 @@ else:
             return _unrepresentable_object(item)
 
 
-def prepr(item, width=80):
+def cut_unic(item, max_length=None):
+    """Like :func:`unic` but cuts the result to ``max_length`` characters.
+
+    Long strings are cut before they are converted and built-in containers
+    are formatted only until the limit is exceeded. Cut results end with
+    ``...``. If ``max_length`` is ``None``, the result is not cut.
+    """
+    if max_length is None:
+        return unic(item)
+    if isinstance(item, (unicode, bytes, bytearray)):
+        return _cut(unic(item[:max_length+1]), max_length)
+    if type(item) in _CONTAINERS:
+        cut = _join_cut(_repr_chunks(item, max_length), max_length)
+        if cut is not None:
+            return cut
+    return _cut(unic(item), max_length)
+
+
+def prepr(item, width=80, max_length=None):
+    """Returns pretty representation of ``item``.
+
+    If ``max_length`` is given, the result is cut to that length. Built-in
+    containers and strings longer than that are formatted on one line and
+    only until the limit is exceeded.
+    """
+    if max_length is not None:
+        if isinstance(item, (unicode, bytes, bytearray)):
+            item = item[:max_length+1]
+        if type(item) in _CONTAINERS or isinstance(item, (unicode, bytes)):
+            cut = _join_cut(_repr_chunks(item, max_length), max_length)
+            if cut is not None:
+                return cut
+        else:
+            return _cut(prepr(item, width), max_length)
     return unic(PrettyRepr(width=width).pformat(item))
 
 
+_CONTAINERS = (list, tuple, dict, set, frozenset)
+_MAX_CHUNK_DEPTH = 100
+
+
+def _cut(text, max_length):
+    if len(text) <= max_length:
+        return text
+    return text[:max_length] + '...'
+
+
+def _join_cut(chunks, max_length):
+    # Returns None if the whole value fits into the limit. Chunks are
+    # generated lazily so that the rest of the value is never formatted.
+    result = []
+    length = 0
+    for chunk in chunks:
+        result.append(chunk)
+        length += len(chunk)
+        if length > max_length:
+            return ''.join(result)[:max_length] + '...'
+    return None
+
+
+def _repr_chunks(item, max_length, depth=0):
+    # Containers are formatted like `PrettyRepr` formats them on one line,
+    # and same as with it, only containers having built-in `__repr__` are
+    # split into items.
+    if depth > _MAX_CHUNK_DEPTH:
+        yield '...'
+    elif isinstance(item, (unicode, bytes, bytearray)):
+        yield PrettyRepr().format(item[:max_length+1], {}, 0, 0)[0]
+    elif _is_plain(item, list) or _is_plain(item, tuple):
+        start, end = ('[', ']') if isinstance(item, list) else ('(', ')')
+        yield start
+        for index, value in enumerate(item):
+            if index:
+                yield ', '
+            for chunk in _repr_chunks(value, max_length, depth+1):
+                yield chunk
+        if isinstance(item, tuple) and len(item) == 1:
+            yield ','
+        yield end
+    elif _is_plain(item, dict):
+        yield '{'
+        for index, (key, value) in enumerate(_sorted_items(item)):
+            if index:
+                yield ', '
+            for chunk in _repr_chunks(key, max_length, depth+1):
+                yield chunk
+            yield ': '
+            for chunk in _repr_chunks(value, max_length, depth+1):
+                yield chunk
+        yield '}'
+    elif (_is_plain(item, set) or _is_plain(item, frozenset)) and item:
+        start, end = _set_start_and_end(item)
+        yield start
+        for index, value in enumerate(_sorted_set(item)):
+            if index:
+                yield ', '
+            for chunk in _repr_chunks(value, max_length, depth+1):
+                yield chunk
+        yield end
+    else:
+        yield PrettyRepr().format(item, {}, 0, 0)[0]
+
+
+def _is_plain(item, container):
+    return (isinstance(item, container)
+            and type(item).__repr__ is container.__repr__)
+
+
+if PY3:
+
+    def _sorted_items(dictionary):
+        return sorted(dictionary.items(), key=_safe_tuple)
+
+    def _sorted_set(items):
+        return sorted(items, key=_safe_key)
+
+    def _set_start_and_end(items):
+        if type(items) is set:
+            return '{', '}'
+        return type(items).__name__ + '({', '})'
+
+else:
+
+    def _sorted_items(dictionary):
+        return _sorted_set(dictionary.items())
+
+    def _sorted_set(items):
+        try:
+            return sorted(items)
+        except TypeError:
+            return list(items)
+
+    def _set_start_and_end(items):
+        return type(items).__name__ + '([', '])'
+
+
 class PrettyRepr(PrettyPrinter):
 
     def format(self, object, context, maxlevels, level):
@@ -18,7 +18,8 @@ import re
 from robot.errors import (DataError, ExecutionStatus, HandlerExecutionFailed,
                           VariableError)
 from robot.utils import (ErrorDetails, format_assign_message, get_error_message,
-                         is_number, is_string, prepr, rstrip, type_name)
+                         is_number, is_string, MAX_FORMATTED_LENGTH, prepr,
+                         rstrip, type_name)
 
 
 class VariableAssignment(object):
@@ -106,7 +107,8 @@ class VariableAssigner(object):
 
     def assign(self, return_value):
         context = self._context
-        context.trace(lambda: 'Return: %s' % prepr(return_value))
+        context.trace(lambda: 'Return: %s'
+                      % prepr(return_value, max_length=MAX_FORMATTED_LENGTH))
         resolver = ReturnValueResolver(self._assignment)
         for name, value in resolver.resolve(return_value):
             if not self._extended_assign(name, value, context.variables):
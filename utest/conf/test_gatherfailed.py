@@ -0,0 +1,172 @@
+import gzip
+import os
+import tempfile
+import unittest
+
+from robot.conf.gatherfailed import (OutputScanner, gather_failed_suites,
+                                     gather_failed_tests)
+from robot.errors import DataError
+from robot.utils.asserts import assert_equal, assert_raises
+
+
+def _suite(name, *children, **config):
+    teardown = config.get('teardown')
+    if teardown:
+        children += ('<kw name="Teardown" type="teardown">\n'
+                     '<kw name="Nested"><status status="PASS"/></kw>\n'
+                     '<status status="%s">Message</status>\n'
+                     '</kw>' % teardown,)
+    return ('<suite name="%s">\n%s\n<status status="FAIL"/>\n</suite>'
+            % (name, '\n'.join(children)))
+
+
+def _test(name, status):
+    return ('<test name="%s">\n'
+            '<kw name="Keyword">\n'
+            '<kw name="Nested"><msg>&lt;status status="FAIL"&gt;</msg>'
+            '<status status="FAIL"/></kw>\n'
+            '<status status="%s"/>\n'
+            '</kw>\n'
+            '<tags><tag>t</tag></tags>\n'
+            '<status status="%s">&lt;/test&gt;</status>\n'
+            '</test>' % (name, status, status))
+
+
+def _output(*suites, **config):
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<robot generator="Robot" rpa="%s">\n%s\n'
+            '<statistics><suite><stat>x</stat></suite></statistics>\n'
+            '<errors><msg level="ERROR">Error</msg></errors>\n'
+            '</robot>\n' % (config.get('rpa', 'false'), '\n'.join(suites)))
+
+
+class TestOutputScanner(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.xml')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _write(self, content):
+        with open(self.path, 'wb') as f:
+            f.write(content.encode('UTF-8'))
+
+    def _scan(self, content):
+        self._write(content)
+        return OutputScanner(self.path).scan()
+
+    def _verify(self, content, tests, suites, rpa=False):
+        assert_equal(self._scan(content), (rpa, tests, suites))
+        assert_equal(gather_failed_tests(self.path), tests)
+        assert_equal(gather_failed_suites(self.path), suites)
+
+    def test_failed_tests_and_suites(self):
+        self._verify(_output(_suite('Root',
+                                    _suite('A', _test('T1', 'PASS'),
+                                           _test('T2', 'FAIL')),
+                                    _suite('B', _test('T1', 'SKIP')),
+                                    _suite('C', _test('T1', 'FAIL')))),
+                     ['Root.A.T2', 'Root.C.T1'], ['Root.A', 'Root.C'])
+
+    def test_rpa(self):
+        self._verify(_output(_suite('S', _test('T', 'FAIL')), rpa='true'),
+                     ['S.T'], ['S'], rpa=True)
+
+    def test_names_are_unescaped_and_glob_escaped(self):
+        self._verify(_output(_suite('S&amp;[x]', _test('&quot;*?&#10;&#x41;',
+                                                       'FAIL'))),
+                     [u'S&[[]x]."[*][?]\nA'],
+                     [u'S&[[]x]'])
+
+    def test_single_quoted_attributes(self):
+        self._verify(_output(_suite('S', _test('T', 'FAIL')))
+                     .replace('"S"', "'S'").replace('"FAIL"', "'FAIL'"),
+                     ['S.T'], ['S'])
+
+    def test_suite_teardown_failure(self):
+        self._verify(_output(_suite('Root',
+                                    _suite('A', _test('T1', 'PASS'),
+                                           _test('T2', 'SKIP'),
+                                           teardown='FAIL'),
+                                    _suite('B', _test('T1', 'PASS')))),
+                     ['Root.A.T1', 'Root.A.T2'], ['Root.A'])
+
+    def test_passing_suite_teardown(self):
+        self._verify(_output(_suite('S', _test('T1', 'PASS'),
+                                    _test('T2', 'FAIL'), teardown='PASS')),
+                     ['S.T2'], ['S'])
+
+    def test_skipped_parent_suite_teardown_overrides_failure(self):
+        content = _output(_suite('Root',
+                                 _suite('A', _test('T', 'PASS'),
+                                        teardown='FAIL'),
+                                 _suite('B', _test('T', 'FAIL')),
+                                 teardown='SKIP'))
+        assert_equal(self._scan(content), (False, [], []))
+        assert_raises(DataError, gather_failed_tests, self.path)
+
+    def test_fallback(self):
+        for content in [_output(_suite('S', '<!-- <test> -->',
+                                       _test('T', 'FAIL'))),
+                        _output(_suite('S', _test('T', 'FAIL')))
+                        .replace('encoding="UTF-8"', 'encoding="ASCII"'),
+                        _output(_suite('S', _test('T', 'FAIL')))
+                        .replace('<robot', '<!DOCTYPE robot>\n<robot')]:
+            self._write(content)
+            assert_raises(OutputScanner.CannotScan,
+                          OutputScanner(self.path).scan)
+            assert_equal(gather_failed_tests(self.path), ['S.T'])
+
+    def test_compressed_output(self):
+        content = _output(_suite('S', _test('T1', 'PASS'), _test('T2', 'FAIL')))
+        with gzip.open(self.path, 'wb') as f:
+            f.write(content.encode('UTF-8'))
+        assert_raises(OutputScanner.CannotScan, OutputScanner(self.path).scan)
+        assert_equal(gather_failed_tests(self.path), ['S.T2'])
+        assert_equal(gather_failed_suites(self.path), ['S'])
+
+    def test_split_output(self):
+        part = self.path[:-4] + '-1.xml'
+        with open(part, 'wb') as f:
+            f.write(_output(_suite('A', _test('T1', 'PASS'),
+                                   _suite('B', _test('T2', 'FAIL')),
+                                   teardown='PASS')).encode('UTF-8'))
+        try:
+            content = _output(_suite('Root', '<suite name="A" file="%s"/>'
+                                     % os.path.basename(part),
+                                     _suite('C', _test('T3', 'FAIL'))))
+            content = content.replace('<robot ', '<robot split="true" ')
+            self._verify(content, ['Root.A.B.T2', 'Root.C.T3'],
+                         ['Root.A.B', 'Root.C'])
+            with open(part, 'wb') as f:
+                f.write(_output(_suite('A', _test('T1', 'PASS'),
+                                       teardown='FAIL')).encode('UTF-8'))
+            self._verify(content, ['Root.A.T1', 'Root.C.T3'],
+                         ['Root.A', 'Root.C'])
+            with gzip.open(part, 'wb') as f:
+                f.write(_output(_suite('A', _test('T1', 'FAIL')))
+                        .encode('UTF-8'))
+            assert_raises(OutputScanner.CannotScan,
+                          OutputScanner(self.path).scan)
+            assert_equal(gather_failed_tests(self.path),
+                         ['Root.A.T1', 'Root.C.T3'])
+        finally:
+            os.remove(part)
+
+    def test_invalid_output(self):
+        for content in ['', '<xml><but not="correct"/></xml>',
+                        _output(_suite('S', _test('T', 'FAIL')))[:-50]]:
+            self._write(content)
+            assert_raises(OutputScanner.CannotScan,
+                          OutputScanner(self.path).scan)
+            assert_raises(DataError, gather_failed_tests, self.path)
+
+    def test_non_existing_output(self):
+        assert_raises(OutputScanner.CannotScan,
+                      OutputScanner(self.path + '.nonex').scan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -97,6 +97,19 @@ class TestRobotAndRebotSettings(unittest.TestCase):
     def _verify_invalid_log_level(self, input):
         self.assertRaises(DataError, RobotSettings, {'loglevel': input})
 
+    def test_log_compression_level(self):
+        for cls in RobotSettings, RebotSettings:
+            assert_equal(cls().log_compression_level, 9)
+            assert_equal(cls(logcompressionlevel='1').log_compression_level, 1)
+            assert_equal(cls(logcompressionlevel=0).log_compression_level, 0)
+        assert_equal(RobotSettings(logcompressionlevel='3')
+                     .get_rebot_settings().log_compression_level, 3)
+
+    def test_invalid_log_compression_level(self):
+        for value in ['10', '-1', 'fast']:
+            self.assertRaises(DataError, RebotSettings,
+                              {'logcompressionlevel': value})
+
 
 if __name__ == '__main__':
     unittest.main()
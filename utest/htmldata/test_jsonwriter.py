@@ -95,5 +95,48 @@ class TestJsonDumper(unittest.TestCase):
             self._test(data, expected)
 
 
+class TestFastEncodingIsIdenticalToDumpers(unittest.TestCase):
+
+    def _dump(self, data, mapping=None, fast=True):
+        output = StringIO()
+        dumper = JsonDumper(output)
+        if not fast:
+            dumper._encoder = None
+        dumper.dump(data, mapping)
+        return output.getvalue()
+
+    def _test(self, data, mapping=None):
+        assert_equal(self._dump(data, mapping),
+                     self._dump(data, mapping, fast=False))
+
+    def test_nested_tuples(self):
+        self._test((1, (2, (3, None, True), ()), ((((-1,),),),)))
+
+    def test_strings_needing_custom_escaping(self):
+        self._test(('</script>', 'back\\slash', 'control\x01\x1f\b\f',
+                    u'non-ascii \xe4 \u2028', '"quoted"\t\r\n'))
+
+    def test_strings_not_needing_custom_escaping(self):
+        self._test(('plain', '"quoted"\t\r\n', '<b>html</b'))
+
+    def test_int_subclasses(self):
+        class Index(int):
+            pass
+        self._test((Index(1), (Index(2), 3)))
+
+    def test_dicts(self):
+        self._test([{'b': (1, 2), 'a': {'x': '</'}}, {42: 'non-string key'}])
+
+    def test_mapping(self):
+        part = (1, (2, 3))
+        self._test((part, (part, 4), (1, (2, 3)), [part]),
+                   mapping={part: 'window.sPart0'})
+        self._test(('mapped', {'key': 'mapped'}, (1, 'mapped')),
+                   mapping={'mapped': 'raw'})
+
+    def test_float_not_supported(self):
+        assert_raises(ValueError, self._dump, (1, 2.0))
+
+
 if __name__ == '__main__':
     unittest.main()
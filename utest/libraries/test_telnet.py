@@ -0,0 +1,227 @@
+import re
+import socket
+import time
+import unittest
+
+from robot.utils.asserts import assert_equal, assert_true
+
+try:
+    import telnetlib
+except ImportError:
+    telnetlib = None
+else:
+    from robot.libraries.Telnet import IncrementalSearch, TelnetConnection
+
+
+class FakeSocket(object):
+
+    def __init__(self, chunks=(), forever=None):
+        self._chunks = list(chunks)
+        self._forever = forever
+        self._reader, self._writer = socket.socketpair()
+        # Socket is readable as long as there are chunks or forever.
+        self._writer.send(b'x')
+        self.sent = []
+        self.recv_calls = 0
+
+    def recv(self, size):
+        self.recv_calls += 1
+        if self._chunks:
+            return self._chunks.pop(0)[:size]
+        if self._forever:
+            return self._forever
+        self._reader.recv(1)
+        return b''
+
+    def sendall(self, data):
+        self.sent.append(data)
+
+    def fileno(self):
+        return self._reader.fileno()
+
+    def close(self):
+        self._reader.close()
+        self._writer.close()
+
+
+def _connection(sock):
+    conn = TelnetConnection()
+    conn.sock = sock
+    return conn
+
+
+@unittest.skipIf(telnetlib is None, 'telnetlib not available')
+class TestIncrementalSearch(unittest.TestCase):
+    data = (b'Last login: Mon Oct 19 10:00:00 2026\r\n'
+            b'device> enable\r\nPassword: ********\r\n'
+            b'device# show version 12.3(4)T\r\ndevice# ')
+
+    def _verify(self, pattern, flags=0):
+        regexp = re.compile(pattern, flags)
+        for size in 1, 2, 3, 7, 50:
+            search = IncrementalSearch(regexp)
+            for end in range(size, len(self.data) + size, size):
+                buffer = self.data[:end]
+                expected = regexp.search(buffer)
+                match = search.search(buffer)
+                assert_equal(match and match.span(),
+                             expected and expected.span(),
+                             '%r with %r' % (pattern, buffer))
+                if expected:
+                    break
+
+    def test_bounded(self):
+        for pattern in [b'device#', b'[a-z]{1,10}#', b'\\d\\d:\\d\\d',
+                        b'(enable|show)\\s', b'\\(\\d\\)T', b'nomatch']:
+            self._verify(pattern)
+
+    def test_unbounded(self):
+        for pattern in [b'\\w+#', b'device.*#', b'sw.*?n', b'(\\d+\\.)+\\d+',
+                        b'x*nomatch']:
+            self._verify(pattern)
+
+    def test_lookahead(self):
+        for pattern in [b'device(?=#)', b'device(?!>)', b'\\d(?=\\()']:
+            self._verify(pattern)
+
+    def test_lookbehind(self):
+        for pattern in [b'(?<=device)#', b'(?<!device)> ', b'(?<=login: )Mon']:
+            self._verify(pattern)
+
+    def test_word_boundary(self):
+        for pattern in [b'\\bdevice\\b', b'Pass\\B', b'version\\b']:
+            self._verify(pattern)
+
+    def test_anchors(self):
+        for pattern in [b'^Last', b'^device', b'# $', b'#$', b'T\\r$']:
+            self._verify(pattern)
+        for pattern in [b'^device#', b'\\)T\\r$', b'^Pass']:
+            self._verify(pattern, re.MULTILINE)
+
+    def test_backreference(self):
+        for pattern in [b'(\\*)\\1\\1', b'(de)vice# \\1?',
+                        b'(\\()?\\d(?(1)\\)|\\.)']:
+            self._verify(pattern)
+            assert_equal(IncrementalSearch(re.compile(pattern))._overlap, None)
+
+    def test_bounded_overlap(self):
+        assert_equal(IncrementalSearch(re.compile(b'[a-z]{1,10}#'))._overlap, 11)
+
+
+@unittest.skipIf(telnetlib is None, 'telnetlib not available')
+class TestProcessRawq(unittest.TestCase):
+    IAC, SB, SE = telnetlib.IAC, telnetlib.SB, telnetlib.SE
+    data = (b'Hello\x00 ' + IAC + telnetlib.DO + telnetlib.ECHO +
+            b'world' + IAC + IAC + b'\x11!\r\n' +
+            IAC + telnetlib.WILL + telnetlib.SGA +
+            IAC + SB + telnetlib.TTYPE + b'\x01' + IAC + SE +
+            IAC + telnetlib.NOP + b'prompt> ' +
+            IAC + telnetlib.DONT + telnetlib.LINEMODE + b'end')
+
+    def _process(self, conn, chunks):
+        calls = []
+        conn.set_option_negotiation_callback(
+            lambda sock, cmd, opt: calls.append((cmd, opt, conn.sbdataq))
+        )
+        for chunk in chunks:
+            conn.rawq += chunk
+            conn.process_rawq()
+        return conn.cookedq, conn.read_sb_data(), calls
+
+    def _verify(self, chunks):
+        expected = self._process(telnetlib.Telnet(), chunks)
+        actual = self._process(_connection(FakeSocket()), chunks)
+        assert_equal(actual, expected, repr(chunks))
+
+    def test_whole(self):
+        self._verify([self.data])
+
+    def test_split_into_chunks(self):
+        for size in range(1, 10):
+            self._verify([self.data[i:i+size]
+                          for i in range(0, len(self.data), size)])
+
+    def test_split_at_every_iac(self):
+        chunks = self.data.split(self.IAC)
+        self._verify([chunks[0]] + [self.IAC + c for c in chunks[1:]])
+        self._verify([c + self.IAC for c in chunks[:-1]] + [chunks[-1]])
+
+    def test_no_commands(self):
+        self._verify([b'plain ', b'output\x00\x11\r\n', b''])
+
+
+@unittest.skipIf(telnetlib is None, 'telnetlib not available')
+class TestExpect(unittest.TestCase):
+
+    def test_match(self):
+        conn = _connection(FakeSocket([b'login: ', b'x\r\ndevice', b'# more']))
+        index, match, output = conn.expect([b'nomatch', b'device#'], timeout=1)
+        assert_equal((index, match.group(), output),
+                     (1, b'device#', b'login: x\r\ndevice#'))
+        assert_equal(conn.cookedq, b' more')
+
+    def test_no_match(self):
+        conn = _connection(FakeSocket([b'login: ', b'xxx']))
+        start = time.time()
+        index, match, output = conn.expect([b'#'], timeout=0.2)
+        assert_equal((index, match, output), (-1, None, b'login: xxx'))
+        assert_true(time.time() - start < 1)
+
+    def test_eof(self):
+        conn = _connection(FakeSocket([b'login: ']))
+        index, match, output = conn.expect([b'#'], timeout=1)
+        assert_equal((index, match, output), (-1, None, b'login: '))
+        self.assertRaises(EOFError, conn.expect, [b'#'], 1)
+
+    def test_continuously_streaming_socket(self):
+        sock = FakeSocket([b'device# '], forever=b'x' * 100)
+        conn = _connection(sock)
+        index, match, output = conn.expect([b'device#'], timeout=1)
+        assert_equal((index, output), (0, b'device#'))
+        assert_true(sock.recv_calls <= conn.MAX_RECEIVES_BEFORE_SEARCH + 1,
+                    sock.recv_calls)
+
+    def test_timeout_with_continuously_streaming_socket(self):
+        sock = FakeSocket(forever=b'x' * 100)
+        conn = _connection(sock)
+        start = time.time()
+        index, match, output = conn.expect([b'#'], timeout=0.2)
+        assert_equal(index, -1)
+        assert_true(time.time() - start < 1)
+        assert_true(output.startswith(b'xxx'))
+
+
+class FakeTerminalEmulator(object):
+
+    def __init__(self):
+        self.fed = []
+
+    def feed(self, text):
+        self.fed.append(text)
+
+
+@unittest.skipIf(telnetlib is None, 'telnetlib not available')
+class TestFeedTerminalEmulator(unittest.TestCase):
+
+    def _feed(self, sock, matches, timeout=1):
+        conn = _connection(sock)
+        conn._terminal_emulator = FakeTerminalEmulator()
+        result = conn._feed_terminal_emulator(time.time() + timeout, matches)
+        return result, conn._terminal_emulator.fed
+
+    def test_available_output_is_fed_at_once(self):
+        result, fed = self._feed(FakeSocket([b'a', b'b', b'c']),
+                                 lambda out: False)
+        assert_equal((result, fed), (True, ['abc']))
+
+    def test_continuously_streaming_socket(self):
+        start = time.time()
+        result, fed = self._feed(FakeSocket(forever=b'x' * 100),
+                                 lambda out: False, timeout=0.2)
+        assert_true(time.time() - start < 1)
+        assert_equal(result, True)
+        assert_true(fed[0].startswith('xxx'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,8 @@ import unittest
 
 from robot.utils.asserts import assert_equal, assert_false, assert_not_equal, assert_true
 from robot.utils import seq2str, IRONPYTHON, PY2, unicode
-from robot.model.tags import Tags, TagPattern, TagPatterns
+from robot.model import TestSuite
+from robot.model.tags import Tags, TagIndex, TagPattern, TagPatterns
 
 
 class TestTags(unittest.TestCase):
@@ -345,6 +346,46 @@ class TestTagPatterns(unittest.TestCase):
         assert_equal(seq2str(patterns), u"'is\xe4' and '\xe4iti'")
 
 
+class TestTagIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.suite = TestSuite()
+        sub = self.suite.suites.create()
+        sub.tests.create(name='t1', tags=['foo', 'bar'])
+        sub.tests.create(name='t2', tags=['F O O', 'xxx'])
+        self.suite.tests.create(name='t3', tags=['Bar', 'yyy'])
+        self.suite.tests.create(name='t4')
+        self.index = TagIndex(self.suite)
+
+    def test_tags(self):
+        assert_equal(sorted(self.index.tags), ['bar', 'foo', 'xxx', 'yyy'])
+
+    def test_all_tests(self):
+        assert_equal(self._names(self.index.all_tests),
+                     ['t1', 't2', 't3', 't4'])
+
+    def test_tests_with(self):
+        assert_equal(self._names(self.index.tests_with('foo')), ['t1', 't2'])
+        assert_equal(self._names(self.index.tests_with('nonex')), [])
+
+    def test_select_is_same_as_match(self):
+        for pattern in ['foo', 'FOO', 'b*', '?ar', 'nonex', '*',
+                        'fooANDbar', 'fooORyyy', 'fooNOTbar', 'NOTfoo',
+                        'x*ORfooANDbarNOTyyy', 'bar NOT foo OR yyy']:
+            patterns = TagPatterns(pattern)
+            expected = [t.name for t in self.index.all_tests
+                        if patterns.match(t.tags)]
+            assert_equal(self._names(self.index.select(patterns)),
+                         sorted(expected), pattern)
+
+    def test_select_with_multiple_patterns(self):
+        patterns = TagPatterns(['xxx', 'yyy', 'nonex'])
+        assert_equal(self._names(self.index.select(patterns)), ['t2', 't3'])
+
+    def _names(self, tests):
+        return sorted(t.name for t in tests)
+
+
 class AndOrPatternGenerator(object):
     tags = ['0', '1']
     operators = ['OR', 'AND']
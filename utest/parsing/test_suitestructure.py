@@ -0,0 +1,140 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from robot.errors import DataError
+from robot.output import LOGGER
+from robot.parsing.suitestructure import (SuiteStructureBuilder,
+                                          SuiteStructureVisitor)
+from robot.utils.asserts import assert_equal, assert_raises
+
+
+class Collector(SuiteStructureVisitor):
+
+    def __init__(self, root):
+        self.root = root
+        self.paths = []
+
+    def visit_file(self, structure):
+        self.paths.append(self._relative(structure.source))
+
+    def start_directory(self, structure):
+        self.paths.append(self._relative(structure.source) + '/')
+        if structure.init_file:
+            self.paths.append(self._relative(structure.init_file))
+
+    def _relative(self, path):
+        return os.path.relpath(path, self.root).replace(os.sep, '/')
+
+
+class MessageCollector(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        self.messages.append((msg.level, msg.message))
+
+
+class TestSuiteStructureBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.messages = MessageCollector()
+        LOGGER.register_logger(self.messages)
+
+    def tearDown(self):
+        LOGGER.unregister_logger(self.messages)
+        shutil.rmtree(self.root)
+
+    def _create(self, *paths):
+        for path in paths:
+            path = os.path.join(self.root, *path.split('/'))
+            if path.endswith(os.sep):
+                os.makedirs(path)
+            else:
+                with open(path, 'w') as f:
+                    f.write('*** Test Cases ***\nT\n    No Operation\n')
+
+    def _write_ignore_file(self, directory, *lines):
+        path = os.path.join(self.root, directory, '.robotignore')
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines))
+
+    def _build(self, included_suites=None):
+        structure = SuiteStructureBuilder(included_suites=included_suites) \
+            .build([self.root])
+        collector = Collector(os.path.dirname(self.root))
+        for child in structure.children:
+            child.visit(collector)
+        root = os.path.basename(self.root)
+        return [p[len(root)+1:] for p in collector.paths]
+
+    def test_structure_is_sorted_depth_first(self):
+        self._create('b/', 'a/', 'a/c/', 'B.robot', 'a/z.robot', 'a/c/x.robot',
+                     'a/__init__.robot', 'a.robot', 'ignored.txt', '_x.robot')
+        assert_equal(self._build(),
+                     ['a/', 'a/__init__.robot', 'a/c/', 'a/c/x.robot',
+                      'a/z.robot', 'a.robot', 'b/', 'B.robot'])
+
+    def test_ignore_file(self):
+        self._create('a/', 'a/b/', 'a/b/wip/', 'wip/', 'x_wip.robot',
+                     'keep.robot', 'a/b/wip/t.robot', 'a/b/t.robot',
+                     'a/b/t_wip.robot', 'wip/t.robot', 'a/keep.robot')
+        self._write_ignore_file('', '# Comment', '', '*_wip.robot',
+                                '/wip/', 'a/keep.robot')
+        assert_equal(self._build(),
+                     ['a/', 'a/b/', 'a/b/t.robot', 'a/b/wip/',
+                      'a/b/wip/t.robot', 'keep.robot'])
+
+    def test_ignore_file_in_subdirectory(self):
+        self._create('a/', 'b/', 'a/x.robot', 'a/y.robot', 'b/x.robot')
+        self._write_ignore_file('a', 'x.robot')
+        assert_equal(self._build(), ['a/', 'a/y.robot', 'b/', 'b/x.robot'])
+
+    def test_patterns_ending_with_slash_match_only_directories(self):
+        self._create('a/', 'a/t.robot', 'b/', 'b/a', 'b/t.robot')
+        self._write_ignore_file('', 'a/')
+        assert_equal(self._build(), ['b/', 'b/t.robot'])
+
+    def test_ignored_paths_are_logged(self):
+        self._create('a.robot', 'b.robot')
+        self._write_ignore_file('', 'b.robot')
+        self._build()
+        ignored = [msg for level, msg in self.messages.messages
+                   if msg.startswith('Ignoring') and self.root in msg]
+        assert_equal(ignored,
+                     ["Ignoring file or directory '%s'."
+                      % os.path.join(self.root, name)
+                      for name in ('.robotignore', 'b.robot')])
+
+    def test_discovery_is_logged(self):
+        self._create('a/', 'a/__init__.robot', 'a/t.robot', 'b.robot')
+        self._build()
+        discovered = [msg for level, msg in self.messages.messages
+                      if msg.startswith('Discovered')]
+        assert_equal(len(discovered), 1)
+        assert discovered[0].startswith('Discovered 3 files in 2 directories '
+                                        'in '), discovered[0]
+
+    def test_included_suites(self):
+        self._create('a/', 'a/t.robot', 'a/u.robot', 'b/', 'b/t.robot')
+        assert_equal(self._build(['u']), ['a/', 'a/u.robot', 'b/'])
+
+    def test_invalid_ignore_file(self):
+        path = os.path.join(self.root, '.robotignore')
+        with open(path, 'wb') as f:
+            f.write(b'\xff\xfe\xff')
+        assert_raises(DataError, self._build)
+
+    def test_many_directories(self):
+        expected = []
+        for i in range(50):
+            self._create('d%02d/' % i, 'd%02d/t.robot' % i)
+            expected.extend(['d%02d/' % i, 'd%02d/t.robot' % i])
+        assert_equal(self._build(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
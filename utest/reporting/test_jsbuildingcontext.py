@@ -3,7 +3,8 @@ import unittest
 from robot.output.loggerhelper import LEVELS
 
 from robot.reporting.jsmodelbuilders import JsBuildingContext
-from robot.utils.asserts import assert_equal
+from robot.utils import compress_text
+from robot.utils.asserts import assert_equal, assert_true
 
 
 class TestStringContext(unittest.TestCase):
@@ -29,6 +30,19 @@ class TestStringContext(unittest.TestCase):
     def test_none_string(self):
         self._verify([None, '', None], [0, 0, 0], [])
 
+    def test_compress_level(self):
+        text = 'Hello, world! ' * 100
+        expected = compress_text(text, 1)
+        ctx = JsBuildingContext(split_log=True, compress_level=1)
+        ctx.string(text)
+        ctx.start_splitting_if_needed(split=True)
+        ctx.string(text)
+        assert_equal(ctx.strings, ('*', expected))
+        ctx.end_splitting(None)
+        assert_equal(ctx.strings, ('*', expected))
+        assert_equal(ctx.split_results[0][1], ('*', expected))
+        assert_true(expected != compress_text(text))
+
     def _verify(self, strings, exp_ids, exp_strings, escape=True):
         exp_strings = tuple('*'+s for s in [''] + exp_strings)
         ctx = JsBuildingContext()
@@ -1,7 +1,11 @@
+import base64
+import json
+import re
 import unittest
+import zlib
 
 from robot.reporting.jsexecutionresult import JsExecutionResult
-from robot.reporting.jswriter import JsResultWriter
+from robot.reporting.jswriter import DataBlockWriter, JsResultWriter
 from robot.utils import StringIO
 from robot.utils.asserts import assert_equal, assert_true
 
@@ -100,5 +104,22 @@ class TestSuiteWriter(unittest.TestCase):
         assert_separators(lines, 'foo')
 
 
+class TestDataBlockWriter(unittest.TestCase):
+
+    def test_blocks_are_compressed_json(self):
+        output = StringIO()
+        DataBlockWriter(output).write([((0, 1, None), ('*', '*x')),
+                                       ((), ('*',))])
+        blocks = re.findall('<script type="text/x-robot-data" '
+                            'id="robot-data-(\\d)">(.*)</script>',
+                            output.getvalue())
+        assert_equal([(index, self._decode(data)) for index, data in blocks],
+                     [('1', [[0, 1, None], ['*', '*x']]),
+                      ('2', [[], ['*']])])
+
+    def _decode(self, data):
+        return json.loads(zlib.decompress(base64.b64decode(data)).decode('UTF-8'))
+
+
 if __name__ == '__main__':
     unittest.main()
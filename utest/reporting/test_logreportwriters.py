@@ -34,6 +34,14 @@ class TestLogWriter(unittest.TestCase):
                        (3, ((1, 2), (3, 4, ())), ('*',), 'mylog-3.js')],
                       writer.split_write_calls)
 
+    def test_lazy_log_is_not_split_to_files(self):
+        class model:
+            split_results = [((0, 1, 2, -1), ('*', '*1', '*2'))]
+        writer = LogWriterWithMockedWriting(model)
+        writer.write('mylog.html', {'lazyLog': True})
+        assert_true(writer.write_called)
+        assert_equal(writer.split_write_calls, [])
+
 
 if __name__ == '__main__':
     unittest.main()
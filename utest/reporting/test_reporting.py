@@ -125,6 +125,8 @@ class StubSettings(object):
     log = None
     log_config = {}
     split_log = False
+    lazy_log = False
+    log_compression_level = 9
     report = None
     report_config = None
     output = None
@@ -59,6 +59,61 @@ class TestStringCache(unittest.TestCase):
         for i1, i2 in zip(indices1, indices2):
             assert_true(i1 is i2, 'not same: %s and %s' % (i1, i2))
 
+    def test_compress_level(self):
+        text = 'long'*1000
+        fast = StringCache(compress_level=1)
+        fast.add(text)
+        assert_equal(fast.dump(), ('*', fast._encode(text)))
+        assert_true(fast.dump()[1] != self._compress(text))
+
+    def test_dump_after_adding_more(self):
+        self.cache.add('first')
+        assert_equal(self.cache.dump(), ('*', '*first'))
+        self.cache.add('second')
+        self.cache.add('first')
+        assert_equal(self.cache.dump(), ('*', '*first', '*second'))
+
+    def test_parallel_compression(self):
+        values = [self._generate_random_string(200) for _ in range(2000)]
+        serial = StringCache(workers=1)
+        parallel = StringCache(workers=4)
+        for value in values[:1000]:
+            serial.add(value)
+            parallel.add(value)
+        pool = parallel._pool
+        assert_true(pool is not None)
+        for value in values[1000:]:
+            serial.add(value)
+            parallel.add(value)
+        assert_true(parallel._pool is pool)
+        assert_equal(serial.dump(), parallel.dump())
+        assert_true(parallel._pool is None)
+        assert_false(any(worker.is_alive() for worker in pool._pool))
+
+    def test_pending_strings_are_compressed_in_batches(self):
+        values = [self._generate_random_string(200) for _ in range(2500)]
+        indices = [self.cache.add(value) for value in values]
+        assert_equal(len(self.cache._pending), 500)
+        assert_equal(self.cache._strings[indices[1999]],
+                     self._compress(values[1999]))
+        assert_equal(self.cache._strings[indices[2000]], '*' + values[2000])
+        dumped = self.cache.dump()
+        assert_equal(self.cache._pending, [])
+        assert_equal([dumped[i] for i in indices],
+                     [self._compress(value) for value in values])
+
+    def test_duplicates_are_detected_after_compression(self):
+        values = [self._generate_random_string(200) for _ in range(1500)]
+        indices = [self.cache.add(value) for value in values]
+        assert_equal([self.cache.add(value) for value in values], indices)
+        assert_equal(len(self.cache.dump()), 1501)
+
+    def test_non_ascii_and_surrogates(self):
+        strings = [u'\xe4' * 100, u'\u2603' * 100, u'\ud800' * 100]
+        indices = [self.cache.add(s) for s in strings]
+        assert_equal([self.cache.add(s) for s in strings], indices)
+        assert_equal(len(set(indices)), 3)
+
 
 class TestStringIndex(unittest.TestCase):
 
@@ -4,7 +4,8 @@ from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_tru
 
 from robot.errors import DataError
 from robot.result import Keyword, TestCase, TestSuite
-from robot.result.configurer import SuiteConfigurer
+from robot.model import SuiteVisitor
+from robot.result.configurer import SuiteConfigurer, VisitorChain
 
 
 SETUP = Keyword.SETUP_TYPE
@@ -227,6 +228,39 @@ class TestRemoveKeywords(unittest.TestCase):
         assert_equal(len(t2.keywords[0].messages), 1)
         assert_equal(len(t2.keywords[1].keywords), 1)
 
+    def test_combined_removers_work_like_sequential_removers(self):
+        def create():
+            suite = TestSuite()
+            suite.setup.config(kwname='BuiltIn.Wait Until Keyword Succeeds',
+                               status='PASS')
+            for status in 'FAIL', 'FAIL', 'PASS':
+                suite.setup.keywords.create(status=status)
+            test = suite.tests.create(status='PASS')
+            test.keywords.create(kwname='K').messages.create('m', 'DEBUG')
+            test = suite.tests.create(status='PASS')
+            test.keywords.create().messages.create('w', 'WARN')
+            return suite
+        for options in [['WUKS', 'PASSED'], ['PASSED', 'WUKS'],
+                        ['ALL', 'NAME:K'], ['NAME:K', 'PASSED', 'FOR']]:
+            for level in 'TRACE', 'INFO', 'ERROR':
+                combined, sequential = create(), create()
+                combined.visit(SuiteConfigurer(remove_keywords=options,
+                                               log_level=level))
+                for option in options:
+                    self._remove(option, sequential)
+                sequential.filter_messages(level)
+                self._assert_same(combined, sequential)
+
+    def _assert_same(self, suite1, suite2):
+        for kw1, kw2 in zip(chain([suite1.setup], suite1.tests[0].keywords,
+                                  suite1.tests[1].keywords),
+                            chain([suite2.setup], suite2.tests[0].keywords,
+                                  suite2.tests[1].keywords)):
+            assert_equal(kw1.doc, kw2.doc)
+            assert_equal(len(kw1.keywords), len(kw2.keywords))
+            assert_equal([m.message for m in kw1.messages],
+                         [m.message for m in kw2.messages])
+
     def _suite_with_setup_and_teardown_and_test_with_keywords(self):
         suite = TestSuite()
         suite.setup.config(kwname='S', status='PASS').messages.create('setup message')
@@ -250,5 +284,52 @@ class TestRemoveKeywords(unittest.TestCase):
         self._remove('FOR', item)
 
 
+class Recorder(SuiteVisitor):
+
+    def __init__(self, name, log, stop=None):
+        self.name = name
+        self.log = log
+        self.stop = stop
+
+    def start_test(self, test):
+        self.log.append('%s start %s' % (self.name, test.name))
+
+    def end_test(self, test):
+        self.log.append('%s end %s' % (self.name, test.name))
+
+    def start_keyword(self, kw):
+        self.log.append('%s start %s' % (self.name, kw.name))
+        if kw.name == self.stop:
+            return False
+
+    def end_keyword(self, kw):
+        self.log.append('%s end %s' % (self.name, kw.name))
+
+
+class TestVisitorChain(unittest.TestCase):
+
+    def test_visitors_are_called_in_order(self):
+        log = []
+        test = TestCase(name='T')
+        test.keywords.create(kwname='K1').keywords.create(kwname='K2')
+        test.visit(VisitorChain([Recorder('a', log, stop='K1'),
+                                 Recorder('b', log)]))
+        assert_equal(log, ['a start T', 'b start T',
+                           'a start K1', 'b start K1',
+                           'b start K2', 'b end K2',
+                           'b end K1',
+                           'a end T', 'b end T'])
+
+    def test_children_not_visited_if_all_visitors_stop(self):
+        log = []
+        test = TestCase(name='T')
+        test.keywords.create(kwname='K1').keywords.create(kwname='K2')
+        test.visit(VisitorChain([Recorder('a', log, stop='K1'),
+                                 Recorder('b', log, stop='K1')]))
+        assert_equal(log, ['a start T', 'b start T',
+                           'a start K1', 'b start K1',
+                           'a end T', 'b end T'])
+
+
 if __name__ == '__main__':
     unittest.main()
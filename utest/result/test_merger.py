@@ -0,0 +1,84 @@
+import unittest
+
+from robot.errors import DataError
+from robot.result import Result, TestSuite
+from robot.result.merger import Merger
+from robot.utils.asserts import assert_equal, assert_raises, assert_true
+
+
+def _result(*suites):
+    result = Result(root_suite=TestSuite(name='Root'))
+    for name, tests in suites:
+        suite = result.suite.suites.create(name=name)
+        for test in tests:
+            suite.tests.create(name=test[0], status=test[1])
+    return result
+
+
+def _statuses(result):
+    return [(suite.name, [(test.name, test.status) for test in suite.tests])
+            for suite in result.suite.suites]
+
+
+class TestMerger(unittest.TestCase):
+
+    def test_replace_and_add(self):
+        result = _result(('S1', [('T1', 'FAIL'), ('T2', 'PASS')]),
+                         ('S2', [('T1', 'FAIL')]))
+        merged = _result(('S1', [('T1', 'PASS'), ('T3', 'FAIL')]),
+                         ('S3', [('T1', 'PASS')]))
+        Merger(result).merge(merged)
+        assert_equal(_statuses(result),
+                     [('S1', [('T1', 'PASS'), ('T2', 'PASS'), ('T3', 'FAIL')]),
+                      ('S2', [('T1', 'FAIL')]),
+                      ('S3', [('T1', 'PASS')])])
+        test = result.suite.suites[0].tests[0]
+        assert_true(test.message.startswith('*HTML* <span class="merge">'))
+        assert_true(test.parent is result.suite.suites[0])
+        assert_true(result.suite.suites[0].tests[2].message.startswith(
+            '*HTML* Test added from merged output.'))
+
+    def test_first_item_with_same_name_is_replaced(self):
+        result = _result(('S', [('T', 'FAIL'), ('T', 'FAIL')]))
+        Merger(result).merge(_result(('S', [('T', 'PASS')])))
+        assert_equal(_statuses(result), [('S', [('T', 'PASS'), ('T', 'FAIL')])])
+
+    def test_added_items_can_be_replaced(self):
+        result = _result(('S', [('T1', 'FAIL')]))
+        Merger(result).merge(_result(('S', [('T2', 'FAIL'), ('T2', 'PASS')])))
+        assert_equal(_statuses(result), [('S', [('T1', 'FAIL'),
+                                                ('T2', 'PASS')])])
+
+    def test_merge_multiple_results(self):
+        result = _result(('S', [('T1', 'FAIL'), ('T2', 'FAIL')]))
+        Merger(result).merge(_result(('S', [('T1', 'PASS')])),
+                             _result(('S', [('T2', 'PASS'), ('T3', 'SKIP')])),
+                             _result(('S', [('T3', 'PASS')])))
+        assert_equal(_statuses(result), [('S', [('T1', 'PASS'),
+                                                ('T2', 'PASS'),
+                                                ('T3', 'PASS')])])
+
+    def test_result_modified_between_merges(self):
+        result = _result(('S', [('T1', 'FAIL'), ('T2', 'FAIL')]))
+        merger = Merger(result)
+        merger.merge(_result(('S', [('T2', 'PASS')])))
+        result.suite.suites[0].tests.pop(0)
+        merger.merge(_result(('S', [('T2', 'SKIP')])))
+        assert_equal(_statuses(result), [('S', [('T2', 'SKIP')])])
+
+    def test_different_root_suites(self):
+        merged = _result()
+        merged.suite.name = 'Other'
+        assert_raises(DataError, Merger(_result()).merge, merged)
+
+    def test_many_tests(self):
+        tests = [('T%d' % i, 'FAIL') for i in range(10000)]
+        result = _result(('S', tests))
+        Merger(result).merge(_result(('S', [(name, 'PASS')
+                                            for name, _ in reversed(tests)])))
+        assert_equal(_statuses(result), [('S', [(name, 'PASS')
+                                                for name, _ in tests])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,13 @@
+import os
+import shutil
+import tempfile
 import unittest
 from os.path import join, dirname
 
 from robot.errors import DataError
-from robot.result import ExecutionResult, Result
-from robot.utils import StringIO, PY3
+from robot.output.xmllogger import XmlLogger
+from robot.result import ExecutionResult, Result, TestSuite
+from robot.utils import ET, StringIO, PY3
 from robot.utils.asserts import assert_equal, assert_true, assert_raises
 
 
@@ -241,6 +245,93 @@ class TestSuiteTeardownFailed(unittest.TestCase):
             assert_equal(list(item.keywords), [])
 
 
+class TestSplitOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = join(self.directory, 'output.xml')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, path):
+        result = Result(root_suite=TestSuite(name='Root'))
+        root = result.suite
+        root.teardown.config(kwname='Teardown', type='teardown', status='PASS')
+        for name in 'A', 'B':
+            suite = root.suites.create(name=name)
+            suite.suites.create(name='Sub').tests.create(name='T1',
+                                                         status='FAIL')
+            suite.tests.create(name='T2', status='PASS')
+        logger = XmlLogger(path, split=True)
+        result.suite.visit(logger)
+        result.statistics.visit(logger)
+        logger.close()
+        return result
+
+    def _verify(self, result, expected):
+        assert_equal([(t.longname, t.status) for t in _all_tests(result.suite)],
+                     [(t.longname, t.status) for t in _all_tests(expected.suite)])
+        assert_equal([s.longname for s in _all_suites(result.suite)],
+                     [s.longname for s in _all_suites(expected.suite)])
+        assert_equal(result.suite.teardown.name, 'Teardown')
+
+    def test_parts_are_written(self):
+        self._write(self.path)
+        assert_equal(sorted(os.listdir(self.directory)),
+                     ['output-1.xml', 'output-2.xml', 'output.xml'])
+        main = ET.parse(self.path).getroot()
+        assert_equal(main.get('split'), 'true')
+        placeholders = main.findall('suite/suite')
+        assert_equal([dict(p.attrib) for p in placeholders],
+                     [{'id': 's1-s1', 'name': 'A', 'file': 'output-1.xml'},
+                      {'id': 's1-s2', 'name': 'B', 'file': 'output-2.xml'}])
+        assert_equal([len(p) for p in placeholders], [0, 0])
+        assert_equal(main.findall('.//test'), [])
+        part = ExecutionResult(join(self.directory, 'output-2.xml'))
+        assert_equal(part.suite.longname, 'B')
+        assert_equal([t.name for t in _all_tests(part.suite)], ['T2', 'T1'])
+
+    def test_parts_are_read(self):
+        expected = self._write(self.path)
+        self._verify(ExecutionResult(self.path), expected)
+        self._verify(ExecutionResult(self.path, include_keywords=False),
+                     expected)
+        self._verify(ExecutionResult(self.path, flattened_keywords=['name:X']),
+                     expected)
+
+    def test_compressed(self):
+        path = self.path + '.gz'
+        expected = self._write(path)
+        assert_true(os.path.exists(join(self.directory, 'output-1.xml.gz')))
+        self._verify(ExecutionResult(path), expected)
+
+    def test_relative_path(self):
+        expected = self._write(self.path)
+        cwd = os.getcwd()
+        os.chdir(tempfile.gettempdir())
+        try:
+            path = os.path.relpath(self.path)
+            self._verify(ExecutionResult(path), expected)
+        finally:
+            os.chdir(cwd)
+
+
+def _all_tests(suite):
+    for test in suite.tests:
+        yield test
+    for child in suite.suites:
+        for test in _all_tests(child):
+            yield test
+
+
+def _all_suites(suite):
+    yield suite
+    for child in suite.suites:
+        for descendant in _all_suites(child):
+            yield descendant
+
+
 class TestBuildingFromXmlStringAndHandlingMissingInformation(unittest.TestCase):
 
     def setUp(self):
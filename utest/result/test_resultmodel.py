@@ -3,6 +3,7 @@ from robot.utils.asserts import (assert_equal, assert_false, assert_raises,
                                  assert_raises_with_msg, assert_true)
 
 from robot.result import Message, Keyword, TestCase, TestSuite
+from robot.utils import get_elapsed_time
 
 
 class TestSuiteStats(unittest.TestCase):
@@ -121,6 +122,28 @@ class TestElapsedTime(unittest.TestCase):
         suite = TestSuite()
         assert_equal(suite.elapsedtime, 0)
 
+    def test_elapsed_time_with_monotonic_clock(self):
+        for item in TestSuite(), TestCase(), Keyword():
+            assert_equal(item.elapsed_ns, None)
+            item.start_timer()
+            assert_equal(item.elapsed_ns, None)
+            item.end_timer()
+            assert_true(item.elapsed_ns >= 0)
+            assert_true(item.elapsedtime >= 0)
+            assert_true(item.starttime <= item.endtime)
+            assert_equal(item.elapsedtime,
+                         get_elapsed_time(item.starttime, item.endtime))
+
+    def test_setting_timestamp_overrides_monotonic_time(self):
+        kw = Keyword()
+        kw.start_timer()
+        kw.end_timer()
+        kw.starttime = '20010101 10:00:00.000'
+        kw.endtime = '20010101 10:00:01.234'
+        assert_equal(kw.elapsed_ns, None)
+        assert_equal(kw.elapsedtime, 1234)
+        assert_equal(kw.copy().starttime, '20010101 10:00:00.000')
+
     def _test_suite_elapsed_time_is_test_time(self):
         suite = TestSuite()
         suite.tests.create(starttime='19991212 12:00:00.010',
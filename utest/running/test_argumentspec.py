@@ -3,8 +3,13 @@
 import unittest
 from enum import Enum
 
+from robot.errors import DataError
+from robot.running.arguments.argumentresolver import (ArgumentResolver,
+                                                      PositionalCallCache)
 from robot.running.arguments.argumentspec import ArgumentSpec, ArgInfo
-from robot.utils.asserts import assert_equal
+from robot.utils.asserts import (assert_equal, assert_false, assert_raises,
+                                 assert_raises_with_msg, assert_true)
+from robot.variables import Variables
 from robot.utils import unicode
 
 
@@ -178,5 +183,93 @@ class TestArgInfo(unittest.TestCase):
             assert_equal(ArgInfo(kind).required, False)
 
 
+class TestArgumentConversion(unittest.TestCase):
+
+    def _spec(self, types=None, defaults=None):
+        return ArgumentSpec(positional_or_named=['a', 'b'], var_positional='c',
+                            named_only=['d'], var_named='e', types=types,
+                            defaults=defaults or {'b': 'x', 'd': 'y'})
+
+    def test_conversion(self):
+        spec = self._spec(types={'a': int, 'c': float, 'd': bool, 'e': int},
+                          defaults={'b': 1.5, 'd': False})
+        assert_equal(spec.resolve(['1', '2', '3', 'd=yes', 'x=4'], Variables()),
+                     ([1, 2.0, 3.0], [('d', True), ('x', 4)]))
+
+    def test_converter_is_reused(self):
+        spec = self._spec(types={'a': int})
+        spec.resolve(['1'], Variables())
+        converter = spec._get_converter(dry_run=False)
+        spec.resolve(['2'], Variables())
+        assert_true(spec._get_converter(dry_run=False) is converter)
+        assert_true(spec._get_converter(dry_run=True) is not converter)
+
+    def test_setting_types_recreates_converter(self):
+        spec = self._spec(types={'a': int})
+        assert_equal(spec.resolve(['1'], Variables()), ([1], []))
+        spec.types = {'a': float}
+        assert_equal(spec.resolve(['1'], Variables()), ([1.0], []))
+
+    def test_dry_run_does_not_convert_variables(self):
+        spec = self._spec(types={'a': int, 'b': int})
+        assert_equal(spec.resolve(['${x}', '2'], variables=None),
+                     (['${x}', 2], []))
+
+    def test_no_conversion(self):
+        spec = self._spec()
+        args = ['1', '2', 'd=3', 'e=4']
+        assert_equal(spec.resolve(args, Variables()),
+                     (['1', '2'], [('d', '3'), ('e', '4')]))
+
+
+class TestPositionalCalls(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = ArgumentSpec('kw', positional_or_named=['a', 'b', 'c'],
+                                 defaults={'c': 'x'})
+        self.variables = Variables()
+        self.variables['${v}'] = 'value'
+        self.variables['@{list}'] = ['1', '2']
+
+    def test_positional_calls(self):
+        calls = PositionalCallCache(self.spec)
+        assert_true(('1', '2') in calls)
+        assert_true(('1', '${v}', '\\=') in calls)
+        assert_true((1, object()) in calls)
+
+    def test_non_positional_calls(self):
+        calls = PositionalCallCache(self.spec)
+        for args in [('1',), ('1', '2', '3', '4'), ('1', 'c=2'),
+                     ('1', 'x=2'), ('@{list}',), ('1', '&{dict}'),
+                     ['1', '2'], ('1', ['unhashable'])]:
+            assert_false(args in calls, args)
+
+    def test_named_only_without_default(self):
+        spec = ArgumentSpec(positional_or_named=['a'], named_only=['b'])
+        assert_false(('1',) in PositionalCallCache(spec))
+        spec.defaults = {'b': 2}
+        assert_true(('1',) in PositionalCallCache(spec))
+
+    def test_result_is_same_as_with_full_resolution(self):
+        resolver = ArgumentResolver(self.spec)
+        for args in [('1', '2'), ('${v}', 'x${v}x', '\\${v}'),
+                     ('@{list}', '3'), ('a=1', 'b=2')]:
+            assert_equal(self.spec.resolve(args, self.variables),
+                         resolver.resolve(args, self.variables))
+
+    def test_errors_are_same_as_with_full_resolution(self):
+        assert_raises_with_msg(DataError, "Keyword 'kw' expected 2 to 3 "
+                                          "arguments, got 1.",
+                               self.spec.resolve, ('1',), self.variables)
+        assert_raises(DataError, self.spec.resolve, ('${nonex}', '2'),
+                      self.variables)
+
+    def test_cache_size_is_limited(self):
+        calls = PositionalCallCache(self.spec)
+        for i in range(calls._max_size + 10):
+            assert_true(('1', str(i)) in calls)
+        assert_equal(len(calls._cache), calls._max_size)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from robot.running.context import Asynchronous
+from robot.utils import PY2
+from robot.utils.asserts import (assert_equal, assert_false, assert_raises,
+                                 assert_true)
+
+if not PY2:
+    import asyncio
+    exec('''
+async def coroutine(value, fail=False):
+    await asyncio.sleep(0)
+    if fail:
+        raise ValueError(value)
+    return value
+
+async def is_loop_required_inside_loop(asynchronous):
+    coro = coroutine(1)
+    try:
+        return asynchronous.is_loop_required(coro)
+    finally:
+        coro.close()
+''')
+
+
+@unittest.skipIf(PY2, 'asyncio is not available on Python 2')
+class TestAsynchronous(unittest.TestCase):
+
+    def setUp(self):
+        self.asynchronous = Asynchronous()
+
+    def tearDown(self):
+        self.asynchronous.close_loop()
+
+    def test_run_until_complete(self):
+        assert_equal(self.asynchronous.run_until_complete(coroutine(42)), 42)
+
+    def test_loop_is_reused(self):
+        loop = self.asynchronous.event_loop
+        self.asynchronous.run_until_complete(coroutine(1))
+        self.asynchronous.run_until_complete(coroutine(2))
+        assert_true(self.asynchronous.event_loop is loop)
+        assert_false(loop.is_closed())
+
+    def test_failure(self):
+        assert_raises(ValueError, self.asynchronous.run_until_complete,
+                      coroutine('xxx', fail=True))
+
+    def test_is_loop_required(self):
+        coro = coroutine(1)
+        assert_true(self.asynchronous.is_loop_required(coro))
+        assert_false(self.asynchronous.is_loop_required(1))
+        assert_false(self.asynchronous.is_loop_required(coroutine))
+        coro.close()
+
+    def test_loop_is_not_required_when_already_running(self):
+        coro = is_loop_required_inside_loop(self.asynchronous)
+        assert_false(self.asynchronous.run_until_complete(coro))
+
+    def test_close_loop_cancels_pending_tasks(self):
+        loop = self.asynchronous.event_loop
+        task = loop.create_task(asyncio.sleep(10))
+        self.asynchronous.close_loop()
+        assert_true(task.cancelled())
+        assert_true(loop.is_closed())
+        assert_false(self.asynchronous.event_loop is loop)
+
+    def test_close_loop_without_loop(self):
+        self.asynchronous.close_loop()
+
+
+if __name__ == '__main__':
+    unittest.main()
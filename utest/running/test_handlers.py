@@ -33,6 +33,7 @@ def _get_java_handler_methods(lib):
 
 
 class LibraryMock(object):
+    information = {}
 
     def __init__(self, name='MyLibrary', scope='GLOBAL'):
         self.name = self.orig_name = name
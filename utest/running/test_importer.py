@@ -1,11 +1,14 @@
 import unittest
 import os
+import tempfile
 from os.path import abspath, join
 
-from robot.running.importer import ImportCache
+from robot.output import LOGGER
+from robot.running.importer import ImportCache, Importer
 from robot.errors import FrameworkError
 from robot.utils.asserts import assert_equal, assert_true, assert_raises
 from robot.utils import normpath
+from robot.variables import Variables
 
 
 class TestImportCache(unittest.TestCase):
@@ -69,5 +72,76 @@ class TestImportCache(unittest.TestCase):
         assert_equal(cache._keys[0], path)
 
 
+class MessageCollector(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def message(self, msg):
+        if msg.level == 'ERROR':
+            self.messages.append(msg.message)
+
+
+class TestImporter(unittest.TestCase):
+
+    def setUp(self):
+        self.importer = Importer()
+        self.variables = Variables()
+
+    def _import_library(self, name, *args):
+        return self.importer.import_library(name, args, None, self.variables)
+
+    def test_library_imported_by_name_is_got_from_cache(self):
+        lib = self._import_library('ParameterLibrary', 'example', '42')
+        assert_true(self._import_library('ParameterLibrary',
+                                         'example', '42') is lib)
+        assert_true(self._import_library('ParameterLibrary',
+                                         'example', '43') is not lib)
+        assert_equal(lib.positional_args, ['example', '42'])
+
+    def test_library_with_variables_in_arguments(self):
+        self.variables['${PORT}'] = '42'
+        lib = self._import_library('ParameterLibrary', 'example', '${PORT}')
+        assert_equal(lib.positional_args, ['example', '42'])
+        assert_true(self._import_library('ParameterLibrary',
+                                         'example', '42') is lib)
+        self.variables['${PORT}'] = '43'
+        other = self._import_library('ParameterLibrary', 'example', '${PORT}')
+        assert_equal(other.positional_args, ['example', '43'])
+
+    def test_resource_keywords_are_shared(self):
+        path = self._create_resource('*** Keywords ***\nKeyword\n    No Op\n')
+        resource = self.importer.import_resource(path)
+        library = self.importer.import_user_library(resource)
+        assert_true('Keyword' in library.handlers)
+        assert_true(self.importer.import_user_library(resource) is library)
+
+    def test_errors_in_shared_resource_keywords_are_logged_every_time(self):
+        path = self._create_resource('*** Keywords ***\n'
+                                     'Keyword\n    No Op\n'
+                                     'Keyword\n    No Op\n')
+        resource = self.importer.import_resource(path)
+        collector = MessageCollector()
+        LOGGER.register_logger(collector)
+        try:
+            self.importer.import_user_library(resource)
+            self.importer.import_user_library(resource)
+        finally:
+            LOGGER.unregister_logger(collector)
+        error = ("Error in resource file '%s': Creating keyword 'Keyword' "
+                 "failed: Keyword with same name defined multiple times."
+                 % path)
+        assert_equal([msg for msg in collector.messages if path in msg],
+                     [error, error])
+
+    def _create_resource(self, content):
+        fd, path = tempfile.mkstemp(suffix='.resource')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,16 +1,21 @@
+import copy
 import os.path
 import re
 import sys
 import unittest
 
+from robot.running.context import Asynchronous
+from robot.running.handlers import LazyHandler
+from robot.running.libraryscopes import InstancePool
 from robot.running.testlibraries import (TestLibrary, _ClassLibrary,
                                          _ModuleLibrary, _DynamicLibrary)
 from robot.utils.asserts import *
-from robot.utils import normalize, JYTHON, PY2
+from robot.utils import normalize, unicode, JYTHON, PY2
 from robot.errors import DataError
 
 from classes import (NameLibrary, DocLibrary, ArgInfoLibrary, GetattrLibrary,
                      SynonymLibrary, __file__ as classes_source)
+from libraryscope import Pooled
 if JYTHON:
     import ArgumentTypes, Extended, MultipleArguments, MultipleSignatures, \
             NoHandlers
@@ -386,6 +391,62 @@ class TestCaseScope(_TestScopes):
             assert_true(self.lib._libinst is suite_inst)
 
 
+class TestPooledTestCaseScope(_TestScopes):
+
+    def setUp(self):
+        self.lib, _ = self._get_lib_and_instance('libraryscope.Pooled')
+        self.lib.start_suite()
+
+    def test_instances_are_reused_after_reset(self):
+        suite_inst = self.lib.get_instance()
+        self.lib.start_test()
+        assert_none(self.lib._libinst)
+        inst = self.lib.get_instance()
+        inst.register('x')
+        self.lib.end_test()
+        assert_true(self.lib._libinst is suite_inst)
+        for _ in range(3):
+            self.lib.start_test()
+            assert_true(self.lib.get_instance() is inst)
+            assert_equal(inst.registered, set())
+            inst.register('x')
+            self.lib.end_test()
+        assert_true(self.lib._libinst is suite_inst)
+        assert_false(suite_inst is inst)
+
+    def test_pool_is_bounded(self):
+        pool = InstancePool(self.lib, max_size=2)
+        instances = [Pooled() for _ in range(3)]
+        for inst in instances:
+            pool.put(inst)
+        assert_true(pool.get() is instances[1])
+        assert_true(pool.get() is instances[0])
+        assert_none(pool.get())
+
+    def test_instances_of_libraries_without_reset_are_not_pooled(self):
+        lib, _ = self._get_lib_and_instance('libraryscope.Test')
+        lib.start_suite()
+        lib.start_test()
+        inst = lib.get_instance()
+        lib.end_test()
+        lib.start_test()
+        assert_false(lib.get_instance() is inst)
+
+    def test_instance_is_not_pooled_if_reset_fails(self):
+        lib, _ = self._get_lib_and_instance('libraryscope.FailingReset')
+        lib.logger = _FakeLogger()
+        lib.start_suite()
+        lib.start_test()
+        inst = lib.get_instance()
+        lib.end_test()
+        lib.start_test()
+        assert_false(lib.get_instance() is inst)
+        assert_equal(lib.logger.messages[0],
+                     ("Error in library 'libraryscope.FailingReset': "
+                      "Resetting library instance failed: Resetting failed!",
+                      'ERROR'))
+
+
 class TestHandlers(unittest.TestCase):
 
     def test_get_handlers(self):
@@ -502,6 +563,130 @@ class TestDynamicLibrary(unittest.TestCase):
             assert_handler_args(lib.handlers[name], mina, maxa, kwargs=True)
 
 
+class TestLibraryInformation(unittest.TestCase):
+
+    def test_information_is_used_when_available(self):
+        lib = TestLibrary('classes.LibraryInformationDynamicLibrary')
+        handler = lib.handlers['One Arg']
+        assert_equal(handler.doc, 'Keyword documentation for One Arg')
+        assert_equal(list(handler.tags), ['bulk'])
+        assert_equal(handler.arguments.types, {'arg': 'int'})
+        assert_handler_args(handler, 1, 1)
+        assert_equal(lib.doc, 'Intro from information.')
+
+    def test_keyword_specific_methods_are_used_as_fallback(self):
+        lib = TestLibrary('classes.LibraryInformationDynamicLibrary')
+        handler = lib.handlers['Multiline']
+        assert_equal(handler.doc, 'Multiline\nshort doc!\n\nBody\nhere.')
+        assert_equal(list(handler.tags), [])
+        assert_equal(lib.get_instance().calls,
+                     ['get_library_information',
+                      'get_keyword_arguments Multiline',
+                      'get_keyword_documentation Multiline'])
+
+    def test_information_is_got_only_once(self):
+        lib = TestLibrary('classes.LibraryInformationDynamicLibrary',
+                          create_handlers=False)
+        lib.create_handlers(lazy=True)
+        copied = copy.copy(lib)
+        for name in 'No Arg', 'One Arg', 'Many Args':
+            assert_equal(list(copied.handlers[name].tags), ['bulk'])
+        assert_true(copied.information is lib.information)
+        assert_equal(lib.get_instance().calls, ['get_library_information'])
+
+    def test_invalid_keyword_information(self):
+        lib = TestLibrary('classes.InvalidLibraryInformationDynamicLibrary',
+                          logger=_FakeLogger())
+        assert_false('No Arg' in lib.handlers)
+        assert_equal(lib.handlers['One Arg'].doc, 'Valid')
+        assert_equal(len(lib.handlers), 6)
+        assert_true(any("Invalid 'args' information for keyword 'No Arg' "
+                        "returned by dynamic method 'get_library_information'"
+                        in message for message, _ in lib.logger.messages))
+
+    def test_invalid_library_information(self):
+        for information, error in [
+            ('invalid', 'Return value must be a dictionary, got string.'),
+            ({'No Arg': []}, "Information for keyword 'No Arg' must be "
+                             "a dictionary, got list.")
+        ]:
+            logger = _FakeLogger()
+            lib = TestLibrary('classes.InvalidLibraryInformationDynamicLibrary',
+                              args=[information], logger=logger)
+            assert_equal(lib.information, {})
+            assert_equal(len(lib.handlers), 7)
+            assert_equal(lib.handlers['One Arg'].doc,
+                         'Keyword documentation for One Arg')
+            assert_equal(logger.messages,
+                         [("Error in library 'classes."
+                           "InvalidLibraryInformationDynamicLibrary': "
+                           "Calling dynamic method 'get_library_information' "
+                           "failed: %s" % error, 'ERROR')])
+
+
+class TestLazyHandlers(unittest.TestCase):
+
+    def _library(self, name):
+        lib = TestLibrary(name, create_handlers=False)
+        lib.create_handlers(lazy=True)
+        return lib
+
+    def test_handlers_are_created_when_used(self):
+        lib = self._library('classes.ArgDocDynamicLibrary')
+        assert_true(isinstance(lib.handlers._normal['No Arg'], LazyHandler))
+        handler = lib.handlers['No Arg']
+        assert_false(isinstance(handler, LazyHandler))
+        assert_equal(handler.doc, 'Keyword documentation for No Arg')
+        assert_handler_args(handler, 0, 0)
+        assert_true(lib.handlers['No Arg'] is handler)
+        assert_true(isinstance(lib.handlers._normal['One Arg'], LazyHandler))
+
+    def test_same_handlers_as_when_created_eagerly(self):
+        for name in ['classes.NameLibrary', 'classes.ArgInfoLibrary',
+                     'classes.ArgDocDynamicLibrary', 'RunKeywordLibrary']:
+            eager = TestLibrary(name).handlers
+            lazy = self._library(name).handlers
+            assert_equal(len(lazy), len(eager))
+            assert_equal([(h.name, h.doc, unicode(h.arguments)) for h in lazy],
+                         [(h.name, h.doc, unicode(h.arguments)) for h in eager])
+
+    def test_invalid_handlers_are_removed_when_used(self):
+        lib = self._library('classes.InvalidGetArgsDynamicLibrary')
+        assert_equal(len(lib.handlers), 7)
+        assert_false('No Arg' in lib.handlers)
+        assert_equal(len(lib.handlers), 6)
+        assert_equal(list(lib.handlers), [])
+        assert_equal(len(lib.handlers), 0)
+
+    def test_warning_when_last_handler_is_removed(self):
+        logger = _FakeLogger()
+        lib = TestLibrary('classes.InvalidGetDocDynamicLibrary',
+                          create_handlers=False, logger=logger)
+        lib.create_handlers(lazy=True)
+        assert_false('No Arg' in lib.handlers)
+        warning = ("Imported library 'classes.InvalidGetDocDynamicLibrary' "
+                   "contains no keywords.", 'WARN')
+        assert_true(warning not in logger.messages)
+        list(lib.handlers)
+        assert_equal(logger.messages[-1], warning)
+        assert_equal(logger.messages.count(warning), 1)
+
+    def test_embedded_arguments_handlers_are_created_immediately(self):
+        lib = self._library('GetKeywordNamesLibrary')
+        assert_true(lib.handlers._embedded)
+        assert_false(any(isinstance(h, LazyHandler)
+                         for h in lib.handlers._embedded))
+
+    def test_global_handlers_are_created_only_once(self):
+        lib = self._library('classes.RecordingLibrary')
+        instance = lib._libinst
+        for _ in range(5):
+            lib.handlers.create_runner('kw')._run(_FakeContext(), [])
+        assert_true(lib._libinst is instance)
+        assert_equal(instance.kw_accessed, 1)
+        assert_equal(instance.kw_called, 5)
+
+
 def assert_handler_args(handler, minargs=0, maxargs=0, kwargs=False):
     assert_equal(handler.arguments.minargs, minargs)
     assert_equal(handler.arguments.maxargs, maxargs)
@@ -654,6 +839,19 @@ class TestSourceAndLineno(unittest.TestCase):
         assert_equal(lib.lineno, lineno)
 
 
+class _FakeLogger:
+    def __init__(self):
+        self.messages = []
+    def write(self, message, level):
+        self.messages.append((message, level))
+    def info(self, message):
+        self.write(message, 'INFO')
+    def warn(self, message):
+        self.write(message, 'WARN')
+    def debug(self, message):
+        pass
+
+
 class _FakeNamespace:
     def __init__(self):
         self.variables = _FakeVariableScope()
@@ -700,6 +898,7 @@ class _FakeContext:
         self.variables = _FakeVariableScope()
         self.timeouts = set()
         self.test = None
+        self.asynchronous = Asynchronous()
 
 
 if __name__ == '__main__':
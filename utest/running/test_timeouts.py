@@ -1,10 +1,12 @@
 import unittest
+import signal
 import sys
+import threading
 import time
 import os
 
 from robot.errors import TimeoutError
-from robot.running.timeouts import TestTimeout, KeywordTimeout
+from robot.running.timeouts import TestTimeout, KeywordTimeout, Timeout
 from robot.utils.asserts import (assert_equal, assert_false, assert_true,
                                  assert_raises, assert_raises_with_msg)
 from robot.utils import JYTHON
@@ -13,6 +15,8 @@ from robot.utils import JYTHON
 sys.path.append(os.path.join(os.path.dirname(__file__),'..','utils'))
 from thread_resources import passing, failing, sleeping, returning, MyException
 
+SCHEDULER = Timeout.__module__.endswith('.scheduler')
+
 
 class VariableMock(object):
 
@@ -157,6 +161,94 @@ class TestRun(unittest.TestCase):
             assert_raises(TimeoutError, self.tout.run, sleeping, (10,))
 
 
+class TestNestedAndThreadedRun(unittest.TestCase):
+
+    def _timeout(self, secs, cls=KeywordTimeout):
+        tout = cls(secs, variables=VariableMock())
+        tout.start()
+        return tout
+
+    def test_inner_timeout_exceeded(self):
+        outer = self._timeout('10s', TestTimeout)
+        inner = self._timeout('10ms')
+        assert_raises_with_msg(TimeoutError, 'Keyword timeout 10 milliseconds exceeded.',
+                               outer.run, inner.run, (sleeping, (5,)))
+
+    @unittest.skipIf(not SCHEDULER, 'Timeout scheduler not used')
+    def test_outer_timeout_exceeded(self):
+        outer = self._timeout('10ms', TestTimeout)
+        inner = self._timeout('10s')
+        assert_raises_with_msg(TimeoutError, 'Test timeout 10 milliseconds exceeded.',
+                               outer.run, inner.run, (sleeping, (5,)))
+
+    def test_blocking_call_is_interrupted(self):
+        tout = self._timeout('10ms')
+        start = time.time()
+        assert_raises(TimeoutError, tout.run, time.sleep, (5,))
+        assert_true(time.time() - start < 4)
+
+    @unittest.skipIf(not SCHEDULER, 'Timeout scheduler not used')
+    def test_run_in_worker_thread(self):
+        results = []
+
+        def run():
+            tout = self._timeout('10ms')
+            try:
+                tout.run(sleeping, (5,))
+            except TimeoutError as err:
+                results.append(str(err))
+            results.append(self._timeout('1s').run(returning, ('x',)))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        assert_equal(results, ['Keyword timeout 10 milliseconds exceeded.', 'x'])
+
+
+@unittest.skipIf(not SCHEDULER, 'Timeout scheduler not used')
+class TestScheduler(unittest.TestCase):
+
+    def _run(self, runnable, secs=0.05):
+        return Timeout(secs, TimeoutError('timeout')).execute(runnable)
+
+    @unittest.skipIf(not hasattr(signal, 'pthread_kill'), 'No pthread_kill')
+    def test_signal_handler_is_restored(self):
+        handler = lambda signum, frame: None
+        original = signal.signal(signal.SIGALRM, handler)
+        try:
+            during = self._run(lambda: signal.getsignal(signal.SIGALRM))
+            assert_true(during is not handler)
+            assert_true(signal.getsignal(signal.SIGALRM) is handler)
+            assert_raises(TimeoutError, self._run, lambda: time.sleep(5))
+            assert_true(signal.getsignal(signal.SIGALRM) is handler)
+        finally:
+            signal.signal(signal.SIGALRM, original)
+
+    @unittest.skipIf(not hasattr(signal, 'pthread_kill'), 'No pthread_kill')
+    def test_signal_handler_is_restored_after_nested_timeouts(self):
+        original = signal.getsignal(signal.SIGALRM)
+        inner = lambda: self._run(lambda: signal.getsignal(signal.SIGALRM))
+        outer = self._run(lambda: (inner(), signal.getsignal(signal.SIGALRM)),
+                          secs=10)
+        assert_equal(outer[0], outer[1])
+        assert_true(outer[1] is not original)
+        assert_true(signal.getsignal(signal.SIGALRM) is original)
+
+    def test_wall_clock_changes_do_not_affect_deadlines(self):
+        real_time = time.time
+
+        def sleep_after_clock_is_set_back():
+            time.time = lambda: real_time() - 3600
+            sleeping(5)
+
+        start = real_time()
+        try:
+            assert_raises(TimeoutError, self._run, sleep_after_clock_is_set_back)
+        finally:
+            time.time = real_time
+        assert_true(real_time() - start < 4)
+
+
 class TestMessage(unittest.TestCase):
 
     def test_non_active(self):
@@ -23,6 +23,12 @@ class TestCompress(unittest.TestCase):
         self._test(u'hyv\xe4')
         self._test(u'\u4e2d\u6587')
 
+    def test_compression_level(self):
+        text = 'Hello, world! ' * 100
+        for level in range(10):
+            assert_equal(_compress(text.encode('UTF-8'), level),
+                         zlib.compress(text.encode('UTF-8'), level))
+
 
 if __name__ == '__main__':
     unittest.main()
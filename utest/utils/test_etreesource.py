@@ -1,4 +1,7 @@
+import gzip
 import os
+import shutil
+import tempfile
 import unittest
 
 from robot.utils.asserts import assert_equal, assert_true
@@ -33,11 +36,25 @@ class TestETSource(unittest.TestCase):
             expected = PATH if PY_VERSION < (3, 6) else pathlib.Path(PATH)
             self._test_path(pathlib.Path(PATH), PATH, expected)
 
+    def test_compressed_path(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'output.xml.gz')
+        try:
+            with gzip.open(path, 'wb') as f:
+                f.write(b'<tag>content</tag>')
+            source = ETSource(path)
+            with source as src:
+                assert_equal(ET.parse(src).getroot().text, 'content')
+            self._verify_string_representation(source, path)
+            assert_true(source._opened.closed)
+        finally:
+            shutil.rmtree(directory)
+
     def test_opened_file_object(self):
         with open(PATH) as f:
             source = ETSource(f)
             with source as src:
-                assert_true(src.read().startswith('import os'))
+                assert_true(src.read().startswith('import gzip'))
                 assert_true(src is f)
             assert_true(src.closed is False)
             self._verify_string_representation(source, PATH)
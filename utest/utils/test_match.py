@@ -1,6 +1,9 @@
+import re
 import unittest
 
-from robot.utils import eq, Matcher, MultiMatcher, IRONPYTHON, PY2
+from robot.utils import (compile_pattern, eq, get_matcher, Matcher,
+                         MultiMatcher, IRONPYTHON, PY2)
+from robot.utils.match import _LRUCache
 from robot.utils.asserts import assert_equal, assert_raises
 
 
@@ -155,6 +158,17 @@ class TestMatcher(unittest.TestCase):
         assert matcher.match("'12345678901234567890'")
         assert not matcher.match("'xxx'")
 
+    def test_filter(self):
+        strings = ['Hello', 'world', 'h e l l o', 'hillo', 'Hell']
+        assert_equal(Matcher('H?llo').filter(strings),
+                     ['Hello', 'h e l l o', 'hillo'])
+        assert_equal(Matcher('H?llo', caseless=False, spaceless=False)
+                     .filter(iter(strings)), ['Hello'])
+        assert_equal(Matcher('h.llo', spaceless=False, regexp=True)
+                     .filter(strings), ['Hello', 'hillo'])
+        assert_equal(Matcher('x').filter(strings), [])
+        assert_equal(Matcher('x').filter([]), [])
+
     def _matches(self, string, pattern, **config):
         assert Matcher(pattern, **config).match(string), pattern
 
@@ -162,6 +176,43 @@ class TestMatcher(unittest.TestCase):
         assert not Matcher(pattern, **config).match(string), pattern
 
 
+class TestCaching(unittest.TestCase):
+
+    def test_get_matcher(self):
+        matcher = get_matcher('f*', ignore='_')
+        assert matcher.match('F_O_O')
+        assert get_matcher('f*', ignore=['_']) is matcher
+        assert get_matcher('f*') is not matcher
+        assert get_matcher('f*', ignore='_', caseless=False) is not matcher
+        assert get_matcher('f*', ignore='_', regexp=True) is not matcher
+
+    def test_get_matcher_with_invalid_pattern(self):
+        if not PY2:
+            assert_raises(TypeError, get_matcher, b'foo')
+
+    def test_compile_pattern(self):
+        glob = compile_pattern('f?o*')
+        assert glob.match('foobar')
+        assert not glob.match('xfoo')
+        assert compile_pattern('f?o*') is glob
+        regexp = compile_pattern('f?o*', regexp=True)
+        assert regexp is not glob
+        assert regexp.match('oo')
+        assert compile_pattern('f?o*', regexp=True, flags=re.I) is not regexp
+
+    def test_lru_cache(self):
+        cache = _LRUCache(size=2)
+        assert_equal(cache.get('a', lambda: 1), 1)
+        assert_equal(cache.get('b', lambda: 2), 2)
+        assert_equal(cache.get('a', lambda: 0), 1)
+        assert_equal(cache.get('c', lambda: 3), 3)
+        assert_equal(len(cache), 2)
+        assert_equal(cache.get('b', lambda: 0), 0)
+        assert_equal(cache.get('c', lambda: 0), 3)
+        cache.clear()
+        assert_equal(len(cache), 0)
+
+
 class TestMultiMatcher(unittest.TestCase):
 
     def test_match_pattern(self):
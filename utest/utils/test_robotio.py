@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from robot.utils import PY3, compressed_file_reader, file_writer
+from robot.utils.asserts import assert_equal, assert_true
+
+EXTENSIONS = ['.gz'] + (['.bz2', '.xz'] if PY3 else [])
+
+
+class TestCompressedFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, name, content=u'<robot>hyv\xe4</robot>\n'):
+        path = os.path.join(self.directory, name)
+        with file_writer(path) as writer:
+            writer.write(content)
+        return path
+
+    def test_write_and_read(self):
+        for ext in EXTENSIONS:
+            path = self._write('output.xml' + ext)
+            with open(path, 'rb') as f:
+                assert_true(not f.read().startswith(b'<robot>'))
+            with compressed_file_reader(path) as reader:
+                assert_equal(reader.read().decode('UTF-8'),
+                             u'<robot>hyv\xe4</robot>\n')
+
+    def test_extension_is_case_insensitive(self):
+        path = self._write('output.xml.GZ')
+        with compressed_file_reader(path) as reader:
+            assert_equal(reader.read(), b'<robot>hyv\xc3\xa4</robot>\n')
+
+    def test_compression_is_detected_from_content(self):
+        path = self._write('output.xml.gz')
+        renamed = os.path.join(self.directory, 'output.xml')
+        os.rename(path, renamed)
+        with compressed_file_reader(renamed) as reader:
+            assert_equal(reader.read(), b'<robot>hyv\xc3\xa4</robot>\n')
+
+    def test_plain_file(self):
+        path = self._write('output.xml')
+        with open(path, 'rb') as f:
+            assert_equal(f.read(), b'<robot>hyv\xc3\xa4</robot>\n')
+        assert_equal(compressed_file_reader(path), None)
+
+    def test_non_existing_file(self):
+        path = os.path.join(self.directory, 'nonex.xml.gz')
+        assert_equal(compressed_file_reader(path), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,8 @@ from robot.utils.asserts import (assert_equal, assert_raises_with_msg,
 from robot.utils.robottime import (timestr_to_secs, secs_to_timestr, get_time,
                                    parse_time, format_time, get_elapsed_time,
                                    get_timestamp, timestamp_to_secs,
-                                   elapsed_time_to_string, _get_timetuple)
+                                   elapsed_time_to_string, _get_timetuple,
+                                   MonotonicClock)
 
 
 EXAMPLE_TIME = time.mktime(datetime.datetime(2007, 9, 20, 16, 15, 14).timetuple())
@@ -352,5 +353,41 @@ class TestTime(unittest.TestCase):
         assert_true(re.match('\d{8} \d\d:\d\d:\d\d', get_timestamp(millissep=None)))
 
 
+class TestMonotonicClock(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = MonotonicClock()
+        self.clock._anchor_millis = EXAMPLE_TIME * 1000
+        self.clock._start = 0
+
+    def test_now(self):
+        clock = MonotonicClock()
+        start = clock.now()
+        assert_true(isinstance(start, int))
+        assert_true(clock.now() >= start)
+        assert_true(abs(clock.epoch() - time.time()) < 1)
+
+    def test_epoch(self):
+        assert_equal(self.clock.epoch(0), EXAMPLE_TIME)
+        assert_equal(self.clock.epoch(1500000000), EXAMPLE_TIME + 1.5)
+        assert_equal(self.clock.epoch_millis(1500000000),
+                     int(EXAMPLE_TIME) * 1000 + 1500)
+        assert_equal(self.clock.epoch_millis(1499000), int(EXAMPLE_TIME) * 1000 + 1)
+
+    def test_timestamp(self):
+        assert_equal(self.clock.timestamp(0), '20070920 16:15:14.000')
+        assert_equal(self.clock.timestamp(123456789), '20070920 16:15:14.123')
+        assert_equal(self.clock.timestamp(999999999), '20070920 16:15:15.000')
+        assert_equal(self.clock.timestamp(1000000, '-', 'T', '', None),
+                     '2007-09-20T161514')
+
+    def test_elapsed_millis_matches_timestamps(self):
+        for start, end in [(0, 0), (0, 1000000), (400000, 600000),
+                           (1499999, 3500001), (999999999, 61000000000)]:
+            expected = get_elapsed_time(self.clock.timestamp(start),
+                                        self.clock.timestamp(end))
+            assert_equal(self.clock.elapsed_millis(start, end), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,10 +5,10 @@ from os.path import abspath
 from robot.utils.asserts import assert_equal, assert_true
 from robot.utils import IRONPYTHON, PY2
 from robot.utils.text import (
-    cut_long_message, get_console_length, getdoc, getshortdoc,
-    pad_console_length, split_tags_from_doc, split_args_from_name_or_path,
-    _count_line_lengths, MAX_ERROR_LINES, _MAX_ERROR_LINE_LENGTH,
-    _ERROR_CUT_EXPLN
+    cut_long_message, format_assign_message, get_console_length, getdoc,
+    getshortdoc, max_error_length, pad_console_length, split_tags_from_doc,
+    split_args_from_name_or_path, _count_line_lengths, MAX_ERROR_LINES,
+    _MAX_ASSIGN_LENGTH, _MAX_ERROR_LINE_LENGTH, _ERROR_CUT_EXPLN
 )
 
 
@@ -144,6 +144,46 @@ class TestCountLines(unittest.TestCase):
         assert_equal(_count_line_lengths(lines), [1, 1, 2, 2, 2, 3, 7, 7, 8])
 
 
+class TestMaxErrorLength(unittest.TestCase):
+
+    def test_max_error_length(self):
+        assert_equal(max_error_length(),
+                     MAX_ERROR_LINES * _MAX_ERROR_LINE_LENGTH)
+
+    def test_no_limit(self):
+        from robot.utils import text
+        text.MAX_ERROR_LINES = None
+        try:
+            assert_equal(max_error_length(), None)
+        finally:
+            text.MAX_ERROR_LINES = MAX_ERROR_LINES
+
+
+class TestFormatAssignMessage(unittest.TestCase):
+
+    def test_short_values(self):
+        assert_equal(format_assign_message('${x}', 'value'), '${x} = value')
+        assert_equal(format_assign_message('@{x}', []), '@{x} = [ ]')
+        assert_equal(format_assign_message('@{x}', ['a', 1]), '@{x} = [ a | 1 ]')
+        assert_equal(format_assign_message('&{x}', {}), '&{x} = { }')
+        assert_equal(format_assign_message('&{x}', {'a': 1}), '&{x} = { a=1 }')
+
+    def test_long_values_are_cut(self):
+        for variable, value, full in [
+            ('${x}', 'x' * 1000, 'x' * 1000),
+            ('${x}', list(range(1000)), str(list(range(1000)))),
+            ('@{x}', list(range(1000)),
+             '[ %s ]' % ' | '.join(str(i) for i in range(1000))),
+            ('@{x}', ['x' * 1000, 'y'], '[ %s | y ]' % ('x' * 1000)),
+            ('&{x}', dict((i, i) for i in range(1000)),
+             '{ %s }' % ' | '.join('%d=%d' % (i, i) for i in range(1000)))
+        ]:
+            expected = '%s = %s...' % (variable, full[:_MAX_ASSIGN_LENGTH])
+            assert_equal(format_assign_message(variable, value), expected)
+            assert_equal(format_assign_message(variable, value, cut_long=False),
+                         '%s = %s' % (variable, full))
+
+
 class TestConsoleWidth(unittest.TestCase):
     len16_asian = u'\u6c49\u5b57\u5e94\u8be5\u6b63\u786e\u5bf9\u9f50'
     ten_normal = u'1234567890'
@@ -1,7 +1,8 @@
 import unittest
 import re
 
-from robot.utils import unic, unicode, prepr, DotDict, JYTHON, IRONPYTHON, PY3
+from robot.utils import (cut_unic, unic, unicode, prepr, DotDict, JYTHON,
+                         IRONPYTHON, PY3)
 from robot.utils.asserts import assert_equal, assert_true
 
 
@@ -184,6 +185,72 @@ class TestPrettyRepr(unittest.TestCase):
         self._verify(bytearray(b' '.join([b'Hello world!'] * 1000)))
 
 
+class TestCutting(unittest.TestCase):
+
+    def test_short_values_are_not_cut(self):
+        for item in [u'foo', b'bar', 42, [1, 2], {'a': 1}, (1,), None]:
+            assert_equal(cut_unic(item, 10), unic(item))
+            assert_equal(prepr(item, max_length=10), prepr(item))
+
+    def test_no_limit(self):
+        item = u'x' * 1000
+        assert_equal(cut_unic(item), item)
+        assert_equal(cut_unic(item, None), item)
+        assert_equal(prepr(item, max_length=None), prepr(item))
+
+    def test_cut_strings(self):
+        assert_equal(cut_unic(u'x' * 100, 10), u'x' * 10 + '...')
+        assert_equal(cut_unic(b'x' * 100, 10), u'x' * 10 + '...')
+        assert_equal(prepr(u'x' * 100, max_length=10), "'" + u'x' * 9 + '...')
+        assert_equal(prepr(b'x' * 100, max_length=10), "b'" + u'x' * 8 + '...')
+
+    def test_cut_containers(self):
+        assert_equal(cut_unic(list(range(100)), 10), '[0, 1, 2, ...')
+        assert_equal(prepr(list(range(100)), max_length=10), '[0, 1, 2, ...')
+        assert_equal(prepr((u'x' * 100,), max_length=10), "('xxxxxxxx...")
+        assert_equal(prepr({u'a': [1, 2, 3, 4, 5]}, max_length=10),
+                     "{'a': [1, ...")
+        assert_equal(prepr(set(u'x' * 100), max_length=5),
+                     "{'x'}" if PY3 else "set([...")
+
+    def test_cut_containers_match_uncut_format(self):
+        items = [{u'b': 1, u'a': [1, 2, 3, 4, 5], u'c': (u'x',)},
+                 [{u'z': 1, u'y': 2}] * 10,
+                 set(u'abcdefghijklmnopqrstuvwxyz'),
+                 frozenset(range(100)),
+                 {u'k': frozenset([3, 2, 1]), u'j': set([u'b', u'a'])}]
+        for item in items:
+            # Formatting on multiple lines guarantees sorted sets also on Py3.
+            uncut = re.sub(r',\n\s*', ', ', prepr(item, width=1))
+            for length in range(1, len(uncut)):
+                assert_equal(prepr(item, max_length=length),
+                             uncut[:length] + '...')
+
+    def test_huge_containers_are_not_formatted_fully(self):
+        class Counting(object):
+            count = 0
+            def __repr__(self):
+                Counting.count += 1
+                return 'c'
+        items = [Counting() for _ in range(1000)]
+        assert_equal(prepr(items, max_length=20), '[c, c, c, c, c, c, c...')
+        assert_equal(cut_unic(items, 20), '[c, c, c, c, c, c, c...')
+        assert_true(Counting.count < 30)
+
+    def test_other_objects(self):
+        class Long(object):
+            def __str__(self):
+                return 'long value'
+        assert_equal(cut_unic(Long(), 4), 'long...')
+        assert_equal(prepr(ReprFails(), max_length=5), '<Unre...')
+
+    def test_recursive(self):
+        x = [1, 2]
+        x.append(x)
+        assert_equal(prepr(x, max_length=10), '[1, 2, [1,...')
+        assert_true(prepr(x, max_length=1000).startswith('[1, 2, <Recursion'))
+
+
 class UnRepr(object):
     error = 'This, of course, should never happen...'
 
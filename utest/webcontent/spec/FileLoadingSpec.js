@@ -0,0 +1,59 @@
+describe("Loading keywords from data blocks with --lazylog", function () {
+
+    // Stored already here because other specs replace this function.
+    var getCallbackHandlerForKeywords = window.fileLoading.getCallbackHandlerForKeywords;
+    var originalSettings;
+    var block;
+
+    beforeEach(function () {
+        originalSettings = window.settings;
+        window.settings = {lazyLog: true};
+        block = document.createElement('script');
+        block.type = 'text/x-robot-data';
+        block.id = 'robot-data-42';
+        // [[[0,1,2]],["*","*Log","*Hello"]] compressed like in log.html.
+        block.textContent = 'eNqLjo420DHUMYqN1YlW0lLSUdLyyU8HUR6pOTn5SrGxAI0BCLA=';
+        document.body.appendChild(block);
+    });
+
+    afterEach(function () {
+        block.parentNode.removeChild(block);
+        window.settings = originalSettings;
+        delete window.keywords42;
+        delete window.strings42;
+    });
+
+    it("should not load data block before children are needed", function () {
+        var parent = {childDataIndex: 42, isChildrenLoaded: false};
+        getCallbackHandlerForKeywords(parent);
+        expect(parent.isChildrenLoaded).toBeFalsy();
+        expect(window.keywords42).toBeUndefined();
+        expect(window.strings42).toBeUndefined();
+    });
+
+    it("should decompress and parse data block when children are needed", function () {
+        var parent = {childDataIndex: 42, isChildrenLoaded: false};
+        var called = false;
+        getCallbackHandlerForKeywords(parent)(function () {
+            called = true;
+        });
+        expect(called).toBeTruthy();
+        expect(parent.isChildrenLoaded).toBeTruthy();
+        expect(window.keywords42).toEqual([[0, 1, 2]]);
+        expect(window.strings42).toEqual(["*", "*Log", "*Hello"]);
+    });
+
+    it("should load data block only once", function () {
+        var parent = {childDataIndex: 42, isChildrenLoaded: false};
+        var callWhenChildrenReady = getCallbackHandlerForKeywords(parent);
+        var calls = 0;
+        callWhenChildrenReady(function () {});
+        window.keywords42 = 'already loaded';
+        callWhenChildrenReady(function () {
+            calls++;
+        });
+        expect(calls).toEqual(1);
+        expect(window.keywords42).toEqual('already loaded');
+    });
+
+});
@@ -84,3 +84,22 @@ describe("Testing parseQueryString", function () {
     });
 
 });
+
+describe("Testing decompress", function () {
+    var decompress = util.decompress;
+
+    it("should decompress base64 encoded zlib data", function () {
+        expect(decompress('eNrzSM3JyddRKM8vyklRBAAgXgSK')).toEqual('Hello, world!');
+    });
+
+    it("should decode non-ASCII characters as UTF-8", function () {
+        expect(decompress('eNrzqCw7vOTwEoXKw9tKgNSjGc0AXPcKEA==')).toEqual(
+            'Hyv\u00e4\u00e4 y\u00f6t\u00e4 \u2603');
+    });
+
+    it("should decompress data blocks written with --lazylog", function () {
+        var data = decompress('eNqLjo420DHUMYqN1YlW0lLSUdLyyU8HUR6pOTn5SrGxAI0BCLA=');
+        expect(JSON.parse(data)).toEqual([[[0, 1, 2]], ["*", "*Log", "*Hello"]]);
+    });
+
+});